@@ -0,0 +1,128 @@
+package com.example.handspeak.ml
+
+import android.content.Context
+import android.util.Log
+import com.example.handspeak.util.JsonHelper
+import com.google.gson.Gson
+import com.google.gson.JsonObject
+import java.io.IOException
+
+/**
+ * CascadeClassifier - نموذج Dense الرخيص أولاً، و LSTM فقط عند الحاجة
+ *
+ * لكل إطار:
+ * 1. Dense يصنّف الإطار الحالي
+ * 2. تُعتمد نتيجة Dense إذا كانت الثقة ≥ denseThreshold، والتصنيف ليس إشارة حركية
+ *    (dynamicLabels)، وحركة النافذة < motionThreshold
+ * 3. غير ذلك → LSTM على النافذة (آخر الإطارات)
+ *
+ * الإعدادات من assets/cascade.json (train --arch cascade ثم tune_cascade.py --write-config).
+ * إذا لم يطابق ترتيب التصنيفات labels.json، أو لم يوجد نموذج Dense، يعمل LSTM على كل إطار.
+ *
+ * النسخة المرجعية وأداة اختيار الحدود: scripts/handspeak/cascade.py و scripts/tune_cascade.py
+ */
+class CascadeClassifier(
+    context: Context,
+    private val lstm: SignLanguageClassifier
+) {
+
+    companion object {
+        private const val TAG = "CascadeClassifier"
+        private const val CONFIG_FILE = "cascade.json"
+        // نفس القيم الافتراضية في scripts/handspeak/cascade.py
+        const val DEFAULT_DENSE_THRESHOLD = 0.8f
+        const val DEFAULT_MOTION_THRESHOLD = 0.06f
+
+        /**
+         * متوسط motion score بين كل إطارين متتاليين في النافذة (0 لإطار واحد)
+         */
+        fun windowMotion(window: List<FloatArray>): Float {
+            if (window.size < 2) return 0f
+            var total = 0f
+            for (i in 1 until window.size) {
+                total += MotionGate.motionScore(window[i - 1], window[i])
+            }
+            return total / (window.size - 1)
+        }
+    }
+
+    private var denseThreshold = DEFAULT_DENSE_THRESHOLD
+    private var motionThreshold = DEFAULT_MOTION_THRESHOLD
+    private var dynamicLabels: Set<String> = emptySet()
+    private val dense: SignLanguageClassifier?
+
+    var framesClassified = 0L
+        private set
+    var lstmInvocations = 0L
+        private set
+
+    /** هل يعمل الـ Cascade (وإلا LSTM لكل إطار) */
+    val isEnabled: Boolean
+        get() = dense != null
+
+    init {
+        val labels = JsonHelper.loadLabels(context)
+        var denseModel = SignLanguageClassifier.DENSE_MODEL_NAME
+        var labelsMatch = true
+        try {
+            val json = context.assets.open(CONFIG_FILE).bufferedReader().use { it.readText() }
+            val config = Gson().fromJson(json, JsonObject::class.java)
+            labelsMatch = config.getAsJsonArray("labels")?.map { it.asString } == labels
+            config.get("dense_model")?.takeIf { !it.isJsonNull }?.let { denseModel = it.asString }
+            config.get("dense_threshold")?.takeIf { !it.isJsonNull }?.let { denseThreshold = it.asFloat }
+            // null صريح → بدون شرط الحركة، والمفتاح غير موجود → القيمة الافتراضية
+            config.get("motion_threshold")?.let {
+                motionThreshold = if (it.isJsonNull) Float.POSITIVE_INFINITY else it.asFloat
+            }
+            dynamicLabels = config.getAsJsonArray("dynamic_labels")?.map { it.asString }?.toSet() ?: emptySet()
+        } catch (e: IOException) {
+            Log.w(TAG, "$CONFIG_FILE not found, using default thresholds")
+        }
+
+        dense = if (!labelsMatch) {
+            Log.e(TAG, "$CONFIG_FILE labels do not match labels.json order - retrain with: handspeak train --arch cascade")
+            null
+        } else {
+            SignLanguageClassifier(context, denseModel).let { candidate ->
+                if (candidate.isLoaded && candidate.outputSize == labels.size && lstm.outputSize == labels.size) {
+                    candidate
+                } else {
+                    Log.w(TAG, "$denseModel missing or outputs do not match ${labels.size} labels - LSTM only")
+                    candidate.close()
+                    null
+                }
+            }
+        }
+        Log.d(TAG, "Cascade enabled: $isEnabled (dense ≥ $denseThreshold, motion < $motionThreshold, " +
+                "${dynamicLabels.size} dynamic labels)")
+    }
+
+    /**
+     * تصنيف الإطار الحالي (آخر إطار في النافذة)
+     * @param window آخر الإطارات، كل إطار FloatArray[63]
+     */
+    fun classify(window: List<FloatArray>, sequenceLength: Int): Pair<String, Float>? {
+        if (window.isEmpty()) return null
+        framesClassified++
+        val frames = window.takeLast(sequenceLength)
+        val denseResult = dense?.classify(frames.last())
+        if (denseResult != null &&
+            denseResult.second >= denseThreshold &&
+            denseResult.first !in dynamicLabels &&
+            windowMotion(frames) < motionThreshold
+        ) {
+            return denseResult
+        }
+        lstmInvocations++
+        return lstm.classifySequence(frames, sequenceLength)
+    }
+
+    /** نسبة الإطارات التي احتاجت LSTM */
+    val lstmRate: Float
+        get() = if (framesClassified == 0L) 0f else lstmInvocations.toFloat() / framesClassified
+
+    fun close() {
+        Log.d(TAG, "Closing cascade: LSTM on ${(lstmRate * 100).toInt()}% of $framesClassified frames")
+        dense?.close()
+    }
+}
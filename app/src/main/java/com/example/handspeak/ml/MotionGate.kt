@@ -0,0 +1,106 @@
+package com.example.handspeak.ml
+
+import kotlin.math.sqrt
+
+/**
+ * MotionGate - تخطي التصنيف عندما تكون اليد ثابتة
+ *
+ * عندما لا تتحرك اليد، تعطي الإطارات المتتالية نفس التنبؤ تقريباً،
+ * لذلك نعيد استخدام آخر نتيجة بدل تشغيل النموذج في كل إطار.
+ *
+ * القواعد:
+ * 1. motion score = متوسط المسافة بين كل landmark في إطارين متتاليين (بعد التطبيع)
+ * 2. score < stillThreshold (والحركة المتراكمة صغيرة) → إعادة استخدام آخر نتيجة
+ * 3. score < motionThreshold → تصنيف كل coarseStride إطار فقط
+ * 4. غير ذلك → تصنيف في كل إطار
+ * 5. إجبار التصنيف بعد maxStaleness إطار مهما كانت الحركة
+ *
+ * النسخة المرجعية وأداة التقييم: scripts/motion_gate.py
+ */
+class MotionGate(
+    private val stillThreshold: Float = DEFAULT_STILL_THRESHOLD,
+    private val motionThreshold: Float = DEFAULT_MOTION_THRESHOLD,
+    private val coarseStride: Int = DEFAULT_COARSE_STRIDE,
+    private val maxStaleness: Int = DEFAULT_MAX_STALENESS
+) {
+
+    companion object {
+        // القيم مختارة عبر: python motion_gate.py --sweep
+        const val DEFAULT_STILL_THRESHOLD = 0.04f
+        const val DEFAULT_MOTION_THRESHOLD = 0.08f
+        const val DEFAULT_COARSE_STRIDE = 2
+        const val DEFAULT_MAX_STALENESS = 15
+
+        /**
+         * متوسط المسافة الإقليدية بين النقاط المتقابلة في إطارين (FloatArray[63])
+         */
+        fun motionScore(previous: FloatArray, current: FloatArray): Float {
+            val landmarks = minOf(previous.size, current.size) / 3
+            if (landmarks == 0) return Float.MAX_VALUE
+            var total = 0f
+            for (i in 0 until landmarks) {
+                val dx = current[i * 3] - previous[i * 3]
+                val dy = current[i * 3 + 1] - previous[i * 3 + 1]
+                val dz = current[i * 3 + 2] - previous[i * 3 + 2]
+                total += sqrt(dx * dx + dy * dy + dz * dz)
+            }
+            return total / landmarks
+        }
+    }
+
+    private var previousFrame: FloatArray? = null
+    private var accumulatedMotion = 0f
+    private var framesSinceInference = 0
+
+    /** آخر نتيجة تصنيف (تُعاد عندما يتم تخطي التصنيف) */
+    var lastResult: Pair<String, Float>? = null
+        private set
+
+    var framesObserved = 0L
+        private set
+    var inferencesRun = 0L
+        private set
+
+    /**
+     * هل يجب تشغيل المصنّف لهذا الإطار؟
+     * @param frame FloatArray[63] بعد التطبيع
+     */
+    fun shouldInfer(frame: FloatArray): Boolean {
+        framesObserved++
+        val score = previousFrame?.let { motionScore(it, frame) } ?: Float.MAX_VALUE
+        previousFrame = frame.copyOf()
+        framesSinceInference++
+        accumulatedMotion += score
+
+        if (lastResult == null || framesSinceInference >= maxStaleness) {
+            return true
+        }
+        if (score < stillThreshold && accumulatedMotion < motionThreshold) {
+            return false
+        }
+        if (score < motionThreshold) {
+            return framesSinceInference >= coarseStride
+        }
+        return true
+    }
+
+    /**
+     * تسجيل نتيجة تصنيف جديدة
+     */
+    fun onInference(result: Pair<String, Float>?) {
+        inferencesRun++
+        lastResult = result
+        framesSinceInference = 0
+        accumulatedMotion = 0f
+    }
+
+    /**
+     * إعادة التعيين (عند فقدان اليد أو تغيير الإشارة)
+     */
+    fun reset() {
+        previousFrame = null
+        accumulatedMotion = 0f
+        framesSinceInference = 0
+        lastResult = null
+    }
+}
@@ -0,0 +1,94 @@
+package com.example.handspeak.ml
+
+import kotlin.math.roundToInt
+
+/**
+ * PredictionCache - ذاكرة تخزين مؤقت (LRU) لنتائج التصنيف
+ *
+ * المفتاح = المدخلات بعد التقريب إلى شبكة بخطوة quantizationStep،
+ * فالوضعيات المتطابقة تقريباً تعيد النتيجة المحفوظة بدل تشغيل النموذج.
+ *
+ * - الحجم محدود بـ capacity (الأقدم استخداماً يُحذف أولاً)
+ * - عدادات hits / misses / evictions للمراقبة
+ * - معطّل افتراضياً في SignLanguageClassifier (predictionCacheEnabled / الإعداد enable_prediction_cache)
+ *
+ * النسخة المرجعية وأداة اختيار الإعدادات: scripts/prediction_cache.py
+ */
+class PredictionCache(
+    private val quantizationStep: Float = DEFAULT_QUANTIZATION_STEP,
+    private val capacity: Int = DEFAULT_CAPACITY
+) {
+
+    companion object {
+        // خطوة صغيرة: الوضعيات المتقاربة لحروف مختلفة يجب ألا تشترك في مفتاح
+        // (0.2 = ~6 مستويات لكل محور). راجعها على تسجيلات حقيقية:
+        // python prediction_cache.py --model arabic_sign_dense.tflite --stream session.npz
+        const val DEFAULT_QUANTIZATION_STEP = 0.02f
+        const val DEFAULT_CAPACITY = 64
+    }
+
+    /**
+     * مفتاح يقارن المحتوى (IntArray لا يقارن المحتوى افتراضياً)
+     */
+    class Key(private val values: IntArray) {
+        private val hash = values.contentHashCode()
+
+        override fun equals(other: Any?): Boolean =
+            other is Key && hash == other.hash && values.contentEquals(other.values)
+
+        override fun hashCode(): Int = hash
+    }
+
+    private val entries = object : LinkedHashMap<Key, Pair<String, Float>>(capacity, 0.75f, true) {
+        override fun removeEldestEntry(eldest: MutableMap.MutableEntry<Key, Pair<String, Float>>?): Boolean {
+            val evict = size > capacity
+            if (evict) evictions++
+            return evict
+        }
+    }
+
+    var hits = 0L
+        private set
+    var misses = 0L
+        private set
+    var evictions = 0L
+        private set
+
+    val size: Int
+        get() = entries.size
+
+    val hitRate: Float
+        get() = if (hits + misses == 0L) 0f else hits.toFloat() / (hits + misses)
+
+    /**
+     * إنشاء مفتاح من إطار واحد أو من عدة إطارات (نافذة LSTM)
+     */
+    fun keyOf(frames: List<FloatArray>): Key {
+        val quantized = IntArray(frames.sumOf { it.size })
+        var offset = 0
+        frames.forEach { frame ->
+            frame.forEach { value ->
+                quantized[offset++] = (value / quantizationStep).roundToInt()
+            }
+        }
+        return Key(quantized)
+    }
+
+    fun get(key: Key): Pair<String, Float>? {
+        val result = entries[key]
+        if (result == null) misses++ else hits++
+        return result
+    }
+
+    fun put(key: Key, result: Pair<String, Float>) {
+        entries[key] = result
+    }
+
+    fun clear() {
+        entries.clear()
+    }
+
+    override fun toString(): String =
+        "PredictionCache(size=$size, hits=$hits, misses=$misses, evictions=$evictions, " +
+                "hitRate=${"%.1f".format(hitRate * 100)}%)"
+}
@@ -14,18 +14,46 @@ import java.nio.ByteBuffer
 import java.nio.ByteOrder
 import java.nio.channels.FileChannel
 
-class SignLanguageClassifier(private val context: Context) {
+class SignLanguageClassifier(
+    private val context: Context,
+    private val modelName: String = MODEL_NAME
+) {
     
     private var interpreter: Interpreter? = null
     private var labels: List<String> = emptyList()
     private var labelEncoder: LabelEncoder? = null
+    
+    // Buffers reused across calls (avoid allocating per frame)
+    private val frameBuffer: ByteBuffer = ByteBuffer.allocateDirect(4 * INPUT_SIZE).order(ByteOrder.nativeOrder())
+    private var sequenceBuffer: ByteBuffer? = null
+    private var outputArray: Array<FloatArray> = emptyArray()
+    
+    // نتائج الإطارات المتكررة (Dense فقط - نوافذ LSTM نادراً ما تتكرر)
+    // معطّل افتراضياً: يعيد نتيجة محفوظة لوضعية قريبة، فيُفعَّل فقط بعد ضبط الخطوة على تسجيلات حقيقية
+    val predictionCache = PredictionCache()
+    var predictionCacheEnabled = false
+    
+    // نموذج LSTM بطول متغير (train --variable-length): Input [1, -1, 63]
+    // يصنّف الإطارات المتوفرة بدون تكرار آخر إطار، فيمكن التصنيف قبل اكتمال التسلسل
+    var supportsVariableLength = false
+        private set
+    private var inputSequenceLength = -1
+    
+    /** هل تم تحميل النموذج (الملف موجود في assets) */
+    val isLoaded: Boolean
+        get() = interpreter != null
+    
+    /** عدد مخرجات النموذج (يجب أن يساوي عدد labels.json) */
+    val outputSize: Int
+        get() = interpreter?.getOutputTensor(0)?.shape()?.last() ?: 0
     // GPU delegate temporarily disabled
     // private val gpuDelegate: GpuDelegate?
     
     companion object {
         private const val TAG = "SignLanguageClassifier"
         // يمكن استخدام Dense أو LSTM - المهم هو المدخلات والمخرجات
-        private const val MODEL_NAME = "arabic_sign_lstm.tflite"  // يمكن تغييره إلى arabic_sign_dense.tflite
+        const val MODEL_NAME = "arabic_sign_lstm.tflite"  // يمكن تغييره إلى arabic_sign_dense.tflite
+        const val DENSE_MODEL_NAME = "arabic_sign_dense.tflite"  // نموذج الإطار الواحد في وضع Cascade
         private const val NUM_LANDMARKS = 21
         private const val COORDINATES_PER_LANDMARK = 3 // x, y, z
         private const val INPUT_SIZE = NUM_LANDMARKS * COORDINATES_PER_LANDMARK // 63
@@ -44,6 +72,7 @@ class SignLanguageClassifier(private val context: Context) {
         // Initialize LabelEncoder (equivalent to scikit-learn LabelEncoder from Colab)
         labelEncoder = LabelEncoder(labels)
         Log.d(TAG, "LabelEncoder initialized with ${labels.size} labels")
+        outputArray = Array(1) { FloatArray(labels.size) }
         
         // GPU delegate temporarily disabled - using CPU only
         Log.d(TAG, "Using CPU for inference (GPU disabled)")
@@ -57,7 +86,9 @@ class SignLanguageClassifier(private val context: Context) {
                 // The library is loaded automatically when the dependency is added
             }
             interpreter = Interpreter(model, options)
-            Log.d(TAG, "Model loaded successfully. Labels count: ${labels.size}")
+            supportsVariableLength = interpreter?.getInputTensor(0)?.shapeSignature()
+                ?.let { it.size == 3 && it[1] == -1 } ?: false
+            Log.d(TAG, "Model $modelName loaded successfully. Labels count: ${labels.size}, variable length: $supportsVariableLength")
             Log.d(TAG, "TensorFlow Lite Select TF Ops should be available (if dependency is added)")
         } catch (e: Exception) {
             Log.e(TAG, "Error loading model: ${e.message}", e)
@@ -69,7 +100,7 @@ class SignLanguageClassifier(private val context: Context) {
             }
             // Model file not found is expected if you haven't added it yet
             if (e is java.io.FileNotFoundException) {
-                Log.w(TAG, "Model file not found. Add 'arabic_sign_lstm.tflite' to assets folder.")
+                Log.w(TAG, "Model file not found. Add '$modelName' to assets folder.")
             }
         }
     }
@@ -77,7 +108,7 @@ class SignLanguageClassifier(private val context: Context) {
     private fun loadModelFile(): ByteBuffer {
         // Prefer memory-mapped file descriptor (requires uncompressed asset)
         try {
-            val fileDescriptor = context.assets.openFd(MODEL_NAME)
+            val fileDescriptor = context.assets.openFd(modelName)
             FileInputStream(fileDescriptor.fileDescriptor).use { inputStream ->
                 val fileChannel = inputStream.channel
                 val startOffset = fileDescriptor.startOffset
@@ -87,7 +118,7 @@ class SignLanguageClassifier(private val context: Context) {
         } catch (e: IOException) {
             // Fallback for compressed assets: stream into a direct ByteBuffer
             Log.w(TAG, "Falling back to streaming model (asset likely compressed): ${e.message}")
-            context.assets.open(MODEL_NAME).use { input ->
+            context.assets.open(modelName).use { input ->
                 val bytes = input.readBytes()
                 val buffer = ByteBuffer.allocateDirect(bytes.size)
                 buffer.order(ByteOrder.nativeOrder())
@@ -113,17 +144,17 @@ class SignLanguageClassifier(private val context: Context) {
             return null
         }
         
+        val cacheKey = if (predictionCacheEnabled) predictionCache.keyOf(listOf(landmarks)) else null
+        cacheKey?.let { key -> predictionCache.get(key)?.let { return it } }
+        
         try {
             // Prepare input
-            val inputBuffer = ByteBuffer.allocateDirect(4 * INPUT_SIZE).apply {
-                order(ByteOrder.nativeOrder())
+            val inputBuffer = frameBuffer.apply {
+                clear()
                 landmarks.forEach { putFloat(it) }
                 rewind()
             }
             
-            // Prepare output
-            val outputArray = Array(1) { FloatArray(labels.size) }
-            
             // Run inference
             interpreter?.run(inputBuffer, outputArray)
             
@@ -140,7 +171,7 @@ class SignLanguageClassifier(private val context: Context) {
             
             Log.d(TAG, "Predicted index: $maxIndex → label: $label with confidence: $confidence")
             
-            return Pair(label, confidence)
+            return Pair(label, confidence).also { result -> cacheKey?.let { predictionCache.put(it, result) } }
         } catch (e: Exception) {
             Log.e(TAG, "Error during classification", e)
             return null
@@ -172,17 +203,27 @@ class SignLanguageClassifier(private val context: Context) {
         }
         
         try {
-            // إذا كان التسلسل أقل من المطلوب، نكرر آخر إطار
-            val paddedSequence = if (sequence.size < sequenceLength) {
+            // إذا كان التسلسل أقل من المطلوب، نكرر آخر إطار (إلا مع نموذج بطول متغير)
+            val paddedSequence = if (sequence.size < sequenceLength && !supportsVariableLength) {
                 val lastFrame = sequence.last()
                 sequence + List(sequenceLength - sequence.size) { lastFrame.copyOf() }
             } else {
                 sequence.takeLast(sequenceLength) // نأخذ آخر sequenceLength إطار
             }
             
-            // Prepare input buffer: [sequence_length, 63]
-            val inputBuffer = ByteBuffer.allocateDirect(4 * sequenceLength * INPUT_SIZE).apply {
-                order(ByteOrder.nativeOrder())
+            // نموذج بطول متغير: تغيير شكل المدخل فقط عند تغير عدد الإطارات
+            if (supportsVariableLength && paddedSequence.size != inputSequenceLength) {
+                interpreter?.resizeInput(0, intArrayOf(1, paddedSequence.size, INPUT_SIZE))
+                interpreter?.allocateTensors()
+                inputSequenceLength = paddedSequence.size
+            }
+            
+            // Prepare input buffer: [sequence_length, 63] (reallocated only if the length changes)
+            val bufferSize = 4 * paddedSequence.size * INPUT_SIZE
+            val inputBuffer = sequenceBuffer?.takeIf { it.capacity() == bufferSize }
+                ?: ByteBuffer.allocateDirect(bufferSize).order(ByteOrder.nativeOrder()).also { sequenceBuffer = it }
+            inputBuffer.apply {
+                clear()
                 paddedSequence.forEach { frame ->
                     frame.forEach { value ->
                         putFloat(value)
@@ -191,9 +232,6 @@ class SignLanguageClassifier(private val context: Context) {
                 rewind()
             }
             
-            // Prepare output
-            val outputArray = Array(1) { FloatArray(labels.size) }
-            
             // Run inference
             interpreter?.run(inputBuffer, outputArray)
             
@@ -220,6 +258,8 @@ class SignLanguageClassifier(private val context: Context) {
     }
     
     fun close() {
+        Log.d(TAG, "Closing classifier: $predictionCache")
+        predictionCache.clear()
         interpreter?.close()
         interpreter = null
         // gpuDelegate?.close()  // GPU disabled
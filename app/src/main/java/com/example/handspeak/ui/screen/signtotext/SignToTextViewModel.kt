@@ -10,7 +10,9 @@ import com.example.handspeak.data.database.AppDatabase
 import com.example.handspeak.data.database.HistoryEntity
 import com.example.handspeak.data.repository.HistoryRepository
 import com.example.handspeak.ml.AdaptiveLearningHelper
+import com.example.handspeak.ml.CascadeClassifier
 import com.example.handspeak.ml.HandDetectionHelper
+import com.example.handspeak.ml.MotionGate
 import com.example.handspeak.ml.SignLanguageClassifier
 import com.example.handspeak.util.TextToSpeechHelper
 import kotlinx.coroutines.flow.MutableStateFlow
@@ -42,7 +44,30 @@ class SignToTextViewModel(application: Application) : AndroidViewModel(applicati
     // LSTM Frame Buffer - لتجميع عدة إطارات قبل التصنيف
     private val frameBuffer = mutableListOf<FloatArray>()
     private val SEQUENCE_LENGTH = 10 // طول التسلسل للـ LSTM
+    private val MIN_SEQUENCE_LENGTH = 4 // أول تصنيف مبكر (نموذج بطول متغير فقط)
+    private val MIN_CONFIDENCE = 0.5f
     private val USE_LSTM = true // تفعيل LSTM
+    private val USE_CASCADE = false // Dense أولاً، و LSTM فقط للإطارات غير الواثقة أو الحركية
+    private val ENABLE_MOTION_GATE = false // تخطي التصنيف عندما تكون اليد ثابتة (Dense / Cascade)
+    private val ENABLE_PREDICTION_CACHE = false // إعادة نتيجة محفوظة للوضعيات شبه المتطابقة (Dense)
+    
+    // تخطي التصنيف عندما تكون اليد ثابتة (إعادة استخدام آخر نتيجة)
+    private val motionGate = MotionGate()
+    
+    // وضع Cascade: يُنشأ عند أول استخدام (يحمّل نموذج Dense إضافياً)
+    private var cascadeClassifier: CascadeClassifier? = null
+    
+    private fun cascade(): CascadeClassifier? {
+        if (cascadeClassifier == null && classifier != null) {
+            cascadeClassifier = try {
+                CascadeClassifier(getApplication(), classifier)
+            } catch (e: Exception) {
+                Log.e("SignToTextViewModel", "Failed to initialize cascade", e)
+                null
+            }
+        }
+        return cascadeClassifier
+    }
     
     init {
         // Initialize classifier (may fail if model not found - that's OK)
@@ -119,6 +144,7 @@ class SignToTextViewModel(application: Application) : AndroidViewModel(applicati
                     processHandLandmarks(handResult.landmarks, handResult.confidence)
                 } else {
                     // No hand detected
+                    motionGate.reset()
                     _uiState.value = _uiState.value.copy(
                         isProcessing = false,
                         detectedText = "",
@@ -147,10 +173,36 @@ class SignToTextViewModel(application: Application) : AndroidViewModel(applicati
                         return@launch
                     }
                 
-                // استخدام LSTM أو Dense حسب الإعداد
-                val useLSTM = prefs.getBoolean("use_lstm", USE_LSTM)
+                // Cascade أو LSTM أو Dense حسب الإعداد
+                val useCascade = prefs.getBoolean("use_cascade", USE_CASCADE)
+                classifier?.predictionCacheEnabled =
+                    prefs.getBoolean("enable_prediction_cache", ENABLE_PREDICTION_CACHE)
+                val useLSTM = !useCascade && prefs.getBoolean("use_lstm", USE_LSTM)
+                
+                // هل تحركت اليد بما يكفي لإعادة التصنيف؟ (ليس لـ LSTM: كل Buffer ممتلئ إطارات جديدة
+                // بعد المسح، والحكم على الثبات إطاراً بإطار كان يتخطى نصف التصنيفات فقط)
+                val useMotionGate = !useLSTM && prefs.getBoolean("enable_motion_gate", ENABLE_MOTION_GATE)
+                val needsInference = !useMotionGate || motionGate.shouldInfer(normalizedLandmarks)
                 
-                val result = if (useLSTM) {
+                val result = if (useCascade) {
+                    // Cascade: نافذة منزلقة بدون مسح، تصنيف كل إطار (Dense، و LSTM عند الحاجة)
+                    frameBuffer.add(normalizedLandmarks)
+                    if (frameBuffer.size > SEQUENCE_LENGTH) {
+                        frameBuffer.removeAt(0)
+                    }
+                    _uiState.value = _uiState.value.copy(
+                        sequenceBufferSize = frameBuffer.size,
+                        useLSTM = false
+                    )
+                    if (needsInference) {
+                        val window = frameBuffer.toList()
+                        (cascade()?.classify(window, SEQUENCE_LENGTH)
+                            ?: classifier?.classifySequence(window, SEQUENCE_LENGTH))
+                            .also { motionGate.onInference(it) }
+                    } else {
+                        motionGate.lastResult
+                    }
+                } else if (useLSTM) {
                     // LSTM: جمع الإطارات في Buffer
                     frameBuffer.add(normalizedLandmarks)
                     
@@ -160,12 +212,27 @@ class SignToTextViewModel(application: Application) : AndroidViewModel(applicati
                         useLSTM = true
                     )
                     
+                    // نموذج بطول متغير: نصنّف مبكراً من MIN_SEQUENCE_LENGTH إطار
+                    val earlyClassification = classifier?.supportsVariableLength == true &&
+                        frameBuffer.size >= MIN_SEQUENCE_LENGTH
+                    
                     // إذا وصلنا للطول المطلوب، نصنّف التسلسل
-                    if (frameBuffer.size >= SEQUENCE_LENGTH) {
+                    if (frameBuffer.size >= SEQUENCE_LENGTH || earlyClassification) {
                         val sequence = frameBuffer.toList()
-                        frameBuffer.clear() // مسح Buffer بعد التصنيف
                         
-                        classifier?.classifySequence(sequence, SEQUENCE_LENGTH)
+                        val sequenceResult = classifier?.classifySequence(sequence, SEQUENCE_LENGTH)
+                        
+                        // نتيجة مبكرة غير واثقة → نكمل جمع الإطارات حتى SEQUENCE_LENGTH
+                        if (frameBuffer.size < SEQUENCE_LENGTH &&
+                            (sequenceResult?.second ?: 0f) < MIN_CONFIDENCE) {
+                            _uiState.value = _uiState.value.copy(
+                                isProcessing = false,
+                                detectedText = "جمع الإطارات... (${frameBuffer.size}/$SEQUENCE_LENGTH)"
+                            )
+                            return@launch
+                        }
+                        frameBuffer.clear() // مسح Buffer بعد التصنيف
+                        sequenceResult
                     } else {
                         // لم نصل بعد للطول المطلوب
                         _uiState.value = _uiState.value.copy(
@@ -180,23 +247,28 @@ class SignToTextViewModel(application: Application) : AndroidViewModel(applicati
                         sequenceBufferSize = 1,
                         useLSTM = false
                     )
-                    classifier?.classify(normalizedLandmarks)
+                    if (needsInference) {
+                        classifier?.classify(normalizedLandmarks)
+                            .also { motionGate.onInference(it) }
+                    } else {
+                        motionGate.lastResult
+                    }
                 }
                 
                 if (result != null) {
                     val (label, classificationConfidence) = result
                     
                     // Use minimum confidence threshold (0.5 = 50%)
-                    val minConfidence = 0.5f
+                    val minConfidence = MIN_CONFIDENCE
                     
                     if (classificationConfidence >= minConfidence) {
                         _uiState.value = _uiState.value.copy(
                             detectedText = label,
                             confidence = classificationConfidence,
                             isProcessing = false,
-                            sequenceBufferSize = if (useLSTM) 0 else 1
+                            sequenceBufferSize = if (useLSTM) 0 else if (useCascade) frameBuffer.size else 1
                         )
-                        Log.d("SignToTextViewModel", "${if (useLSTM) "LSTM" else "Dense"} Detected: $label (${(classificationConfidence * 100).toInt()}%)")
+                        Log.d("SignToTextViewModel", "${if (useCascade) "Cascade" else if (useLSTM) "LSTM" else "Dense"} Detected: $label (${(classificationConfidence * 100).toInt()}%)")
                         
                         // حفظ عينة تدريب للتعلم التكيفي (إذا كان التعلم مفعّل)
                         val enableLearning = prefs.getBoolean("enable_adaptive_learning", true)
@@ -250,6 +322,7 @@ class SignToTextViewModel(application: Application) : AndroidViewModel(applicati
      */
     fun clearFrameBuffer() {
         frameBuffer.clear()
+        motionGate.reset()
         _uiState.value = _uiState.value.copy(sequenceBufferSize = 0)
     }
     
@@ -294,6 +367,7 @@ class SignToTextViewModel(application: Application) : AndroidViewModel(applicati
     
     override fun onCleared() {
         super.onCleared()
+        cascadeClassifier?.close()
         classifier?.close()
         handDetectionHelper?.close()
         ttsHelper.shutdown()
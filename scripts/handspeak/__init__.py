@@ -0,0 +1,13 @@
+"""
+handspeak - أدوات HandSpeak (التدريب، التصدير، الصور، القياس)
+
+الاستخدام (من مجلد scripts):
+    python -m handspeak --help
+    python -m handspeak train --arch lstm
+    python -m handspeak export --arch dense
+
+الاعتماديات الثقيلة (tensorflow, gdown, PIL, ...) تُستورد داخل الأوامر التي تحتاجها فقط،
+لذلك --help والأوامر الخفيفة تبدأ فوراً (راجع: python -m handspeak check-startup).
+"""
+
+__version__ = "0.1.0"
@@ -0,0 +1,125 @@
+"""
+handspeak ablation - مقارنة مجموعات الميزات (features.py) وأحجام النماذج
+
+يعيد تدريب Dense و LSTM على كل مجموعة ميزات وكل عرض (width) بنفس البيانات
+الاصطناعية، ويعرض الدقة وعدد المعاملات والدقة لكل 10K معامل، ثم أصغر نموذج
+يطابق النموذج الحالي (raw، width=1.0) ضمن --tolerance.
+
+الاستخدام:
+    python -m handspeak ablation
+    python -m handspeak ablation --archs dense --feature-sets raw geometry palm+angles --widths 1 0.25 0.1
+"""
+
+import json
+import time
+
+DEFAULT_FEATURE_SETS = ["raw", "palm", "angles", "distances", "geometry", "motion"]
+
+
+def add_arguments(parser):
+    parser.add_argument('--archs', choices=("lstm", "dense"), nargs='+', default=["dense", "lstm"])
+    parser.add_argument('--feature-sets', nargs='+', default=DEFAULT_FEATURE_SETS,
+                        help='أسماء من features.FEATURE_SETS أو كتل بـ + (مثل palm+angles)')
+    parser.add_argument('--widths', type=float, nargs='+', default=[1.0, 0.25],
+                        help='معامل عرض الطبقات (1.0 = النموذج الحالي)')
+    parser.add_argument('--samples', type=int, default=4800, help='عدد العينات الاصطناعية')
+    parser.add_argument('--epochs', type=int, default=10)
+    parser.add_argument('--batch-size', type=int, default=64)
+    parser.add_argument('--sequence-length', type=int, default=10)
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--tolerance', type=float, default=0.01,
+                        help='أقصى فرق دقة مقبول عن النموذج الحالي')
+    parser.add_argument('--json', type=str, default=None, help='حفظ النتائج في ملف JSON')
+
+
+def run_ablation(archs, feature_sets, widths, samples: int, epochs: int, batch_size: int,
+                 sequence_length: int, seed: int) -> list:
+    import tensorflow as tf
+
+    from .features import compute_features, feature_size, needs_sequence
+    from .landmarks import load_labels
+    from .models import compile_model, create_model
+    from .synthetic_data import make_dataset
+
+    num_classes = len(load_labels())
+    results = []
+    for arch in archs:
+        use_lstm = arch == "lstm"
+        X, y, landmarks = make_dataset(samples, num_classes, sequence_length if use_lstm else None,
+                                       seed=seed, with_landmarks=True)
+        for feature_set in feature_sets:
+            if needs_sequence(feature_set) and not use_lstm:
+                print(f"⏭️  {arch} / {feature_set}: velocity تحتاج تسلسلات")
+                continue
+            start = time.perf_counter()
+            features = compute_features(X, feature_set, landmarks)
+            feature_us = (time.perf_counter() - start) * 1e6 / (X.size // X.shape[-1])
+            for width in widths:
+                tf.keras.utils.set_random_seed(seed)
+                model = compile_model(create_model(arch, num_classes, sequence_length,
+                                                   input_size=feature_size(feature_set), width=width))
+                start = time.perf_counter()
+                history = model.fit(features, y, epochs=epochs, batch_size=batch_size,
+                                    validation_split=0.2, verbose=0)
+                result = {
+                    "arch": arch,
+                    "feature_set": feature_set,
+                    "width": width,
+                    "input_size": feature_size(feature_set),
+                    "params": model.count_params(),
+                    "val_accuracy": float(history.history['val_accuracy'][-1]),
+                    "train_seconds": time.perf_counter() - start,
+                    "feature_us_per_frame": feature_us,
+                }
+                result["accuracy_per_10k_params"] = (result["val_accuracy"] /
+                                                     (result["params"] / 10000))
+                results.append(result)
+                print(f"   {arch:<5} {feature_set:<12} width={width:<5g} "
+                      f"params={result['params']:>8,} acc={result['val_accuracy']:.2%}", flush=True)
+    return results
+
+
+def smallest_matching(results: list, tolerance: float) -> dict:
+    """لكل arch: أصغر نموذج دقته ≥ دقة (raw، width=1.0) - tolerance"""
+    matches = {}
+    for arch in {r["arch"] for r in results}:
+        rows = [r for r in results if r["arch"] == arch]
+        baseline = next((r for r in rows if r["feature_set"] == "raw" and r["width"] == 1.0), None)
+        if baseline is None:
+            continue
+        candidates = [r for r in rows if r["val_accuracy"] >= baseline["val_accuracy"] - tolerance]
+        matches[arch] = {"baseline": baseline, "smallest": min(candidates, key=lambda r: r["params"])}
+    return matches
+
+
+def print_report(results: list, tolerance: float):
+    print(f"\n{'arch':<6} {'features':<14} {'width':>5} {'inputs':>6} {'params':>9} {'accuracy':>9} "
+          f"{'acc/10K':>7} {'feat µs':>8}")
+    print("-" * 72)
+    for r in sorted(results, key=lambda r: (r["arch"], -r["val_accuracy"])):
+        print(f"{r['arch']:<6} {r['feature_set']:<14} {r['width']:>5g} {r['input_size']:>6} "
+              f"{r['params']:>9,} {r['val_accuracy']:>8.1%} {r['accuracy_per_10k_params']:>7.3f} "
+              f"{r['feature_us_per_frame']:>8.2f}")
+
+    for arch, match in smallest_matching(results, tolerance).items():
+        base, best = match["baseline"], match["smallest"]
+        print(f"\n🏁 {arch}: الحالي (raw, width=1) {base['params']:,} معامل → {base['val_accuracy']:.1%}")
+        if best is base:
+            print(f"   لا يوجد نموذج أصغر ضمن {tolerance:.0%}")
+        else:
+            print(f"   أصغر نموذج مطابق: {best['feature_set']} width={best['width']:g} → "
+                  f"{best['params']:,} معامل ({base['params'] / best['params']:.1f}× أصغر), "
+                  f"{best['val_accuracy']:.1%}")
+
+
+def run(args):
+    print(f"🧪 Ablation: {', '.join(args.archs)} × {len(args.feature_sets)} feature sets × "
+          f"widths {', '.join(f'{w:g}' for w in args.widths)} ({args.epochs} epochs)")
+    results = run_ablation(args.archs, args.feature_sets, args.widths, args.samples, args.epochs,
+                           args.batch_size, args.sequence_length, args.seed)
+    print_report(results, args.tolerance)
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+        print(f"\n📄 Saved: {args.json}")
+    return 0
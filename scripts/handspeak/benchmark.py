@@ -0,0 +1,70 @@
+"""
+handspeak benchmark - قياس زمن الاستدلال لنموذج .tflite
+
+- زمن تحميل النموذج
+- زمن استدلال إطار/تسلسل واحد (p50 / p90 / p99) مثل التطبيق
+- الإنتاجية (عينة/ثانية) لأحجام دفعات مختلفة
+"""
+
+import json
+import time
+
+
+def add_arguments(parser):
+    parser.add_argument('--model', type=str, required=True, help='ملف .tflite')
+    parser.add_argument('--runs', type=int, default=200, help='عدد مرات الاستدلال')
+    parser.add_argument('--warmup', type=int, default=10)
+    parser.add_argument('--threads', type=int, default=4, help='مثل setNumThreads(4) في التطبيق')
+    parser.add_argument('--batch-sizes', type=int, nargs='+', default=[1, 8, 32])
+    parser.add_argument('--json', type=str, default=None, help='حفظ النتائج في ملف JSON')
+
+
+def benchmark_model(model_path, runs: int = 200, warmup: int = 10, num_threads: int = 4,
+                    batch_sizes=(1, 8, 32)) -> dict:
+    import numpy as np
+
+    from .landmarks import INPUT_SIZE
+    from .sign_classifier import SignClassifier
+
+    start = time.perf_counter()
+    classifier = SignClassifier(model_path, labels=[], num_threads=num_threads)
+    load_ms = (time.perf_counter() - start) * 1000.0
+
+    rng = np.random.default_rng(0)
+    results = {"model": str(model_path), "threads": num_threads, "load_ms": load_ms,
+               "sequence_model": classifier.is_sequence_model, "batches": []}
+    for batch_size in batch_sizes:
+        shape = ((batch_size, classifier.sequence_length, INPUT_SIZE) if classifier.is_sequence_model
+                 else (batch_size, INPUT_SIZE))
+        inputs = rng.random(shape, dtype=np.float32)
+        for _ in range(warmup):
+            classifier.predict(inputs)
+        samples = np.empty(runs)
+        for i in range(runs):
+            start = time.perf_counter()
+            classifier.predict(inputs)
+            samples[i] = (time.perf_counter() - start) * 1000.0
+        p50, p90, p99 = np.percentile(samples, [50, 90, 99])
+        results["batches"].append({
+            "batch_size": batch_size,
+            "p50_ms": float(p50), "p90_ms": float(p90), "p99_ms": float(p99),
+            "samples_per_sec": float(batch_size * 1000.0 / p50) if p50 > 0 else None,
+        })
+    return results
+
+
+def run(args):
+    print(f"⏱️  Benchmarking {args.model} ({args.threads} thread(s), {args.runs} runs)...")
+    results = benchmark_model(args.model, args.runs, args.warmup, args.threads, args.batch_sizes)
+    print(f"📦 Load: {results['load_ms']:.1f}ms | "
+          f"{'LSTM (sequence)' if results['sequence_model'] else 'Dense (single frame)'}")
+    print(f"\n{'batch':>6} {'p50':>9} {'p90':>9} {'p99':>9} {'samples/s':>11}")
+    print("-" * 48)
+    for r in results["batches"]:
+        print(f"{r['batch_size']:>6} {r['p50_ms']:>7.3f}ms {r['p90_ms']:>7.3f}ms "
+              f"{r['p99_ms']:>7.3f}ms {r['samples_per_sec']:>11,.0f}")
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+        print(f"\n📄 Saved: {args.json}")
+    return 0
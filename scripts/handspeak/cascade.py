@@ -0,0 +1,161 @@
+"""
+Cascade: نموذج Dense الرخيص أولاً، و LSTM فقط عند الحاجة (نسخة مرجعية من CascadeClassifier.kt)
+
+لكل إطار:
+1. Dense يصنّف الإطار الحالي (دائماً - أرخص بكثير من LSTM)
+2. تُعتمد نتيجة Dense إذا:
+   - الثقة ≥ dense_threshold
+   - والتصنيف ليس من dynamic_labels (إشارات حركية لا يميزها إطار واحد)
+   - وحركة النافذة < motion_threshold (اليد ثابتة تقريباً)
+3. غير ذلك → LSTM على آخر sequence_length إطار (Ring buffer)
+
+الإعدادات في assets/cascade.json (يكتبها train --arch cascade و tune-cascade --write-config):
+    {"labels": [...], "dense_model": ..., "lstm_model": ...,
+     "dense_threshold": 0.8, "motion_threshold": 0.06, "dynamic_labels": [...]}
+"labels" = ترتيب labels.json وقت التدريب: النموذجان يجب أن يطابقاه، وإلا لا يُستخدم الـ Cascade.
+"motion_threshold": null → بدون شرط الحركة، وغياب المفتاح → DEFAULT_MOTION_THRESHOLD.
+
+حركة النافذة = متوسط motion score (نفس MotionGate) بين كل إطارين متتاليين في النافذة.
+"""
+
+import json
+from pathlib import Path
+
+import numpy as np
+
+from .landmarks import NUM_LANDMARKS, SEQUENCE_LENGTH, load_labels
+from .models import MODEL_FILES
+from .paths import CASCADE_FILE
+from .sign_classifier import model_output_classes
+
+DEFAULT_DENSE_THRESHOLD = 0.8
+DEFAULT_MOTION_THRESHOLD = 0.06
+
+
+def frame_motion(frames: np.ndarray) -> np.ndarray:
+    """(N, 63) → (N-1,) متوسط المسافة بين النقاط المتقابلة في كل إطارين متتاليين"""
+    points = np.asarray(frames, dtype=np.float32).reshape(len(frames), NUM_LANDMARKS, 3)
+    diff = points[1:] - points[:-1]
+    return np.sqrt((diff * diff).sum(axis=-1)).mean(axis=-1)
+
+
+def window_motion(window: np.ndarray) -> float:
+    """حركة نافذة (T, 63): متوسط frame_motion، و 0 لإطار واحد"""
+    return float(frame_motion(window).mean()) if len(window) > 1 else 0.0
+
+
+def rolling_motion(frames: np.ndarray, sequence_length: int = SEQUENCE_LENGTH) -> np.ndarray:
+    """
+    window_motion لنافذة كل إطار (آخر sequence_length إطار حتى الإطار نفسه) - Vectorized
+    (N, 63) → (N,)
+    """
+    scores = np.concatenate([[0.0], np.cumsum(frame_motion(frames), dtype=np.float64)])
+    position = np.arange(len(frames))
+    first = np.maximum(position - sequence_length + 1, 0)
+    pairs = position - first
+    return np.where(pairs > 0, (scores[position] - scores[first]) / np.maximum(pairs, 1),
+                    0.0).astype(np.float32)
+
+
+def dynamic_labels(X: np.ndarray, labels: np.ndarray, label_names: list,
+                   motion_threshold: float = DEFAULT_MOTION_THRESHOLD) -> list:
+    """
+    الإشارات الحركية من بيانات التدريب: وسيط حركة تسلسلاتها ≥ motion_threshold
+    X: (N, T, 63)، labels: (N,) أرقام التصنيفات
+    """
+    motion = np.sqrt(((np.diff(X.reshape(*X.shape[:2], NUM_LANDMARKS, 3), axis=1)) ** 2)
+                     .sum(axis=-1)).mean(axis=(1, 2))
+    return [label_names[c] for c in range(len(label_names))
+            if (labels == c).any() and np.median(motion[labels == c]) >= motion_threshold]
+
+
+def default_config(labels: list) -> dict:
+    return {
+        "labels": list(labels),
+        "dense_model": MODEL_FILES["dense"],
+        "lstm_model": MODEL_FILES["lstm"],
+        "dense_threshold": DEFAULT_DENSE_THRESHOLD,
+        "motion_threshold": DEFAULT_MOTION_THRESHOLD,
+        "dynamic_labels": [],
+    }
+
+
+def load_config(config_file: Path = CASCADE_FILE) -> dict:
+    """cascade.json، أو الإعدادات الافتراضية بترتيب labels.json الحالي إذا لم يوجد"""
+    config_file = Path(config_file)
+    if not config_file.exists():
+        return default_config(load_labels())
+    with open(config_file, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def save_config(config: dict, config_file: Path = CASCADE_FILE) -> Path:
+    config_file = Path(config_file)
+    with open(config_file, 'w', encoding='utf-8') as f:
+        json.dump(config, f, ensure_ascii=False, indent=2)
+    return config_file
+
+
+def check_labels(config: dict, labels: list, model_paths=()):
+    """ValueError إذا اختلف ترتيب labels.json عن cascade.json أو عدد مخرجات أي نموذج"""
+    if list(config["labels"]) != list(labels):
+        raise ValueError("cascade.json labels do not match labels.json order "
+                         "(retrain with: python -m handspeak train --arch cascade)")
+    for model_path in model_paths:
+        num_classes = model_output_classes(model_path)
+        if num_classes != len(labels):
+            raise ValueError(f"{Path(model_path).name} has {num_classes} outputs, "
+                             f"labels.json has {len(labels)}")
+
+
+class Cascade:
+    """نسخة Python مطابقة لـ CascadeClassifier.kt"""
+
+    def __init__(self, dense, lstm, dense_threshold: float = DEFAULT_DENSE_THRESHOLD,
+                 motion_threshold: float = DEFAULT_MOTION_THRESHOLD, dynamic_labels=()):
+        """dense / lstm: SignClassifier بنفس ترتيب التصنيفات"""
+        if dense.num_classes != lstm.num_classes:
+            raise ValueError(f"Dense has {dense.num_classes} classes, LSTM has {lstm.num_classes}")
+        self.dense = dense
+        self.lstm = lstm
+        self.dense_threshold = dense_threshold
+        self.motion_threshold = float("inf") if motion_threshold is None else motion_threshold
+        self.dynamic = np.zeros(dense.num_classes, dtype=bool)
+        names = {label: i for i, label in enumerate(dense.labels)}
+        self.dynamic[[names[label] for label in dynamic_labels if label in names]] = True
+        self.frames_classified = 0
+        self.lstm_invocations = 0
+
+    @classmethod
+    def from_config(cls, config: dict, dense, lstm):
+        check_labels(config, dense.labels, [dense.model_path, lstm.model_path])
+        # null صريح → بدون شرط الحركة، والمفتاح غير موجود → القيمة الافتراضية (مثل التطبيق)
+        return cls(dense, lstm, config.get("dense_threshold", DEFAULT_DENSE_THRESHOLD),
+                   config.get("motion_threshold", DEFAULT_MOTION_THRESHOLD),
+                   config.get("dynamic_labels", ()))
+
+    @property
+    def lstm_rate(self) -> float:
+        return self.lstm_invocations / max(self.frames_classified, 1)
+
+    def needs_lstm(self, predicted, confidence, motion):
+        """
+        هل تُحال نتيجة Dense إلى LSTM؟ (تعمل على قيم مفردة أو مصفوفات)
+        """
+        return ((np.asarray(confidence) < self.dense_threshold)
+                | self.dynamic[np.asarray(predicted)]
+                | (np.asarray(motion) >= self.motion_threshold))
+
+    def classify(self, window):
+        """
+        window: آخر الإطارات (T, 63) - الإطار الحالي هو الأخير
+        المخرجات: (index, confidence, used_lstm)
+        """
+        window = np.asarray(window, dtype=np.float32)[-self.lstm.sequence_length:]
+        self.frames_classified += 1
+        predicted, confidence = self.dense.classify(window[-1])
+        if not self.needs_lstm(predicted, confidence, window_motion(window)):
+            return predicted, confidence, False
+        self.lstm_invocations += 1
+        predicted, confidence = self.lstm.classify_sequence(window)
+        return predicted, confidence, True
@@ -0,0 +1,52 @@
+"""
+واجهة سطر الأوامر الموحدة: python -m handspeak <command>
+
+كل أمر في وحدة مستقلة فيها add_arguments(parser) و run(args).
+الوحدات لا تستورد إلا مكتبات Python القياسية عند التحميل.
+"""
+
+import argparse
+import importlib
+
+from . import __version__
+
+# الأمر → (الوحدة، الوصف)
+COMMANDS = {
+    "train": ("train", "تدريب نموذج LSTM أو Dense وتحويله إلى TFLite"),
+    "train-parallel": ("distributed", "تدريب متوازي على عدة عمليات (CPU) + قياس التوسع"),
+    "export": ("export", "إنشاء نموذج TFLite تجريبي أو تحويل نموذج .keras"),
+    "download": ("download", "تحميل الصور (Google Drive / URLs) أو استخراج النقاط من dataset"),
+    "sync": ("sync", "نسخ الصور من مجلد محلي إلى assets/signs"),
+    "placeholders": ("placeholders", "إنشاء صور placeholder لجميع الإشارات"),
+    "ablation": ("ablation", "مقارنة مجموعات الميزات الهندسية وأحجام النماذج"),
+    "tune-cascade": ("tune_cascade", "اختيار حدود Cascade (Dense → LSTM) على تدفق تحقق"),
+    "frames": ("sequences", "دقة نموذج LSTM حسب عدد الإطارات المرئية"),
+    "verify": ("verify", "مقارنة مخرجات Keras و .tflite الجديد والنموذج الحالي في assets"),
+    "benchmark": ("benchmark", "قياس زمن الاستدلال لنموذج .tflite"),
+    "serve": ("server", "خادم استدلال محلي مع تجميع ديناميكي للطلبات"),
+    "loadgen": ("loadgen", "مولّد حمل لخادم serve (عدة تدفقات متزامنة)"),
+    "check-startup": ("startup", "التحقق من زمن بدء التشغيل والاستيرادات الثقيلة"),
+}
+
+
+def _load(command: str):
+    return importlib.import_module(f".{COMMANDS[command][0]}", __package__)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="handspeak", description="أدوات HandSpeak")
+    parser.add_argument('--version', action='version', version=f"%(prog)s {__version__}")
+    subparsers = parser.add_subparsers(dest="command", metavar="<command>")
+    for command, (_, description) in COMMANDS.items():
+        subparser = subparsers.add_parser(command, help=description, description=description)
+        _load(command).add_arguments(subparser)
+    return parser
+
+
+def main(argv=None) -> int:
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.command is None:
+        parser.print_help()
+        return 0
+    return _load(args.command).run(args) or 0
@@ -0,0 +1,389 @@
+"""
+handspeak train-parallel - تدريب متوازي على عدة عمليات (CPU فقط)
+
+model.fit في عملية واحدة لا يستفيد جيداً من كل الأنوية (طبقات LSTM تتوسع بشكل ضعيف
+مع intra-op threads)، لذلك نشغّل عدة عمليات على نفس الجهاز:
+
+- MultiWorkerMirroredStrategy عبر localhost (TF_CONFIG لكل عامل)
+- كل عامل يأخذ جزءاً مختلفاً من البيانات (shard) وعدداً محدداً من الـ threads،
+  ويُثبَّت على أنوية مختلفة عندما يكفي عددها
+- Checkpoints ونموذج TFLite النهائي يكتبها العامل الرئيسي (chief) فقط، وإعادة التشغيل
+  بنفس --run-dir تستأنف من آخر checkpoint (--fresh للبدء من جديد). الأوزان الأولية من
+  seed، وترتيب البيانات في كل epoch من seed ورقم الـ epoch فقط (وليس من موضع iterator
+  محفوظ)، وحالة مولّدات Dropout في الـ checkpoint: الاستئناف يعطي نفس نتيجة تدريب بدون انقطاع
+- إذا فشل أي عامل تُوقف البقية فوراً (وإلا ينتظر الـ chief الـ collectives إلى الأبد)
+- --scaling: نفس التدريب مع 1..N عامل وتقرير كفاءة التوسع (لاختيار حجم الأجهزة)
+
+Keras 3 لا يدعم model.fit مع MultiWorkerMirroredStrategy، لذلك حلقة التدريب
+مكتوبة يدوياً (strategy.run + distribute_datasets_from_function).
+
+الاستخدام:
+    python -m handspeak train-parallel --workers 4 --threads-per-worker 2
+    python -m handspeak train-parallel --scaling 1 2 4 --epochs 2 --json scaling.json
+"""
+
+import json
+import os
+import shutil
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from .paths import SCRIPTS_DIR
+
+DEFAULT_RUN_DIR = SCRIPTS_DIR / "training_runs" / "parallel"
+
+
+def add_arguments(parser):
+    parser.add_argument('--workers', type=int, default=2, help='عدد العمليات')
+    parser.add_argument('--threads-per-worker', type=int, default=None,
+                        help='عدد الـ threads لكل عامل (افتراضي: الأنوية ÷ العمال)')
+    parser.add_argument('--no-pin', action='store_true', help='بدون تثبيت العمال على أنوية محددة')
+    parser.add_argument('--arch', choices=("lstm", "dense"), default="lstm")
+    parser.add_argument('--samples', type=int, default=4800, help='عدد العينات الاصطناعية')
+    parser.add_argument('--epochs', type=int, default=3)
+    parser.add_argument('--batch-size', type=int, default=64, help='حجم الدفعة الكلي (لكل العمال)')
+    parser.add_argument('--sequence-length', type=int, default=10)
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--run-dir', type=str, default=str(DEFAULT_RUN_DIR),
+                        help='مجلد الـ checkpoints والسجلات')
+    parser.add_argument('--output', type=str, default=None,
+                        help='ملف .tflite (افتراضي: <run-dir>/arabic_sign_<arch>.tflite)')
+    parser.add_argument('--fresh', action='store_true',
+                        help='حذف checkpoints السابقة في --run-dir بدل الاستئناف منها')
+    parser.add_argument('--scaling', type=int, nargs='+', default=None,
+                        help='قياس التوسع لعدد العمال المحدد (بدون تصدير)')
+    parser.add_argument('--json', type=str, default=None, help='حفظ النتائج في ملف JSON')
+
+
+def available_cores() -> list:
+    if hasattr(os, "sched_getaffinity"):
+        return sorted(os.sched_getaffinity(0))
+    return list(range(os.cpu_count() or 1))
+
+
+def _free_ports(count: int) -> list:
+    sockets = []
+    try:
+        for _ in range(count):
+            s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            s.bind(("localhost", 0))
+            sockets.append(s)
+        return [s.getsockname()[1] for s in sockets]
+    finally:
+        for s in sockets:
+            s.close()
+
+
+# إعدادات يجب أن تطابق checkpoints السابقة للاستئناف (epochs يمكن زيادتها)
+RESUME_KEYS = ("arch", "samples", "batch_size", "sequence_length", "seed")
+POLL_SECONDS = 0.2
+
+
+def check_resume(run_dir: Path, job: dict, fresh: bool = False):
+    """
+    حذف checkpoints السابقة مع fresh، أو ValueError إذا كانت من إعدادات مختلفة
+    (استئنافها سيخلط تدريبين مختلفين)
+    """
+    checkpoint_dir = run_dir / "checkpoints"
+    if fresh:
+        shutil.rmtree(checkpoint_dir, ignore_errors=True)
+        return
+    job_file = run_dir / "job.json"
+    if not checkpoint_dir.exists() or not job_file.exists():
+        return
+    with open(job_file, 'r', encoding='utf-8') as f:
+        previous = json.load(f)
+    changed = [key for key in RESUME_KEYS if previous.get(key) != job.get(key)]
+    if changed:
+        raise ValueError(f"{run_dir} has checkpoints from a different job ({', '.join(changed)}) "
+                         f"- use --fresh or another --run-dir")
+
+
+def wait_all(processes: list) -> list:
+    """
+    انتظار كل العمال معاً: عند أول عامل يفشل تُوقف البقية فوراً
+    المخرجات: أرقام العمال الفاشلين
+    """
+    failed = []
+    running = dict(enumerate(process for process, _ in processes))
+    try:
+        while running and not failed:
+            for index, process in list(running.items()):
+                code = process.poll()
+                if code is None:
+                    continue
+                del running[index]
+                if code != 0:
+                    failed.append(index)
+            if running and not failed:
+                time.sleep(POLL_SECONDS)
+    finally:
+        # عامل فشل (أو Ctrl+C) → الباقون ينتظرون الـ collectives إلى الأبد
+        for process in running.values():
+            process.kill()
+            process.wait()
+        for _, log in processes:
+            log.close()
+    return failed
+
+
+def launch(job: dict, workers: int, run_dir: Path, threads_per_worker: int = None,
+           pin: bool = True, fresh: bool = False) -> dict:
+    """
+    تشغيل workers عملية وانتظارها (استئناف من checkpoints في run_dir إن وجدت)
+    المخرجات: نتائج كل عامل (من worker_<i>.json) + الإنتاجية الكلية
+    """
+    run_dir.mkdir(parents=True, exist_ok=True)
+    check_resume(run_dir, job, fresh)
+    cores = available_cores()
+    threads = threads_per_worker or max(1, len(cores) // workers)
+    pin = pin and threads * workers <= len(cores)
+    cluster = [f"localhost:{port}" for port in _free_ports(workers)]
+
+    job = {**job, "run_dir": str(run_dir), "workers": workers, "threads": threads}
+    job_file = run_dir / "job.json"
+    with open(job_file, 'w', encoding='utf-8') as f:
+        json.dump(job, f, ensure_ascii=False, indent=2)
+
+    processes = []
+    for index in range(workers):
+        env = {
+            **os.environ,
+            "TF_CONFIG": json.dumps({"cluster": {"worker": cluster},
+                                     "task": {"type": "worker", "index": index}}),
+            "TF_NUM_INTRAOP_THREADS": str(threads),
+            "TF_NUM_INTEROP_THREADS": "1",
+            "OMP_NUM_THREADS": str(threads),
+            "TF_CPP_MIN_LOG_LEVEL": "2",
+            "HANDSPEAK_CORES": ",".join(map(str, cores[index * threads:(index + 1) * threads]))
+            if pin else "",
+        }
+        log = open(run_dir / f"worker_{index}.log", 'w', encoding='utf-8')
+        processes.append((subprocess.Popen(
+            [sys.executable, "-m", "handspeak.distributed", str(job_file), str(index)],
+            cwd=SCRIPTS_DIR, env=env, stdout=log, stderr=subprocess.STDOUT), log))
+
+    failed = wait_all(processes)
+    if failed:
+        log_tail = (run_dir / f"worker_{failed[0]}.log").read_text(encoding='utf-8').splitlines()[-15:]
+        raise RuntimeError(f"worker {failed[0]} failed:\n" + "\n".join(log_tail))
+
+    results = []
+    for index in range(workers):
+        with open(run_dir / f"worker_{index}.json", 'r', encoding='utf-8') as f:
+            results.append(json.load(f))
+    chief = results[0]
+    # الإنتاجية بعد أول epoch (بدون زمن tf.function tracing) إذا أمكن
+    epoch_times = chief["epoch_seconds"][1:] or chief["epoch_seconds"]
+    samples_per_epoch = chief["train_samples"]
+    return {
+        "workers": workers,
+        "threads_per_worker": threads,
+        "pinned": pin,
+        "resumed_from_epoch": chief["resumed_from_epoch"],
+        "train_seconds": max(r["train_seconds"] for r in results),
+        "samples_per_sec": samples_per_epoch * len(epoch_times) / sum(epoch_times)
+        if epoch_times else None,
+        "final_loss": chief["losses"][-1] if chief["losses"] else None,
+        "val_accuracy": chief.get("val_accuracy"),
+        "tflite": chief.get("tflite"),
+        "worker_results": results,
+    }
+
+
+def scaling_report(results: list) -> list:
+    """
+    speedup / efficiency نسبة لأول تشغيل له إنتاجية مقاسة؛ التشغيل بدون epochs مقاسة
+    (samples_per_sec = None) يظهر بـ — بدل القيم
+    """
+    timed = [r for r in results if r["samples_per_sec"] is not None]
+    for r in results:
+        r["speedup"] = r["efficiency"] = None
+        if timed and r["samples_per_sec"] is not None:
+            r["speedup"] = r["samples_per_sec"] / timed[0]["samples_per_sec"]
+            r["efficiency"] = r["speedup"] * timed[0]["workers"] / r["workers"]
+    print(f"\n{'workers':>7} {'threads':>7} {'pinned':>6} {'time':>8} {'samples/s':>10} "
+          f"{'speedup':>8} {'efficiency':>10} {'loss':>7}")
+    print("-" * 72)
+    fmt = lambda v, spec: format(v, spec) if v is not None else "—"
+    for r in results:
+        speedup = fmt(r['speedup'], '.2f') + ("x" if r['speedup'] is not None else "")
+        print(f"{r['workers']:>7} {r['threads_per_worker']:>7} {'yes' if r['pinned'] else 'no':>6} "
+              f"{r['train_seconds']:>7.1f}s {fmt(r['samples_per_sec'], ',.0f'):>10} {speedup:>8} "
+              f"{fmt(r['efficiency'], '.0%'):>10} {fmt(r['final_loss'], '.3f'):>7}")
+    return results
+
+
+def run(args):
+    job = {"arch": args.arch, "samples": args.samples, "epochs": args.epochs,
+           "batch_size": args.batch_size, "sequence_length": args.sequence_length,
+           "seed": args.seed}
+    print(f"🖥️  {len(available_cores())} CPU core(s) available")
+
+    if args.scaling:
+        results = []
+        for workers in sorted(set(args.scaling)):
+            print(f"⏱️  Training with {workers} worker(s)...")
+            with tempfile.TemporaryDirectory() as run_dir:
+                results.append(launch({**job, "export": False}, workers, Path(run_dir),
+                                      args.threads_per_worker, not args.no_pin))
+        output = scaling_report(results)
+    else:
+        run_dir = Path(args.run_dir)
+        output_file = Path(args.output) if args.output else run_dir / f"arabic_sign_{args.arch}.tflite"
+        print(f"🚀 Training with {args.workers} worker(s) → {run_dir}")
+        try:
+            output = launch({**job, "export": True, "output": str(output_file.resolve())},
+                            args.workers, run_dir, args.threads_per_worker, not args.no_pin,
+                            args.fresh)
+        except ValueError as e:
+            print(f"❌ {e}")
+            return 2
+        except RuntimeError as e:
+            print(f"❌ {e}")
+            return 1
+        if output["resumed_from_epoch"]:
+            print(f"♻️  استئناف من epoch {output['resumed_from_epoch']}")
+        throughput = (f"{output['samples_per_sec']:,.0f} samples/s"
+                      if output["samples_per_sec"] is not None else "no epochs left")
+        print(f"✅ {output['train_seconds']:.1f}s | {throughput} | "
+              f"{output['workers']} × {output['threads_per_worker']} threads")
+        if output["val_accuracy"] is not None:
+            print(f"   دقة التحقق: {output['val_accuracy']:.2%}")
+        if output["tflite"]:
+            print(f"   📁 {output['tflite']}")
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(output, f, ensure_ascii=False, indent=2)
+        print(f"\n📄 Saved: {args.json}")
+    return 0
+
+
+# ---- العامل (يعمل في عملية منفصلة) ----
+
+def _worker_checkpoint_dir(run_dir: Path, index: int) -> Path:
+    """
+    كل العمال يجب أن يشاركوا في الحفظ (قد يتطلب collectives)،
+    لكن الـ chief فقط يكتب في المجلد الحقيقي والباقون في مجلد مؤقت يُحذف
+    """
+    return run_dir / "checkpoints" if index == 0 else run_dir / f".worker_{index}_tmp"
+
+
+def worker_main(job_file: str, index: int):
+    with open(job_file, 'r', encoding='utf-8') as f:
+        job = json.load(f)
+    cores = os.environ.get("HANDSPEAK_CORES")
+    if cores and hasattr(os, "sched_setaffinity"):
+        os.sched_setaffinity(0, {int(c) for c in cores.split(",")})
+
+    import numpy as np
+    import tensorflow as tf
+
+    from .landmarks import load_labels
+    from .models import convert_to_tflite, create_model, save_tflite
+    from .synthetic_data import make_dataset
+
+    tf.config.threading.set_intra_op_parallelism_threads(job["threads"])
+    tf.config.threading.set_inter_op_parallelism_threads(1)
+    strategy = tf.distribute.MultiWorkerMirroredStrategy()
+    is_chief = index == 0
+    run_dir = Path(job["run_dir"])
+
+    # نفس البيانات في كل عامل (نفس الـ seed)، وكل عامل يقرأ shard مختلفاً
+    num_classes = len(load_labels())
+    sequence_length = job["sequence_length"] if job["arch"] == "lstm" else None
+    X, y = make_dataset(job["samples"], num_classes, sequence_length, seed=job["seed"])
+    split = int(len(X) * 0.8)
+    X_train, y_train, X_val, y_val = X[:split], y[:split], X[split:], y[split:]
+    global_batch = job["batch_size"]
+    steps_per_epoch = len(X_train) // global_batch
+
+    def epoch_dataset(epoch: int):
+        """بيانات epoch واحد: الخلط بـ seed + epoch، فالاستئناف من أي epoch يعطي نفس الترتيب"""
+        def dataset_fn(context):
+            batch = context.get_per_replica_batch_size(global_batch)
+            dataset = tf.data.Dataset.from_tensor_slices((X_train, y_train))
+            dataset = dataset.shard(context.num_input_pipelines, context.input_pipeline_id)
+            return dataset.shuffle(len(X_train), seed=job["seed"] + epoch).repeat() \
+                .batch(batch, drop_remainder=True).prefetch(2)
+        return strategy.distribute_datasets_from_function(dataset_fn)
+
+    tf.keras.utils.set_random_seed(job["seed"])  # نفس الأوزان الأولية في كل تشغيل
+    with strategy.scope():
+        model = create_model(job["arch"], num_classes, job["sequence_length"])
+        optimizer = tf.keras.optimizers.Adam()
+        optimizer.build(model.trainable_variables)
+        loss_fn = tf.keras.losses.CategoricalCrossentropy(reduction="none")
+        # حالة مولّدات Dropout أيضاً: الاستئناف يكمل نفس الأقنعة العشوائية
+        dropout_rng = [layer.seed_generator.state.value for layer in model.layers
+                       if hasattr(layer, "seed_generator")]
+        checkpoint = tf.train.Checkpoint(model=model, optimizer=optimizer, dropout_rng=dropout_rng)
+
+    @tf.function
+    def train_step(iterator):
+        def replica_step(x, labels):
+            with tf.GradientTape() as tape:
+                predictions = model(x, training=True)
+                loss = tf.nn.compute_average_loss(loss_fn(labels, predictions),
+                                                  global_batch_size=global_batch)
+            gradients = tape.gradient(loss, model.trainable_variables)
+            optimizer.apply_gradients(zip(gradients, model.trainable_variables))
+            return loss
+        losses = strategy.run(replica_step, args=next(iterator))
+        return strategy.reduce(tf.distribute.ReduceOp.SUM, losses, axis=None)
+
+    checkpoint_dir = _worker_checkpoint_dir(run_dir, index)
+    manager = tf.train.CheckpointManager(checkpoint, str(checkpoint_dir), max_to_keep=2)
+    # كل العمال يستعيدون نفس checkpoint الـ chief (ckpt-<epochs المكتملة>)
+    latest = tf.train.latest_checkpoint(str(_worker_checkpoint_dir(run_dir, 0)))
+    start_epoch = 0
+    if latest:
+        checkpoint.restore(latest)
+        start_epoch = int(latest.rsplit("-", 1)[1])
+
+    epoch_seconds, losses = [], []
+    train_start = time.perf_counter()
+    for epoch in range(start_epoch, job["epochs"]):
+        start = time.perf_counter()
+        iterator = iter(epoch_dataset(epoch))
+        total = 0.0
+        for _ in range(steps_per_epoch):
+            total += float(train_step(iterator))
+        epoch_seconds.append(time.perf_counter() - start)
+        losses.append(total / steps_per_epoch)
+        manager.save(checkpoint_number=epoch + 1)
+        if not is_chief:
+            shutil.rmtree(checkpoint_dir, ignore_errors=True)
+        if is_chief:
+            print(f"Epoch {epoch + 1}/{job['epochs']} - loss {losses[-1]:.4f} - "
+                  f"{epoch_seconds[-1]:.1f}s", flush=True)
+    train_seconds = time.perf_counter() - train_start
+
+    result = {
+        "index": index,
+        "resumed_from_epoch": start_epoch,
+        "train_seconds": train_seconds,
+        "epoch_seconds": epoch_seconds,
+        "losses": losses,
+        "train_samples": steps_per_epoch * global_batch,
+    }
+    if is_chief:
+        # استدعاء مباشر وليس model.predict: predict يوزّع العمل على العمال (collectives)
+        # بينما انتهى الباقون
+        predictions = np.concatenate([model(X_val[i:i + 256], training=False).numpy()
+                                      for i in range(0, len(X_val), 256)])
+        result["val_accuracy"] = float((predictions.argmax(1) == y_val.argmax(1)).mean())
+        if job.get("export"):
+            result["tflite"] = str(save_tflite(convert_to_tflite(model), job["output"]))
+
+    with open(run_dir / f"worker_{index}.json", 'w', encoding='utf-8') as f:
+        json.dump(result, f, indent=2)
+
+
+if __name__ == "__main__":
+    worker_main(sys.argv[1], int(sys.argv[2]))
@@ -0,0 +1,147 @@
+"""
+handspeak download - تحميل صور الإشارات أو استخراج نقاط اليد من dataset
+
+المصادر:
+- --folder-id: مجلد كامل من Google Drive (مشترك مع Anyone with the link)
+- --file-id + --folder + --index: ملف واحد من Google Drive
+- --config: ملف JSON فيه folder_id أو قائمة files [{id, folder, index}]
+- --urls: ملف JSON بالصيغة {"alef": ["url1", "url2"], ...}
+- --dataset-path: مجلد dataset محلي (مثل RGB_ArSL_dataset) → CSV لبيانات التدريب
+"""
+
+import json
+from pathlib import Path
+
+from .paths import SIGNS_DIR
+
+
+def add_arguments(parser):
+    parser.add_argument('--folder-id', type=str, help='Google Drive Folder ID')
+    parser.add_argument('--file-id', type=str, help='Google Drive File ID (للملف الواحد)')
+    parser.add_argument('--folder', type=str, help='اسم المجلد (مع --file-id)')
+    parser.add_argument('--index', type=int, default=1, help='رقم الصورة (مع --file-id)')
+    parser.add_argument('--config', type=str, help='ملف JSON (folder_id أو files)')
+    parser.add_argument('--urls', type=str, help='ملف JSON: {"alef": ["url1", ...]}')
+    parser.add_argument('--dataset-path', type=str, help='مجلد dataset محلي لاستخراج النقاط')
+    parser.add_argument('--csv', type=str, default="training_data/dataset_landmarks.csv",
+                        help='ملف CSV الناتج (مع --dataset-path)')
+    parser.add_argument('--backend', choices=("mediapipe", "fake"), default="mediapipe",
+                        help='كاشف اليد (مع --dataset-path)')
+    parser.add_argument('--model-path', type=str, default="hand_landmarker.task",
+                        help='نموذج MediaPipe HandLandmarker (مع --dataset-path)')
+    parser.add_argument('--output', type=str, default=str(SIGNS_DIR), help='مجلد الصور')
+
+
+def download_folder_from_drive(folder_id: str, output_dir: Path) -> bool:
+    """تحميل مجلد كامل من Google Drive"""
+    import gdown
+
+    try:
+        url = f"https://drive.google.com/drive/folders/{folder_id}"
+        print(f"📥 جاري التحميل من Google Drive...")
+        print(f"🔗 الرابط: {url}")
+        print("=" * 60)
+        gdown.download_folder(url, output=str(output_dir), quiet=False, use_cookies=False)
+        print("=" * 60)
+        print(f"✅ تم التحميل بنجاح!")
+        print(f"📁 الموقع: {output_dir}")
+        return True
+    except Exception as e:
+        print(f"❌ خطأ في التحميل: {e}")
+        print("\n💡 نصائح:")
+        print("   1. تأكد من أن المجلد مشترك (Anyone with the link)")
+        print("   2. تأكد من صحة Folder ID")
+        print("   3. جرب تثبيت gdown: pip install gdown")
+        return False
+
+
+def download_file_from_drive(file_id: str, output_path: Path) -> bool:
+    """تحميل ملف واحد من Google Drive"""
+    import gdown
+
+    try:
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        gdown.download(f"https://drive.google.com/uc?id={file_id}", str(output_path), quiet=False)
+        print(f"✅ تم تحميل: {output_path.parent.name}/{output_path.name}")
+        return True
+    except Exception as e:
+        print(f"❌ Error downloading {file_id}: {e}")
+        return False
+
+
+def download_from_url(image_url: str, output_path: Path) -> bool:
+    """تحميل صورة من URL"""
+    import requests
+
+    try:
+        response = requests.get(image_url, timeout=10)
+        if response.status_code == 200:
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(output_path, 'wb') as f:
+                f.write(response.content)
+            print(f"✅ Downloaded: {output_path}")
+            return True
+        print(f"❌ Failed to download: {image_url} (Status: {response.status_code})")
+        return False
+    except Exception as e:
+        print(f"❌ Error downloading {image_url}: {e}")
+        return False
+
+
+def download_from_config(config_file: str, output_dir: Path) -> bool:
+    with open(config_file, 'r', encoding='utf-8') as f:
+        config = json.load(f)
+    if 'folder_id' in config:
+        return download_folder_from_drive(config['folder_id'], output_dir)
+    ok = True
+    for file_info in config.get('files', []):
+        output_path = output_dir / file_info['folder'] / f"{file_info.get('index', 1)}.png"
+        ok = download_file_from_drive(file_info['id'], output_path) and ok
+    return ok
+
+
+def download_from_urls(urls_file: str, output_dir: Path) -> bool:
+    with open(urls_file, 'r', encoding='utf-8') as f:
+        urls = json.load(f)
+    ok = True
+    for folder, folder_urls in urls.items():
+        for index, url in enumerate(folder_urls, start=1):
+            ok = download_from_url(url, output_dir / folder / f"{index}.png") and ok
+    return ok
+
+
+def extract_from_dataset(dataset_path: str, output_csv: str, backend: str, model_path: str) -> bool:
+    """استخراج نقاط اليد من dataset محلي إلى بيانات تدريب (extract_landmarks)"""
+    if not Path(dataset_path).exists():
+        print(f"❌ المجلد غير موجود: {dataset_path}")
+        return False
+    print(f"📁 Found local dataset: {dataset_path}")
+    from .extract_landmarks import extract_dataset
+
+    backend_options = {"model_path": model_path} if backend == "mediapipe" else {}
+    try:
+        extract_dataset(Path(dataset_path), Path(output_csv),
+                        backend_name=backend, backend_options=backend_options)
+    except FileNotFoundError as e:
+        print(f"❌ {e}")
+        return False
+    return True
+
+
+def run(args):
+    output_dir = Path(args.output)
+    if args.dataset_path:
+        ok = extract_from_dataset(args.dataset_path, args.csv, args.backend, args.model_path)
+    elif args.config:
+        ok = download_from_config(args.config, output_dir)
+    elif args.urls:
+        ok = download_from_urls(args.urls, output_dir)
+    elif args.folder_id:
+        ok = download_folder_from_drive(args.folder_id, output_dir)
+    elif args.file_id and args.folder:
+        ok = download_file_from_drive(args.file_id, output_dir / args.folder / f"{args.index}.png")
+    else:
+        print("❌ يرجى تحديد --folder-id أو --config أو --urls أو --dataset-path "
+              "أو (--file-id + --folder + --index)")
+        return 2
+    return 0 if ok else 1
@@ -0,0 +1,146 @@
+"""
+handspeak export - إنشاء نموذج TFLite تجريبي أو تحويل نموذج Keras محفوظ
+
+- بدون --keras: نموذج تجريبي (Dense أو LSTM) مدرّب epoch واحد على بيانات عشوائية،
+  يسمح باختبار التطبيق قبل تدريب النموذج الحقيقي (بديل create_dummy_model.py
+  و create_dense_model.py)
+- مع --keras: تحويل نموذج .keras موجود إلى .tflite
+- مع --run-dir: تحويل أفضل نموذج من تشغيل train --run-dir (best.keras)،
+  ويمكن إعادته في أي وقت بدون إعادة التدريب
+
+بعد التحويل يتم التحقق من الملفات (verify.py): عدد المخرجات = labels.json، ومطابقة
+Keras ↔ .tflite، والمقارنة مع النموذج الحالي في assets (--no-verify للتخطي)
+"""
+
+from pathlib import Path
+
+from .paths import SCRIPTS_DIR
+
+
+def add_arguments(parser):
+    parser.add_argument('--arch', choices=("lstm", "dense"), default="dense",
+                        help='نوع النموذج التجريبي (افتراضي: dense)')
+    parser.add_argument('--classes', type=int, default=None,
+                        help='عدد التصنيفات (افتراضي: عدد labels.json)')
+    parser.add_argument('--keras', type=str, default=None, help='تحويل نموذج .keras محفوظ')
+    parser.add_argument('--run-dir', type=str, default=None,
+                        help='تحويل best.keras من مجلد تشغيل train --run-dir')
+    parser.add_argument('--export-lengths', type=int, nargs='+', default=None,
+                        help='LSTM بطول متغير: ملف لكل طول ثابت بدل البعد الديناميكي')
+    parser.add_argument('--output', type=str, default=None,
+                        help='ملف .tflite (افتراضي: scripts/arabic_sign_<arch>.tflite)')
+    parser.add_argument('--samples', type=int, default=100, help='عدد العينات العشوائية')
+    add_verify_arguments(parser)
+
+
+def add_verify_arguments(parser):
+    """خيارات بوابة التحقق بعد التحويل (مشتركة مع train)"""
+    from .verify import add_gate_arguments
+
+    parser.add_argument('--no-verify', action='store_true', help='تخطي التحقق بعد التحويل')
+    add_gate_arguments(parser)
+
+
+def verify_files(args, files: list, model) -> bool:
+    """بوابة التحقق على الملفات المصدّرة (True إذا نجحت أو تم تخطيها)"""
+    if args.no_verify:
+        return True
+    from .verify import verify_export
+
+    return verify_export(files, model, max_diff=args.max_diff, min_agreement=args.min_agreement,
+                         min_reference_agreement=args.min_reference_agreement,
+                         max_ties=args.max_ties, allow_skip=args.allow_skip)["passed"]
+
+
+def build_dummy_model(arch: str, num_classes: int, samples: int = 100):
+    """نموذج تجريبي: تدريب epoch واحد على بيانات عشوائية (للتأكد من أن النموذج يعمل)"""
+    import numpy as np
+
+    from .landmarks import INPUT_SIZE, SEQUENCE_LENGTH
+    from .models import compile_model, create_model
+
+    model = compile_model(create_model(arch, num_classes))
+    print("\n📊 ملخص النموذج:")
+    model.summary()
+
+    print("\n🧪 إنشاء بيانات تجريبية...")
+    shape = (samples, SEQUENCE_LENGTH, INPUT_SIZE) if arch == "lstm" else (samples, INPUT_SIZE)
+    X_dummy = np.random.rand(*shape).astype(np.float32)
+    y_dummy = np.random.rand(samples, num_classes).astype(np.float32)
+    y_dummy = y_dummy / y_dummy.sum(axis=1, keepdims=True)  # Normalize to probabilities
+
+    print("🏋️ تدريب تجريبي...")
+    model.fit(X_dummy, y_dummy, epochs=1, batch_size=32, verbose=1)
+    return model
+
+
+def is_variable_length_model(model) -> bool:
+    """LSTM بطول متغير (train --variable-length): بعد زمني None أو طبقة Masking"""
+    from .models import is_sequence_model
+
+    return is_sequence_model(model) and (
+        model.inputs[0].shape[1] is None
+        or any(layer.__class__.__name__ == "Masking" for layer in model.layers))
+
+
+def export_model(model, output_file, export_lengths: list = None) -> list:
+    """
+    تحويل نموذج Keras إلى TFLite وحفظه
+    LSTM بطول متغير → export_lstm_model: ملف ببعد زمني ديناميكي [1, -1, 63]،
+    أو ملف لكل طول في export_lengths (arabic_sign_lstm_t4.tflite، ...)
+    المخرجات: الملفات المحفوظة
+    """
+    from .models import convert_to_tflite, export_lstm_model, save_tflite
+
+    output_file = Path(output_file)
+    if not is_variable_length_model(model):
+        return [save_tflite(convert_to_tflite(model), output_file)]
+    if not export_lengths:
+        return [save_tflite(convert_to_tflite(export_lstm_model(model)), output_file)]
+    return [save_tflite(convert_to_tflite(export_lstm_model(model, length)),
+                        output_file.with_name(f"{output_file.stem}_t{length}{output_file.suffix}"))
+            for length in export_lengths]
+
+
+def run(args):
+    from .models import MODEL_FILES
+
+    if args.run_dir:
+        from .runs import BEST_MODEL_FILE, load_state
+
+        args.keras = str(Path(args.run_dir) / BEST_MODEL_FILE)
+        if not Path(args.keras).exists():
+            print(f"❌ لا يوجد {BEST_MODEL_FILE} في {args.run_dir} (لم يكتمل أي epoch بعد)")
+            return 1
+        if not args.output:
+            arch = load_state(args.run_dir)["config"]["arch"]
+            args.output = str(SCRIPTS_DIR / MODEL_FILES[arch])
+
+    if args.keras:
+        import tensorflow as tf
+
+        print(f"📥 تحميل النموذج: {args.keras}")
+        model = tf.keras.models.load_model(args.keras)
+        output_file = Path(args.output) if args.output else Path(args.keras).with_suffix('.tflite')
+    else:
+        num_classes = args.classes
+        if num_classes is None:
+            from .landmarks import load_labels
+            num_classes = len(load_labels())
+        print(f"🔧 إنشاء نموذج {args.arch.upper()} تجريبي ({num_classes} تصنيف)...")
+        model = build_dummy_model(args.arch, num_classes, args.samples)
+        output_file = Path(args.output) if args.output else SCRIPTS_DIR / MODEL_FILES[args.arch]
+
+    print("\n🔄 تحويل إلى TFLite...")
+    files = export_model(model, output_file, args.export_lengths)
+    if not verify_files(args, files, model):
+        return 1
+
+    if not args.keras:
+        print(f"\n⚠️  ملاحظة: هذا نموذج تجريبي للاختبار فقط!")
+        print(f"   للحصول على نتائج دقيقة، قم بتدريب النموذج على البيانات الفعلية.")
+    print(f"\n📋 الخطوة التالية:")
+    print(f"   1. انسخ الملف إلى: app/src/main/assets/{output_file.name}")
+    print(f"   2. قم بـ Clean و Rebuild للمشروع")
+    print(f"   3. اختبر التطبيق")
+    return 0
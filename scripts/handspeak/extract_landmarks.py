@@ -0,0 +1,396 @@
+#!/usr/bin/env python3
+"""
+استخراج نقاط اليد (21 landmark) من مجموعة صور/فيديوهات إلى بيانات تدريب
+
+يحوّل مجلد بيانات مثل RGB_ArSL_dataset (مجلد لكل تصنيف) إلى ملف CSV
+بنفس صيغة AdaptiveLearningHelper (label + 63 قيمة + timestamp).
+
+- المعالجة متوازية عبر Process Pool (كاشف واحد لكل عملية)
+- النتائج محفوظة في Cache حسب SHA-256 لمحتوى الملف، لذلك إعادة التشغيل
+  تعالج الصور الجديدة فقط
+- تقرير لكل صورة: detected / failed / error
+
+الاستخدام:
+    python -m handspeak.extract_landmarks --dataset "C:/path/to/RGB_ArSL_dataset" \\
+        --backend mediapipe --model hand_landmarker.task
+
+    # للاختبار بدون MediaPipe:
+    python -m handspeak.extract_landmarks --dataset ./dataset --backend fake
+
+المتطلبات:
+    pip install numpy pillow mediapipe
+    (opencv-python للفيديو فقط)
+"""
+
+import argparse
+import csv
+import hashlib
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+
+from .landmarks import NUM_LANDMARKS, csv_header, csv_row, load_folder_label_map
+
+IMAGE_EXTENSIONS = {'.png', '.jpg', '.jpeg', '.bmp', '.webp'}
+VIDEO_EXTENSIONS = {'.mp4', '.avi', '.mov', '.mkv'}
+
+# نفس إعدادات HandDetectionHelper
+MIN_DETECTION_CONFIDENCE = 0.5
+MIN_TRACKING_CONFIDENCE = 0.5
+
+CACHE_FILE_NAME = "landmarks_cache.jsonl"
+REPORT_FILE_NAME = "extraction_report.csv"
+
+
+class MediaPipeBackend:
+    """
+    كاشف MediaPipe Hand Landmarker (نفس نموذج التطبيق hand_landmarker.task)
+    يجب توفير ملف النموذج محلياً عبر --model
+    """
+
+    name = "mediapipe"
+
+    def __init__(self, model_path: str):
+        import mediapipe as mp
+        from mediapipe.tasks import python as mp_python
+        from mediapipe.tasks.python import vision
+
+        if not Path(model_path).exists():
+            raise FileNotFoundError(f"Hand landmarker model not found: {model_path}")
+
+        self._mp = mp
+        options = vision.HandLandmarkerOptions(
+            base_options=mp_python.BaseOptions(model_asset_path=str(model_path)),
+            running_mode=vision.RunningMode.IMAGE,
+            num_hands=1,
+            min_hand_detection_confidence=MIN_DETECTION_CONFIDENCE,
+            min_tracking_confidence=MIN_TRACKING_CONFIDENCE,
+        )
+        self._landmarker = vision.HandLandmarker.create_from_options(options)
+
+    def detect(self, rgb: np.ndarray):
+        """يعيد مصفوفة (21, 3) أو None إذا لم يتم اكتشاف يد"""
+        image = self._mp.Image(image_format=self._mp.ImageFormat.SRGB,
+                               data=np.ascontiguousarray(rgb))
+        result = self._landmarker.detect(image)
+        if not result.hand_landmarks:
+            return None
+        return np.array([[p.x, p.y, p.z] for p in result.hand_landmarks[0]],
+                        dtype=np.float32)
+
+    def close(self):
+        self._landmarker.close()
+
+
+class FakeBackend:
+    """
+    كاشف وهمي للاختبار: نقاط ثابتة مشتقة من محتوى الصورة
+    fail_rate يحدد نسبة الصور التي "تفشل" في الاكتشاف
+    """
+
+    name = "fake"
+
+    def __init__(self, fail_rate: float = 0.0):
+        self.fail_rate = fail_rate
+
+    def detect(self, rgb: np.ndarray):
+        digest = hashlib.sha256(np.ascontiguousarray(rgb).tobytes()).digest()
+        if digest[0] < int(self.fail_rate * 256):
+            return None
+        rng = np.random.default_rng(int.from_bytes(digest[:8], 'little'))
+        points = rng.random((NUM_LANDMARKS, 3), dtype=np.float32)
+        points[:, 2] = (points[:, 2] - 0.5) * 0.2  # z نسبي صغير مثل MediaPipe
+        return points
+
+    def close(self):
+        pass
+
+
+BACKENDS = {
+    "mediapipe": MediaPipeBackend,
+    "fake": FakeBackend,
+}
+
+
+def create_backend(name: str, options: dict):
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown backend: {name} (available: {', '.join(BACKENDS)})")
+    return BACKENDS[name](**options)
+
+
+def file_digest(path: Path) -> str:
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def cache_namespace(name: str, options: dict) -> str:
+    """
+    مفتاح يميّز الـ Backend وإعداداته حتى لا تختلط النتائج في الـ Cache
+
+    model_path يُستبدل ببصمة محتوى الملف: نموذج مُعاد تدريبه بنفس الاسم يبدأ Cache جديداً
+    """
+    options = dict(options)
+    if "model_path" in options:
+        options["model_sha256"] = file_digest(Path(options.pop("model_path")))
+    return f"{name}:{json.dumps(options, sort_keys=True)}"
+
+
+def decode_image(path: Path) -> np.ndarray:
+    from PIL import Image
+
+    with Image.open(path) as img:
+        return np.asarray(img.convert('RGB'))
+
+
+def decode_video(path: Path, stride: int):
+    """يعيد إطارات الفيديو (RGB) كل stride إطار"""
+    import cv2
+
+    capture = cv2.VideoCapture(str(path))
+    index = 0
+    try:
+        while True:
+            ok, frame = capture.read()
+            if not ok:
+                break
+            if index % stride == 0:
+                yield index, cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+            index += 1
+    finally:
+        capture.release()
+
+
+# ---- Worker (عملية منفصلة، كاشف واحد لكل عملية) ----
+
+_worker_backend = None
+
+
+def _init_worker(backend_name: str, backend_options: dict):
+    global _worker_backend
+    _worker_backend = create_backend(backend_name, backend_options)
+
+
+def _extract_file(task):
+    """
+    معالجة ملف واحد داخل الـ Worker
+    المخرجات: (digest, frames, error) حيث frames = [[frame_index, landmarks|None], ...]
+    """
+    path, digest, video_stride = task
+    path = Path(path)
+    try:
+        if path.suffix.lower() in VIDEO_EXTENSIONS:
+            frames = []
+            for index, rgb in decode_video(path, video_stride):
+                points = _worker_backend.detect(rgb)
+                frames.append([index, None if points is None else points.tolist()])
+        else:
+            points = _worker_backend.detect(decode_image(path))
+            frames = [[0, None if points is None else points.tolist()]]
+        return digest, frames, None
+    except Exception as e:
+        return digest, None, f"{type(e).__name__}: {e}"
+
+
+# ---- Cache ----
+
+def load_cache(cache_file: Path, namespace: str) -> dict:
+    """قراءة الـ Cache (JSON Lines) للـ Backend المحدد فقط"""
+    cache = {}
+    if not cache_file.exists():
+        return cache
+    with open(cache_file, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError:
+                continue  # سطر ناقص من تشغيل سابق انقطع
+            if entry.get("backend") == namespace:
+                cache[entry["sha256"]] = entry["frames"]
+    return cache
+
+
+# ---- Pipeline ----
+
+def discover_files(dataset_dir: Path, folder_map: dict):
+    """
+    البحث عن الصور/الفيديوهات: المجلد الأول تحت dataset_dir هو اسم التصنيف
+    المخرجات: قائمة (path, label)
+    """
+    items = []
+    extensions = IMAGE_EXTENSIONS | VIDEO_EXTENSIONS
+    for path in sorted(dataset_dir.rglob('*')):
+        if not path.is_file() or path.suffix.lower() not in extensions:
+            continue
+        relative = path.relative_to(dataset_dir)
+        if len(relative.parts) < 2:
+            continue  # ملفات بدون مجلد تصنيف
+        folder = relative.parts[0]
+        items.append((path, folder_map.get(folder.lower(), folder)))
+    return items
+
+
+def extract_dataset(dataset_dir: Path, output_csv: Path, backend_name: str = "fake",
+                    backend_options: dict = None, workers: int = None,
+                    cache_file: Path = None, report_file: Path = None,
+                    folder_map: dict = None, video_stride: int = 5):
+    """
+    استخراج النقاط من مجلد البيانات وكتابة ملف التدريب والتقرير
+
+    المخرجات: dict بالإحصائيات (detected, failed, error, cached, processed)
+    FileNotFoundError إذا لم يوجد ملف النموذج (قبل إنشاء العمليات: فشل الـ initializer
+    داخل ProcessPoolExecutor يظهر فقط كـ BrokenProcessPool بدون السبب)
+    """
+    dataset_dir = Path(dataset_dir)
+    output_csv = Path(output_csv)
+    backend_options = backend_options or {}
+    model_path = backend_options.get("model_path")
+    if model_path is not None and not Path(model_path).is_file():
+        raise FileNotFoundError(f"Hand landmarker model not found: {model_path}")
+    cache_file = Path(cache_file) if cache_file else output_csv.parent / CACHE_FILE_NAME
+    report_file = Path(report_file) if report_file else output_csv.parent / REPORT_FILE_NAME
+    if folder_map is None:
+        folder_map = load_folder_label_map()
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    namespace = cache_namespace(backend_name, backend_options)
+    cache = load_cache(cache_file, namespace)
+
+    items = discover_files(dataset_dir, folder_map)
+    print(f"📁 Found {len(items)} files in {dataset_dir}")
+
+    digests = [file_digest(path) for path, _ in items]
+    pending = {}
+    for (path, _), digest in zip(items, digests):
+        if digest not in cache and digest not in pending:
+            pending[digest] = (str(path), digest, video_stride)
+
+    print(f"⚡ Cached: {len(items) - len(pending)} | New: {len(pending)}")
+
+    errors = {}
+    cache_file.parent.mkdir(parents=True, exist_ok=True)
+    if pending:
+        tasks = list(pending.values())
+        with open(cache_file, 'a', encoding='utf-8') as cache_out:
+            if workers <= 1:
+                _init_worker(backend_name, backend_options)
+                results = map(_extract_file, tasks)
+            else:
+                executor = ProcessPoolExecutor(
+                    max_workers=workers,
+                    initializer=_init_worker,
+                    initargs=(backend_name, backend_options),
+                )
+                chunksize = max(1, len(tasks) // (workers * 8))
+                results = executor.map(_extract_file, tasks, chunksize=chunksize)
+            try:
+                for done, (digest, frames, error) in enumerate(results, start=1):
+                    if error is not None:
+                        errors[digest] = error  # الأخطاء لا تُحفظ في الـ Cache
+                    else:
+                        cache[digest] = frames
+                        entry = {"backend": namespace, "sha256": digest, "frames": frames}
+                        cache_out.write(json.dumps(entry) + "\n")
+                    if done % 100 == 0 or done == len(tasks):
+                        cache_out.flush()
+                        print(f"   🔄 {done}/{len(tasks)}")
+            finally:
+                if workers > 1:
+                    executor.shutdown()
+
+    stats = {"detected": 0, "failed": 0, "error": 0,
+             "cached": len(items) - len(pending), "processed": len(pending)}
+    output_csv.parent.mkdir(parents=True, exist_ok=True)
+    with open(output_csv, 'w', encoding='utf-8', newline='') as data_out, \
+            open(report_file, 'w', encoding='utf-8', newline='') as report_out:
+        data_writer = csv.writer(data_out)
+        report_writer = csv.writer(report_out)
+        data_writer.writerow(csv_header())
+        report_writer.writerow(["path", "label", "frame", "status", "sha256", "message"])
+
+        for (path, label), digest in zip(items, digests):
+            relative = path.relative_to(dataset_dir).as_posix()
+            if digest in errors:
+                stats["error"] += 1
+                report_writer.writerow([relative, label, "", "error", digest, errors[digest]])
+                continue
+            for frame_index, points in cache[digest]:
+                if points is None:
+                    stats["failed"] += 1
+                    report_writer.writerow([relative, label, frame_index, "failed", digest,
+                                            "no hand detected"])
+                else:
+                    stats["detected"] += 1
+                    data_writer.writerow(csv_row(points, label))
+                    report_writer.writerow([relative, label, frame_index, "detected", digest, ""])
+
+    print(f"✅ Detected: {stats['detected']} | ❌ Failed: {stats['failed']} | "
+          f"⚠️  Errors: {stats['error']}")
+    print(f"📄 Training data: {output_csv}")
+    print(f"📋 Report: {report_file}")
+    return stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description='استخراج نقاط اليد من مجموعة صور/فيديوهات')
+    parser.add_argument('--dataset', type=str, required=True,
+                        help='مجلد البيانات (مجلد لكل تصنيف)')
+    parser.add_argument('--output', type=str, default='training_data/dataset_landmarks.csv',
+                        help='ملف CSV الناتج (صيغة AdaptiveLearningHelper)')
+    parser.add_argument('--backend', type=str, default='mediapipe', choices=sorted(BACKENDS),
+                        help='كاشف النقاط')
+    parser.add_argument('--model', type=str, default='hand_landmarker.task',
+                        help='ملف hand_landmarker.task (مع mediapipe)')
+    parser.add_argument('--fail-rate', type=float, default=0.0,
+                        help='نسبة الفشل للكاشف الوهمي (مع fake)')
+    parser.add_argument('--workers', type=int, default=None,
+                        help='عدد العمليات (افتراضي: عدد الأنوية)')
+    parser.add_argument('--cache', type=str, default=None,
+                        help=f'ملف الـ Cache (افتراضي: {CACHE_FILE_NAME} بجانب الناتج)')
+    parser.add_argument('--report', type=str, default=None,
+                        help=f'ملف التقرير (افتراضي: {REPORT_FILE_NAME} بجانب الناتج)')
+    parser.add_argument('--label-map', type=str, default=None,
+                        help='JSON: اسم المجلد → التصنيف (افتراضي: من sign_map.json)')
+    parser.add_argument('--video-stride', type=int, default=5,
+                        help='معالجة إطار واحد كل N إطار من الفيديو')
+
+    args = parser.parse_args()
+
+    if args.backend == 'mediapipe':
+        backend_options = {"model_path": args.model}
+    else:
+        backend_options = {"fail_rate": args.fail_rate}
+
+    folder_map = None
+    if args.label_map:
+        with open(args.label_map, 'r', encoding='utf-8') as f:
+            folder_map = {k.lower(): v for k, v in json.load(f).items()}
+
+    try:
+        extract_dataset(
+            Path(args.dataset),
+            Path(args.output),
+            backend_name=args.backend,
+            backend_options=backend_options,
+            workers=args.workers,
+            cache_file=args.cache,
+            report_file=args.report,
+            folder_map=folder_map,
+            video_stride=args.video_stride,
+        )
+    except FileNotFoundError as e:
+        print(f"❌ {e}")
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
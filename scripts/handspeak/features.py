@@ -0,0 +1,173 @@
+"""
+مرحلة ميزات هندسية محسوبة مسبقاً (Vectorized على دفعات كاملة)
+
+النموذج الحالي يأخذ 63 إحداثية مطبّعة فقط، فيتعلم بنفسه الثبات أمام الدوران
+والحجم وشكل اليد. هذه الميزات تعطيه ذلك مباشرة لتجربة نماذج أصغر (handspeak ablation).
+
+المدخلات: إطارات مطبّعة مثل التطبيق (..., 63) - إطار (N, 63) أو تسلسلات (N, T, 63)،
+ونقاط MediaPipe الخام بنفس الشكل للكتل الهندسية (palm، distances، angles):
+التطبيع يقسم x و y على مدى مختلف لكل محور، وهذا يغيّر الزوايا والمسافات مع دوران اليد.
+المخرجات: (..., D) float32، D حسب مجموعة الميزات
+
+الكتل (الترتيب داخل كل كتلة ثابت):
+- raw (63): الإحداثيات كما هي x0, y0, z0, x1, ... (مدخل النموذج الحالي)
+- palm (60): إحداثيات نسبية للكف للنقاط 1..20 (المعصم = الأصل دائماً فيُحذف):
+  إزاحة إلى المعصم، دوران في مستوى الصورة بحيث المعصم → قاعدة الوسطى (9) = +y،
+  وقسمة على حجم اليد (RMS لبعد النقاط عن المعصم) → ثبات أمام الموقع والدوران والحجم.
+  (طول الكف وحده يقترب من الصفر عندما تشير اليد نحو الكاميرا)
+- distances (210): المسافة بين كل زوج نقاط (i < j بترتيب np.triu_indices(21, 1))
+  في إحداثيات الكف
+- angles (15): زاوية انثناء كل مفصل بالراديان (0 = مستقيم)، لكل إصبع
+  (الإبهام، السبابة، الوسطى، البنصر، الخنصر) × (المفصل 1، 2، 3)
+- velocity (63): الفرق بين إحداثيات raw وإطارها السابق (الإطار الأول = 0)
+  - للتسلسلات فقط
+
+مجموعة الميزات = كتلة أو عدة كتل بـ "+" (مثل palm+angles) أو اسم من FEATURE_SETS،
+والكتل تُضم بنفس الترتيب المكتوب.
+"""
+
+import numpy as np
+
+from .landmarks import INPUT_SIZE, NUM_LANDMARKS
+
+WRIST = 0
+MIDDLE_MCP = 9
+
+# سلسلة نقاط كل إصبع من المعصم إلى الطرف (ترتيب MediaPipe)
+FINGERS = ("thumb", "index", "middle", "ring", "pinky")
+FINGER_CHAINS = np.array([[WRIST, 4 * f + 1, 4 * f + 2, 4 * f + 3, 4 * f + 4]
+                          for f in range(len(FINGERS))])
+
+# زاوية الانثناء عند JOINT بين العظمتين PARENT → JOINT و JOINT → CHILD
+_PARENT = FINGER_CHAINS[:, 0:3].reshape(-1)
+_JOINT = FINGER_CHAINS[:, 1:4].reshape(-1)
+_CHILD = FINGER_CHAINS[:, 2:5].reshape(-1)
+
+_PAIRS_I, _PAIRS_J = np.triu_indices(NUM_LANDMARKS, 1)
+
+BLOCK_SIZES = {
+    "raw": INPUT_SIZE,
+    "palm": (NUM_LANDMARKS - 1) * 3,
+    "distances": len(_PAIRS_I),
+    "angles": len(_JOINT),
+    "velocity": INPUT_SIZE,
+}
+
+# كتل تحتاج النقاط الخام (مقياس واحد للمحورين) حتى تبقى ثابتة أمام الدوران
+GEOMETRIC_BLOCKS = {"palm", "distances", "angles"}
+
+FEATURE_SETS = {
+    "raw": ("raw",),
+    "palm": ("palm",),
+    "angles": ("angles",),
+    "distances": ("distances",),
+    "geometry": ("palm", "angles", "distances"),
+    "motion": ("palm", "angles", "velocity"),
+}
+
+
+def parse_feature_set(feature_set: str) -> tuple:
+    """اسم من FEATURE_SETS أو كتل مفصولة بـ + → tuple من أسماء الكتل"""
+    if feature_set in FEATURE_SETS:
+        return FEATURE_SETS[feature_set]
+    blocks = tuple(feature_set.split("+"))
+    unknown = [b for b in blocks if b not in BLOCK_SIZES]
+    if unknown:
+        raise ValueError(f"Unknown feature block(s): {', '.join(unknown)} "
+                         f"(available: {', '.join(BLOCK_SIZES)}, sets: {', '.join(FEATURE_SETS)})")
+    return blocks
+
+
+def needs_sequence(feature_set: str) -> bool:
+    return "velocity" in parse_feature_set(feature_set)
+
+
+def feature_size(feature_set: str) -> int:
+    return sum(BLOCK_SIZES[b] for b in parse_feature_set(feature_set))
+
+
+def feature_names(feature_set: str) -> list:
+    """اسم كل عمود في المخرجات (التوثيق الكامل للترتيب)"""
+    names = []
+    for block in parse_feature_set(feature_set):
+        if block in ("raw", "velocity"):
+            prefix = "" if block == "raw" else "v"
+            names += [f"{prefix}{axis}{i}" for i in range(NUM_LANDMARKS) for axis in "xyz"]
+        elif block == "palm":
+            names += [f"palm_{axis}{i}" for i in range(1, NUM_LANDMARKS) for axis in "xyz"]
+        elif block == "distances":
+            names += [f"dist_{i}_{j}" for i, j in zip(_PAIRS_I, _PAIRS_J)]
+        elif block == "angles":
+            names += [f"bend_{finger}_{joint}" for finger in FINGERS for joint in (1, 2, 3)]
+    return names
+
+
+def palm_coordinates(points: np.ndarray) -> np.ndarray:
+    """(..., 21, 3) → (..., 21, 3) في إطار الكف (المعصم في الأصل، الوسطى على +y، حجم اليد = 1)"""
+    centered = points - points[..., WRIST:WRIST + 1, :]
+    axis = centered[..., MIDDLE_MCP, :2]
+    length = np.linalg.norm(axis, axis=-1)
+    safe = np.where(length > 0, length, 1.0)
+    cos = np.where(length > 0, axis[..., 1] / safe, 1.0)[..., None]
+    sin = (axis[..., 0] / safe)[..., None]
+    x, y = centered[..., 0], centered[..., 1]
+    out = np.stack([x * cos - y * sin, x * sin + y * cos, centered[..., 2]], axis=-1)
+    size = np.sqrt((centered ** 2).sum(axis=-1).mean(axis=-1))
+    return out / np.where(size > 0, size, 1.0)[..., None, None]
+
+
+def pairwise_distances(points: np.ndarray) -> np.ndarray:
+    """(..., 21, 3) → (..., 210) عبر مصفوفة Gram (|a|² + |b|² - 2a·b) بدل 210 طرح"""
+    squared = (points ** 2).sum(axis=-1)
+    gram = points @ np.swapaxes(points, -1, -2)
+    d2 = squared[..., :, None] + squared[..., None, :] - 2.0 * gram
+    return np.sqrt(np.maximum(d2[..., _PAIRS_I, _PAIRS_J], 0.0))
+
+
+def bend_angles(points: np.ndarray) -> np.ndarray:
+    """(..., 21, 3) → (..., 15) زوايا الانثناء بالراديان"""
+    incoming = points[..., _JOINT, :] - points[..., _PARENT, :]
+    outgoing = points[..., _CHILD, :] - points[..., _JOINT, :]
+    dot = (incoming * outgoing).sum(axis=-1)
+    norms = np.linalg.norm(incoming, axis=-1) * np.linalg.norm(outgoing, axis=-1)
+    cos = np.where(norms > 0, dot / np.where(norms > 0, norms, 1.0), 1.0)
+    return np.arccos(np.clip(cos, -1.0, 1.0))
+
+
+def compute_features(frames: np.ndarray, feature_set: str = "raw",
+                     landmarks: np.ndarray = None) -> np.ndarray:
+    """
+    frames: (..., 63) إطارات مطبّعة - (N, 63) أو (N, T, 63)
+    landmarks: (..., 63) النقاط الخام لنفس الإطارات - مطلوبة لـ palm و distances و angles
+    المخرجات: (..., feature_size(feature_set)) float32
+    """
+    frames = np.asarray(frames, dtype=np.float32)
+    blocks = parse_feature_set(feature_set)
+    if "velocity" in blocks and frames.ndim < 3:
+        raise ValueError("velocity features need sequences (N, T, 63)")
+
+    points = None
+    if GEOMETRIC_BLOCKS & set(blocks):
+        if landmarks is None:
+            raise ValueError(f"{'/'.join(sorted(GEOMETRIC_BLOCKS & set(blocks)))} features "
+                             "need raw landmarks (normalized x/y use different scales)")
+        landmarks = np.asarray(landmarks, dtype=np.float32)
+        if landmarks.shape != frames.shape:
+            raise ValueError(f"landmarks shape {landmarks.shape} != frames shape {frames.shape}")
+        points = landmarks.reshape(*frames.shape[:-1], NUM_LANDMARKS, 3)
+    palm = palm_coordinates(points) if {"palm", "distances"} & set(blocks) else None
+    outputs = []
+    for block in blocks:
+        if block == "raw":
+            outputs.append(frames)
+        elif block == "palm":
+            outputs.append(palm[..., 1:, :].reshape(*frames.shape[:-1], -1))
+        elif block == "distances":
+            outputs.append(pairwise_distances(palm))
+        elif block == "angles":
+            outputs.append(bend_angles(points))
+        elif block == "velocity":
+            velocity = np.zeros_like(frames)
+            velocity[..., 1:, :] = np.diff(frames, axis=-2)
+            outputs.append(velocity)
+    return np.concatenate(outputs, axis=-1).astype(np.float32)
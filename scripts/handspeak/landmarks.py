@@ -0,0 +1,104 @@
+"""
+أدوات مشتركة للتعامل مع نقاط اليد (21 landmark × 3)
+
+تطابق هذه الدوال منطق التطبيق:
+- HandDetectionHelper.normalizeLandmarks: تطبيع x و y إلى 0-1، و z يبقى كما هو
+- AdaptiveLearningHelper: صيغة ملف CSV لبيانات التدريب
+"""
+
+import csv
+import json
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+
+from .paths import ASSETS_DIR, LABELS_FILE, SIGN_MAP_FILE  # noqa: F401 (re-export)
+
+NUM_LANDMARKS = 21
+COORDINATES_PER_LANDMARK = 3  # x, y, z
+INPUT_SIZE = NUM_LANDMARKS * COORDINATES_PER_LANDMARK  # 63
+SEQUENCE_LENGTH = 10  # طول التسلسل للـ LSTM (مثل SignToTextViewModel)
+MIN_CONFIDENCE = 0.5  # نفس حد الثقة في SignToTextViewModel
+
+
+def load_labels(labels_file: Path = LABELS_FILE) -> list:
+    """قراءة labels.json (الترتيب مهم: index → label)"""
+    with open(labels_file, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def load_folder_label_map(sign_map_file: Path = SIGN_MAP_FILE) -> dict:
+    """
+    خريطة اسم المجلد → التصنيف من sign_map.json
+    المفاتيح بأحرف صغيرة لتسهيل المطابقة (Alef / alef)
+    """
+    if not sign_map_file.exists():
+        return {}
+    with open(sign_map_file, 'r', encoding='utf-8') as f:
+        sign_map = json.load(f)
+    folder_map = {}
+    for entry in sign_map.values():
+        folder = entry.get("folder")
+        label = entry.get("label")
+        if folder and label:
+            folder_map.setdefault(folder.lower(), label)
+    return folder_map
+
+
+def normalize_landmarks(landmarks: np.ndarray) -> np.ndarray:
+    """
+    تطبيع دفعة كاملة من النقاط بنفس طريقة التطبيق
+
+    المدخلات: مصفوفة شكلها (..., 21, 3)
+    المخرجات: مصفوفة شكلها (..., 63) من نوع float32
+
+    x و y يتم تطبيعهما إلى 0-1 لكل إطار (min/max)، و z يبقى نسبياً.
+    إذا كان المدى صفراً تصبح القيمة 0 (مثل Kotlin).
+    """
+    arr = np.asarray(landmarks, dtype=np.float32)
+    xy = arr[..., :2]
+    mins = xy.min(axis=-2, keepdims=True)
+    ranges = xy.max(axis=-2, keepdims=True) - mins
+    safe = np.where(ranges != 0, ranges, 1.0)
+    xy_norm = np.where(ranges != 0, (xy - mins) / safe, 0.0)
+    out = np.concatenate([xy_norm, arr[..., 2:3]], axis=-1).astype(np.float32)
+    return out.reshape(*arr.shape[:-2], INPUT_SIZE)
+
+
+def csv_header() -> list:
+    """نفس Header المستخدم في AdaptiveLearningHelper.buildHeader"""
+    header = ["label"]
+    for i in range(NUM_LANDMARKS):
+        header += [f"x{i}", f"y{i}", f"z{i}"]
+    header.append("timestamp")
+    return header
+
+
+def csv_row(landmarks, label: str, timestamp: str = None) -> list:
+    """صف بيانات (label + 63 قيمة + timestamp) مثل buildDataRow"""
+    flat = np.asarray(landmarks, dtype=np.float32).reshape(INPUT_SIZE)
+    if timestamp is None:
+        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    return [label] + [float(v) for v in flat] + [timestamp]
+
+
+def load_training_csv(csv_file: Path):
+    """
+    قراءة ملف بيانات التدريب (صيغة AdaptiveLearningHelper)
+
+    المخرجات: (landmarks بشكل (N, 21, 3), labels كقائمة نصوص)
+    """
+    rows, labels = [], []
+    with open(csv_file, 'r', encoding='utf-8', newline='') as f:
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if header is None:
+            return np.zeros((0, NUM_LANDMARKS, 3), dtype=np.float32), []
+        for row in reader:
+            if len(row) < 1 + INPUT_SIZE:
+                continue
+            labels.append(row[0])
+            rows.append([float(v) for v in row[1:1 + INPUT_SIZE]])
+    landmarks = np.asarray(rows, dtype=np.float32).reshape(-1, NUM_LANDMARKS, 3)
+    return landmarks, labels
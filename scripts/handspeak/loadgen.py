@@ -0,0 +1,199 @@
+"""
+handspeak loadgen - مولّد حمل لخادم handspeak serve
+
+يعيد تشغيل N تدفق متزامن (كاميرا لكل تدفق): كل تدفق باتصال keep-alive واحد وطلب
+واحد معلّق في أي وقت (مثل processFrame في التطبيق)، ويرسل إطاراته بمعدل --fps
+(0 = الطلب التالي فور وصول الرد، لقياس أقصى إنتاجية).
+
+الإطارات من المولّد الاصطناعي (synthetic_data.py) بعد التطبيع. مع نموذج LSTM يرسل كل
+طلب نافذة آخر sequence_length إطار (Ring buffer)، ومع Dense الإطار الحالي فقط.
+
+التقرير لكل عدد تدفقات: الإنتاجية، زمن الاستجابة من جهة العميل (p50/p90/p99/max)،
+الإطارات المتأخرة (الرد وصل بعد موعد الإطار التالي)، ثم توزيع أحجام الدفعات في الخادم.
+
+الاستخدام:
+    python -m handspeak loadgen --streams 8 --duration 10
+    python -m handspeak loadgen --streams 1 2 4 8 16 --fps 0 --json load.json
+"""
+
+import json
+import time
+
+from .server import DEFAULT_HOST, DEFAULT_PORT, latency_summary, read_message
+
+
+def add_arguments(parser):
+    parser.add_argument('--host', type=str, default=DEFAULT_HOST)
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT)
+    parser.add_argument('--unix', type=str, default=None, help='Unix socket بدل TCP')
+    parser.add_argument('--streams', type=int, nargs='+', default=[4],
+                        help='عدد التدفقات المتزامنة (عدة قيم = قياس لكل منها)')
+    parser.add_argument('--fps', type=float, default=30.0, help='إطارات/ثانية لكل تدفق (0 = بأقصى سرعة)')
+    parser.add_argument('--duration', type=float, default=10.0, help='مدة كل قياس بالثواني')
+    parser.add_argument('--warmup', type=float, default=1.0, help='ثوانٍ أولى لا تدخل في الإحصاءات')
+    parser.add_argument('--frames-per-stream', type=int, default=90,
+                        help='طول تسلسل كل تدفق (يُعاد من البداية)')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--json', type=str, default=None, help='حفظ النتائج في ملف JSON')
+
+
+async def open_connection(args):
+    import asyncio
+
+    if args.unix:
+        return await asyncio.open_unix_connection(args.unix)
+    return await asyncio.open_connection(args.host, args.port)
+
+
+async def request(reader, writer, method: str, path: str, payload: bytes = b"") -> tuple:
+    """طلب HTTP واحد على اتصال مفتوح → (status, JSON)"""
+    writer.write((f"{method} {path} HTTP/1.1\r\nHost: handspeak\r\n"
+                  f"Content-Type: application/json\r\nContent-Length: {len(payload)}\r\n\r\n")
+                 .encode("latin-1") + payload)
+    await writer.drain()
+    message = await read_message(reader)
+    if message is None:
+        raise ConnectionError("server closed the connection")
+    status_line, _, body = message
+    return int(status_line.split(" ")[1]), json.loads(body)
+
+
+async def fetch(args, path: str) -> dict:
+    reader, writer = await open_connection(args)
+    try:
+        return (await request(reader, writer, "GET", path))[1]
+    finally:
+        writer.close()
+
+
+def stream_payloads(info: dict, streams: int, frames: int, seed: int) -> list:
+    """
+    أجسام الطلبات (JSON جاهز) لكل إطار في كل تدفق - تُحسب مرة واحدة حتى لا يكون
+    العميل هو عنق الزجاجة
+    """
+    import numpy as np
+
+    from .landmarks import SEQUENCE_LENGTH, normalize_landmarks
+    from .synthetic_data import SyntheticHandGenerator
+
+    generator = SyntheticHandGenerator(info["num_classes"], frames, seed=seed)
+    landmarks, _ = generator.generate(streams, seed=7, time_span=(frames - 1) / (SEQUENCE_LENGTH - 1))
+    features = np.round(normalize_landmarks(landmarks), 5)
+    window = info["sequence_length"] if info["sequence_model"] else 1
+    payloads = []
+    for stream in features:
+        bodies = []
+        for i in range(frames):
+            if info["sequence_model"]:
+                request_body = {"window": stream[max(0, i - window + 1):i + 1].tolist()}
+            else:
+                request_body = {"frame": stream[i].tolist()}
+            bodies.append(json.dumps(request_body).encode("utf-8"))
+        payloads.append(bodies)
+    return payloads
+
+
+async def replay_stream(args, bodies: list, start: float, results: dict):
+    """تدفق واحد: إرسال الإطارات بالتتابع حتى نهاية المدة"""
+    import asyncio
+
+    interval = 1.0 / args.fps if args.fps > 0 else 0.0
+    end = start + args.warmup + args.duration
+    reader, writer = await open_connection(args)
+    try:
+        frame = 0
+        while True:
+            scheduled = start + frame * interval if interval else time.perf_counter()
+            now = time.perf_counter()
+            if scheduled >= end or now >= end:
+                break
+            if scheduled > now:
+                await asyncio.sleep(scheduled - now)
+            sent = time.perf_counter()
+            status, _ = await request(reader, writer, "POST", "/classify",
+                                       bodies[frame % len(bodies)])
+            done = time.perf_counter()
+            frame += 1
+            # الرد وصل بعد موعد الإطار التالي: الإطارات التي فاتت لا تُرسل (مثل processFrame)
+            late = interval and done > start + frame * interval
+            if late:
+                frame = int((done - start) / interval) + 1
+            if sent < start + args.warmup:
+                continue
+            if status != 200:
+                results["errors"] += 1
+                continue
+            results["latency_ms"].append((done - sent) * 1000.0)
+            results["late"] += bool(late)
+    finally:
+        writer.close()
+
+
+async def run_level(args, info: dict, streams: int) -> dict:
+    import asyncio
+
+    payloads = stream_payloads(info, streams, args.frames_per_stream, args.seed)
+    await fetch(args, "/metrics?reset=1")
+    results = {"latency_ms": [], "errors": 0, "late": 0}
+    start = time.perf_counter() + 0.1
+    await asyncio.gather(*(replay_stream(args, bodies, start, results) for bodies in payloads))
+    server = await fetch(args, "/metrics")
+    completed = len(results["latency_ms"])
+    return {
+        "streams": streams,
+        "fps": args.fps,
+        "requests": completed,
+        "errors": results["errors"],
+        "late_frames": results["late"],
+        "throughput_per_sec": completed / args.duration,
+        "latency_ms": latency_summary(results["latency_ms"]),
+        "server": server,
+    }
+
+
+def print_report(results: list):
+    fmt = lambda v: "—" if v is None else f"{v:.1f}"
+    print(f"\n{'streams':>7} {'req/s':>8} {'p50':>8} {'p90':>8} {'p99':>8} {'max':>8} "
+          f"{'late':>6} {'err':>4} {'batch':>6} {'queue max':>9}")
+    print("-" * 84)
+    for r in results:
+        latency, server = r["latency_ms"], r["server"]
+        late = r["late_frames"] / max(r["requests"], 1)
+        print(f"{r['streams']:>7} {r['throughput_per_sec']:>8.1f} {fmt(latency['p50']):>6}ms "
+              f"{fmt(latency['p90']):>6}ms {fmt(latency['p99']):>6}ms {fmt(latency['max']):>6}ms "
+              f"{late:>6.1%} {r['errors']:>4} {fmt(server['mean_batch_size']):>6} "
+              f"{server['max_queue_depth']:>9}")
+    last = results[-1]["server"]
+    print(f"\n📦 Batch sizes ({results[-1]['streams']} streams): " +
+          ", ".join(f"{size}×{count}" for size, count in last["batch_size_histogram"].items()))
+
+
+async def generate(args) -> list:
+    info = await fetch(args, "/health")
+    print(f"🎯 {info['model']} ({'LSTM' if info['sequence_model'] else 'Dense'}) | "
+          f"{info['interpreters']} interpreter(s), max batch {info['max_batch']}, "
+          f"max wait {info['max_wait_ms']:g}ms")
+    results = []
+    for streams in args.streams:
+        rate = f"{args.fps:g} fps" if args.fps > 0 else "max rate"
+        print(f"🚦 {streams} stream(s) @ {rate} for {args.duration:g}s...", flush=True)
+        results.append(await run_level(args, info, streams))
+    return results
+
+
+def run(args):
+    import asyncio
+
+    try:
+        results = asyncio.run(generate(args))
+    except (ConnectionError, OSError) as e:
+        target = args.unix or f"{args.host}:{args.port}"
+        print(f"❌ لا يمكن الاتصال بالخادم ({target}): {e}")
+        print("   شغّل أولاً: python -m handspeak serve --model <model.tflite>")
+        return 1
+    print_report(results)
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+        print(f"\n📄 Saved: {args.json}")
+    return 0
@@ -0,0 +1,159 @@
+"""
+بناء النماذج وتحويلها إلى TFLite
+
+- create_lstm_model: LSTM (256 → 128 → 64) + Dense، Input: [sequence_length, 63]
+  (sequence_length=None → طول متغير، مع Masking للتدريب على دفعات مبطّنة)
+- export_lstm_model: نسخة للتصدير بنفس الأوزان (batch=1، بطول ثابت أو متغير)
+- create_dense_model: Dense NN (256 → 128 → 64)، Input: [63]
+- convert_to_tflite: تحويل نموذج Keras (مع Select TF Ops للـ LSTM)
+
+input_size: حجم الإطار (63 إحداثية، أو حجم مجموعة ميزات من features.py)
+width: معامل عرض الطبقات (0.25 = ربع الوحدات) لتجربة نماذج أصغر
+
+TensorFlow يتم استيراده داخل الدوال فقط.
+"""
+
+from pathlib import Path
+
+from .landmarks import INPUT_SIZE, SEQUENCE_LENGTH
+
+ARCHITECTURES = ("lstm", "dense")
+
+# أسماء الملفات التي يبحث عنها التطبيق في assets
+MODEL_FILES = {
+    "lstm": "arabic_sign_lstm.tflite",
+    "dense": "arabic_sign_dense.tflite",
+}
+
+# قيمة التبطين للإطارات غير الموجودة (إطار مطبّع حقيقي لا يكون أصفاراً: max(x) = 1)
+MASK_VALUE = 0.0
+
+
+def _units(units: int, width: float) -> int:
+    return max(8, int(round(units * width)))
+
+
+def create_lstm_model(num_classes: int, sequence_length: int = SEQUENCE_LENGTH,
+                      masking: bool = False, batch_size: int = None,
+                      input_size: int = INPUT_SIZE, width: float = 1.0):
+    """
+    إنشاء نموذج LSTM
+
+    sequence_length=None: بعد زمني متغير
+    masking: تجاهل الإطارات المبطّنة بـ MASK_VALUE (دفعات بأطوال مختلفة)
+    batch_size=1: للتصدير - LSTM بطول متغير يتحول عندها إلى عمليات TFLite أساسية (بدون Flex)
+    """
+    import tensorflow as tf
+
+    layers = [tf.keras.layers.InputLayer(input_shape=(sequence_length, input_size),
+                                         batch_size=batch_size)]
+    if masking:
+        layers.append(tf.keras.layers.Masking(mask_value=MASK_VALUE, name='masking'))
+    model = tf.keras.Sequential(layers + [
+        tf.keras.layers.LSTM(_units(256, width), return_sequences=True, name='lstm_1'),
+        tf.keras.layers.Dropout(0.3, name='dropout_1'),
+        tf.keras.layers.LSTM(_units(128, width), return_sequences=True, name='lstm_2'),
+        tf.keras.layers.Dropout(0.3, name='dropout_2'),
+        tf.keras.layers.LSTM(_units(64, width), name='lstm_3'),
+        tf.keras.layers.Dropout(0.2, name='dropout_3'),
+        tf.keras.layers.Dense(_units(128, width), activation='relu', name='dense_1'),
+        tf.keras.layers.Dropout(0.2, name='dropout_4'),
+        tf.keras.layers.Dense(_units(64, width), activation='relu', name='dense_2'),
+        tf.keras.layers.Dense(num_classes, activation='softmax', name='output')
+    ])
+    return model
+
+
+def create_dense_model(num_classes: int, input_size: int = INPUT_SIZE, width: float = 1.0):
+    """إنشاء نموذج Dense Neural Network"""
+    import tensorflow as tf
+
+    model = tf.keras.Sequential([
+        tf.keras.layers.InputLayer(input_shape=(input_size,)),
+        tf.keras.layers.Dense(_units(256, width), activation='relu', name='dense_1'),
+        tf.keras.layers.Dropout(0.3, name='dropout_1'),
+        tf.keras.layers.Dense(_units(128, width), activation='relu', name='dense_2'),
+        tf.keras.layers.Dropout(0.3, name='dropout_2'),
+        tf.keras.layers.Dense(_units(64, width), activation='relu', name='dense_3'),
+        tf.keras.layers.Dropout(0.2, name='dropout_3'),
+        tf.keras.layers.Dense(num_classes, activation='softmax', name='output')
+    ])
+    return model
+
+
+def create_model(arch: str, num_classes: int, sequence_length: int = SEQUENCE_LENGTH,
+                 masking: bool = False, input_size: int = INPUT_SIZE, width: float = 1.0):
+    if arch == "lstm":
+        return create_lstm_model(num_classes, sequence_length, masking,
+                                 input_size=input_size, width=width)
+    if arch == "dense":
+        return create_dense_model(num_classes, input_size, width)
+    raise ValueError(f"Unknown architecture: {arch} (available: {', '.join(ARCHITECTURES)})")
+
+
+def compile_model(model, learning_rate: float = None):
+    import tensorflow as tf
+
+    model.compile(
+        optimizer=tf.keras.optimizers.Adam(learning_rate) if learning_rate else 'adam',
+        loss='categorical_crossentropy',
+        metrics=['accuracy']
+    )
+    return model
+
+
+def is_sequence_model(model) -> bool:
+    return len(model.inputs[0].shape) == 3
+
+
+def export_lstm_model(model, sequence_length: int = None):
+    """
+    نسخة من نموذج LSTM (مع أو بدون Masking) للتصدير بنفس الأوزان:
+    batch=1 مثل التطبيق، بدون Masking (المدخلات لا تُبطَّن عند الاستدلال)
+    sequence_length=None → طول متغير (resize_tensor_input قبل الاستدلال)
+    """
+    import tensorflow as tf
+
+    # نفس الطبقات (أي width / input_size) مع تغيير شكل المدخل وحذف Masking
+    config = model.get_config()
+    layers = [layer for layer in config["layers"] if layer["class_name"] != "Masking"]
+    input_config = layers[0]["config"]
+    input_config["batch_shape"] = [1, sequence_length, input_config["batch_shape"][-1]]
+    exported = tf.keras.Sequential.from_config({**config, "layers": layers})
+    exported.set_weights(model.get_weights())  # Masking بدون أوزان → نفس الترتيب
+    return exported
+
+
+def convert_to_tflite(model, select_tf_ops: bool = None) -> bytes:
+    """
+    تحويل نموذج Keras إلى TFLite
+    select_tf_ops: None = تلقائياً للنماذج الزمنية (LSTM يتطلب Select TF Ops)،
+    إلا إذا كان batch=1 (export_lstm_model) فتكفي العمليات الأساسية
+    """
+    import tensorflow as tf
+
+    if select_tf_ops is None:
+        select_tf_ops = is_sequence_model(model) and model.inputs[0].shape[0] != 1
+
+    converter = tf.lite.TFLiteConverter.from_keras_model(model)
+    converter.optimizations = [tf.lite.Optimize.DEFAULT]
+    if select_tf_ops:
+        converter.target_spec.supported_ops = [
+            tf.lite.OpsSet.TFLITE_BUILTINS,
+            tf.lite.OpsSet.SELECT_TF_OPS
+        ]
+        converter._experimental_lower_tensor_list_ops = False
+        print("   ℹ️  استخدام Select TF Ops للـ LSTM")
+    return converter.convert()
+
+
+def save_tflite(tflite_model: bytes, output_file) -> Path:
+    output_file = Path(output_file)
+    output_file.parent.mkdir(parents=True, exist_ok=True)
+    with open(output_file, 'wb') as f:
+        f.write(tflite_model)
+    file_size_kb = len(tflite_model) / 1024
+    print(f"\n✅ تم إنشاء النموذج بنجاح!")
+    print(f"   📁 الملف: {output_file}")
+    print(f"   📦 الحجم: {file_size_kb:.2f} KB ({file_size_kb / 1024:.2f} MB)")
+    return output_file
@@ -0,0 +1,13 @@
+"""
+مسارات المشروع (بدون أي اعتماديات ثقيلة)
+"""
+
+from pathlib import Path
+
+SCRIPTS_DIR = Path(__file__).resolve().parents[1]
+ROOT_DIR = SCRIPTS_DIR.parent
+ASSETS_DIR = ROOT_DIR / "app" / "src" / "main" / "assets"
+SIGNS_DIR = ASSETS_DIR / "signs"
+LABELS_FILE = ASSETS_DIR / "labels.json"
+SIGN_MAP_FILE = ASSETS_DIR / "sign_map.json"
+CASCADE_FILE = ASSETS_DIR / "cascade.json"
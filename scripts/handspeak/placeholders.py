@@ -0,0 +1,83 @@
+"""
+handspeak placeholders - إنشاء صور placeholder لجميع الإشارات
+"""
+
+from pathlib import Path
+
+from .paths import SIGNS_DIR
+from .signs import SIGN_FOLDERS
+
+IMAGE_SIZE = 512
+
+
+def add_arguments(parser):
+    parser.add_argument('--count', type=int, default=5, help='عدد الصور لكل إشارة')
+    parser.add_argument('--output', type=str, default=str(SIGNS_DIR), help='مجلد الصور')
+
+
+def create_image(label: str, index: int, output_path: Path):
+    """إنشاء صورة placeholder"""
+    from PIL import Image, ImageDraw, ImageFont
+
+    img = Image.new('RGB', (IMAGE_SIZE, IMAGE_SIZE), color='#F5F5F5')
+    draw = ImageDraw.Draw(img)
+
+    # رسم إطار
+    margin = 20
+    draw.rectangle([margin, margin, IMAGE_SIZE - margin, IMAGE_SIZE - margin],
+                   outline='#2196F3', width=4)
+
+    # رسم دائرة في المنتصف
+    center = IMAGE_SIZE // 2
+    radius = 150
+    draw.ellipse([center - radius, center - radius, center + radius, center + radius],
+                 outline='#2196F3', width=3)
+
+    # نص الإشارة
+    try:
+        font = ImageFont.truetype("arial.ttf", 60)
+    except OSError:
+        font = ImageFont.load_default()
+    bbox = draw.textbbox((0, 0), label, font=font)
+    text_x = (IMAGE_SIZE - (bbox[2] - bbox[0])) // 2
+    text_y = center - (bbox[3] - bbox[1]) // 2 - 20
+    draw.text((text_x, text_y), label, fill='#2196F3', font=font)
+
+    # رقم الصورة
+    small_font = ImageFont.load_default()
+    index_text = str(index)
+    bbox = draw.textbbox((0, 0), index_text, font=small_font)
+    draw.text(((IMAGE_SIZE - (bbox[2] - bbox[0])) // 2, center + 40), index_text,
+              fill='#757575', font=small_font)
+
+    img.save(output_path, 'PNG', optimize=True)
+    print(f"✅ Created: {output_path}")
+
+
+def run(args):
+    output_dir = Path(args.output)
+    print("🎨 Creating placeholder images for all signs...")
+    print("=" * 60)
+
+    total_created = 0
+    for folder_name, label in SIGN_FOLDERS:
+        folder_path = output_dir / folder_name
+        folder_path.mkdir(parents=True, exist_ok=True)
+        for i in range(1, args.count + 1):
+            image_path = folder_path / f"{i}.png"
+            # تخطي إذا كانت موجودة
+            if image_path.exists():
+                print(f"⏭️  Skipping: {image_path.name}")
+                continue
+            create_image(label, i, image_path)
+            total_created += 1
+
+    print("=" * 60)
+    print(f"✅ Created {total_created} placeholder images!")
+    print(f"📁 Location: {output_dir}")
+    print()
+    print("💡 Next steps:")
+    print("   1. Replace placeholder images with real sign images")
+    print("   2. Images should be in PNG format, 512x512 or larger")
+    print("   3. Use ImageDownloadSettingsScreen in the app to download more")
+    return 0
@@ -0,0 +1,154 @@
+"""
+تدريب قابل للاستئناف (handspeak train --run-dir)
+
+محتويات مجلد التشغيل:
+- backup/: BackupAndRestore - الأوزان + حالة الـ optimizer + رقم الـ epoch (كل epoch)،
+  فالتشغيل المنقطع يكمل من آخر epoch ولا يضيع أكثر من epoch واحد
+- best.keras: أفضل نموذج حسب val_loss (مصدر التحويل إلى TFLite)
+- state.json: إعدادات التشغيل، أفضل val_loss، عداد early stopping وسجل الـ epochs.
+  يُحفظ مع كل epoch لأن حالة EarlyStopping و ModelCheckpoint في Keras تضيع عند الاستئناف
+
+الإعدادات (ومنها epochs ومعدل التعلم وجدولته و patience) يجب أن تطابق عند الاستئناف،
+وإلا يُرفض (--fresh أو مجلد آخر).
+
+جدولة معدل التعلم:
+- cosine: دالة في رقم الـ epoch وعدد epochs (ثابت في الإعدادات) → نفس القيم بعد الاستئناف
+- plateau: ReduceLROnPlateau (المعدل الحالي محفوظ مع الـ optimizer، عداده يبدأ من جديد)
+"""
+
+import json
+import math
+import os
+import shutil
+from pathlib import Path
+
+import tensorflow as tf
+
+LR_SCHEDULES = ("cosine", "plateau", "constant")
+STATE_FILE = "state.json"
+BEST_MODEL_FILE = "best.keras"
+
+
+def load_state(run_dir: Path) -> dict:
+    state_file = Path(run_dir) / STATE_FILE
+    if not state_file.exists():
+        return {}
+    with open(state_file, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def save_state(run_dir: Path, state: dict):
+    """كتابة ذرية (ملف مؤقت + replace) حتى لا ينقطع التشغيل أثناء الكتابة"""
+    state_file = Path(run_dir) / STATE_FILE
+    tmp_file = state_file.with_suffix('.tmp')
+    with open(tmp_file, 'w', encoding='utf-8') as f:
+        json.dump(state, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_file, state_file)
+
+
+def prepare_run(run_dir: Path, config: dict, fresh: bool = False) -> dict:
+    """
+    إنشاء مجلد التشغيل أو التحقق من أن إعداداته تطابق config
+    المخرجات: الحالة المحفوظة (فارغة لتشغيل جديد)
+    ValueError إذا اختلفت الإعدادات (الأوزان المحفوظة لن تناسب النموذج)
+    """
+    run_dir = Path(run_dir)
+    if fresh and run_dir.exists():
+        shutil.rmtree(run_dir)
+    run_dir.mkdir(parents=True, exist_ok=True)
+
+    state = load_state(run_dir)
+    if not state:
+        state = {"config": config, "best_val_loss": None, "best_epoch": None, "wait": 0,
+                 "stopped_early": False, "epochs": []}
+        save_state(run_dir, state)
+        return state
+    changed = {k: (state["config"].get(k), v) for k, v in config.items()
+               if state["config"].get(k) != v}
+    if changed:
+        details = ", ".join(f"{k}: {old} → {new}" for k, (old, new) in changed.items())
+        raise ValueError(f"Run config changed ({details}); use --fresh or another --run-dir")
+    return state
+
+
+class RunState(tf.keras.callbacks.Callback):
+    """
+    Early stopping + حفظ أفضل نموذج على val_loss، مع حفظ الحالة في state.json
+    بعد كل epoch (تستمر بعد الاستئناف)، واستعادة أفضل أوزان في نهاية التدريب
+    """
+
+    def __init__(self, run_dir: Path, state: dict, patience: int = 5, min_delta: float = 0.0,
+                 restore_best: bool = True):
+        super().__init__()
+        self.run_dir = Path(run_dir)
+        self.state = state
+        self.patience = patience
+        self.min_delta = min_delta
+        self.restore_best = restore_best
+
+    @property
+    def best_model_file(self) -> Path:
+        return self.run_dir / BEST_MODEL_FILE
+
+    def on_epoch_end(self, epoch, logs=None):
+        if any(e["epoch"] == epoch + 1 for e in self.state["epochs"]):
+            # epoch سُجّل ثم انقطع التشغيل قبل BackupAndRestore → أُعيد بعد الاستئناف.
+            # أفضل نموذج وعداد early stopping يشملانه بالفعل، فلا يُحسب مرتين
+            print(f"\n♻️  Epoch {epoch + 1} already recorded before the interruption - keeping its result")
+            if self.state["stopped_early"]:
+                self.model.stop_training = True
+            return
+        logs = logs or {}
+        val_loss = float(logs["val_loss"])
+        best = self.state["best_val_loss"]
+        record = {"epoch": epoch + 1, "learning_rate": float(self.model.optimizer.learning_rate)}
+        record.update({k: float(v) for k, v in logs.items() if k != "learning_rate"})
+        self.state["epochs"].append(record)
+
+        if best is None or val_loss < best - self.min_delta:
+            self.model.save(self.best_model_file)
+            self.state.update(best_val_loss=val_loss, best_epoch=epoch + 1, wait=0)
+        else:
+            self.state["wait"] += 1
+            if self.patience and self.state["wait"] >= self.patience:
+                self.state["stopped_early"] = True
+                self.model.stop_training = True
+                print(f"\n⏹️  Early stopping: no val_loss improvement for {self.patience} epochs "
+                      f"(best: epoch {self.state['best_epoch']})")
+        save_state(self.run_dir, self.state)
+
+    def on_train_end(self, logs=None):
+        if self.restore_best and self.best_model_file.exists():
+            self.model.load_weights(self.best_model_file)
+            print(f"↩️  Restored best weights (epoch {self.state['best_epoch']}, "
+                  f"val_loss {self.state['best_val_loss']:.4f})")
+
+
+def cosine_schedule(learning_rate: float, epochs: int, alpha: float = 0.05):
+    """معدل التعلم لكل epoch: من learning_rate إلى alpha × learning_rate"""
+    def schedule(epoch, _lr=None):
+        progress = min(epoch / max(epochs - 1, 1), 1.0)
+        return learning_rate * (alpha + (1 - alpha) * 0.5 * (1 + math.cos(math.pi * progress)))
+    return schedule
+
+
+def training_callbacks(run_dir: Path, state: dict, epochs: int, learning_rate: float,
+                       lr_schedule: str = "cosine", patience: int = 5,
+                       min_delta: float = 0.0) -> list:
+    """
+    الترتيب مهم: RunState يحفظ best.keras و state.json قبل أن يكتب BackupAndRestore
+    نقطة الاستئناف، فلا يُستأنف أبداً بعد epoch لم تُسجَّل نتيجته.
+    الانقطاع بين الاثنين يعيد epoch مسجّلاً بالفعل: RunState يتجاهل إعادته (لا يُحسب مرتين)
+    """
+    run_dir = Path(run_dir)
+    callbacks = []
+    if lr_schedule == "cosine":
+        callbacks.append(tf.keras.callbacks.LearningRateScheduler(
+            cosine_schedule(learning_rate, epochs)))
+    elif lr_schedule == "plateau":
+        callbacks.append(tf.keras.callbacks.ReduceLROnPlateau(
+            monitor='val_loss', factor=0.5, patience=max(1, patience // 2), verbose=1))
+    callbacks.append(RunState(run_dir, state, patience, min_delta))
+    callbacks.append(tf.keras.callbacks.BackupAndRestore(
+        str(run_dir / "backup"), save_freq="epoch", delete_checkpoint=False))
+    return callbacks
@@ -0,0 +1,172 @@
+"""
+handspeak frames - تسلسلات بأطوال مختلفة: دقة النموذج حسب عدد الإطارات المرئية
+
+التطبيق ينتظر 10 إطارات قبل أول تصنيف حتى للحروف الثابتة. نموذج LSTM بطول
+متغير (train --variable-length) يمكنه التصنيف بعد 3-4 إطارات إذا كانت الإشارة تسمح:
+
+- random_lengths / bucketed_dataset: التدريب على بدايات التسلسلات (أول k إطار،
+  وهو ما يراه التطبيق قبل اكتمال النافذة) في دفعات مجمّعة حسب الطول
+  (bucket_by_sequence_length) مع تبطين بـ MASK_VALUE و Masking في النموذج
+- accuracy_by_frames: الدقة ونسبة التصنيفات الواثقة بعد 1..T إطار، للإشارات
+  الثابتة والحركية. النماذج بطول ثابت تُقيَّم بتكرار آخر إطار مثل التطبيق
+
+الاستخدام:
+    python -m handspeak frames --model arabic_sign_lstm.tflite --model arabic_sign_lstm_var.tflite
+"""
+
+import json
+
+DEFAULT_BUCKETS = (3, 5, 8)  # [1-2]، [3-4]، [5-7]، [8-10] إطار
+DEFAULT_TARGET_ACCURACY = 0.9
+
+
+def add_arguments(parser):
+    parser.add_argument('--model', type=str, action='append', required=True,
+                        help='ملف .tflite (يمكن تكراره للمقارنة)')
+    parser.add_argument('--samples', type=int, default=1000, help='عدد تسلسلات التقييم')
+    parser.add_argument('--sequence-length', type=int, default=10, help='أقصى عدد إطارات')
+    parser.add_argument('--seed', type=int, default=42,
+                        help='seed المولّد (نفس seed التدريب لنفس قوالب التصنيفات)')
+    parser.add_argument('--min-confidence', type=float, default=0.5, help='حد الثقة في التطبيق')
+    parser.add_argument('--target-accuracy', type=float, default=DEFAULT_TARGET_ACCURACY)
+    parser.add_argument('--json', type=str, default=None, help='حفظ النتائج في ملف JSON')
+
+
+def random_lengths(n: int, max_length: int, min_length: int = 1, seed: int = 0):
+    """طول عشوائي لكل عينة في [min_length, max_length]"""
+    import numpy as np
+
+    return np.random.default_rng(seed).integers(min_length, max_length + 1, n).astype(np.int32)
+
+
+def bucketed_dataset(X, y, lengths, batch_size: int, boundaries=DEFAULT_BUCKETS,
+                     shuffle: bool = True, seed: int = 0):
+    """
+    tf.data: كل عينة = أول lengths[i] إطار من X[i]، في دفعات من نفس مجموعة الطول
+    الإطارات الناقصة في الدفعة تُبطَّن بـ MASK_VALUE (يتجاهلها Masking)
+    """
+    import tensorflow as tf
+
+    from .models import MASK_VALUE
+
+    dataset = tf.data.Dataset.from_tensor_slices((X, lengths, y))
+    if shuffle:
+        dataset = dataset.shuffle(len(X), seed=seed, reshuffle_each_iteration=True)
+    dataset = dataset.map(lambda x, length, label: (x[:length], label))
+    return dataset.bucket_by_sequence_length(
+        element_length_func=lambda x, label: tf.shape(x)[0],
+        bucket_boundaries=list(boundaries),
+        bucket_batch_sizes=[batch_size] * (len(boundaries) + 1),
+        padding_values=(tf.constant(MASK_VALUE, tf.float32), tf.constant(0.0, tf.float32)),
+    ).prefetch(tf.data.AUTOTUNE)
+
+
+def pad_repeat(X, sequence_length: int):
+    """تكرار آخر إطار حتى sequence_length (مثل classifySequence في التطبيق)"""
+    import numpy as np
+
+    missing = sequence_length - X.shape[1]
+    if missing <= 0:
+        return X[:, -sequence_length:]
+    return np.concatenate([X, np.repeat(X[:, -1:], missing, axis=1)], axis=1)
+
+
+def accuracy_by_frames(predict, X, labels, groups: dict = None, max_frames: int = None,
+                       min_confidence: float = 0.5) -> list:
+    """
+    predict: (N, k, 63) → احتمالات (N, C)
+    X: (N, T, 63) تسلسلات كاملة، labels: (N,) أرقام التصنيفات
+    groups: {"static": mask, ...} دقة منفصلة لكل مجموعة عينات
+    المخرجات: صف لكل k = 1..T
+    """
+    import numpy as np
+
+    groups = groups or {}
+    rows = []
+    for frames in range(1, (max_frames or X.shape[1]) + 1):
+        probabilities = predict(X[:, :frames])
+        predicted = probabilities.argmax(axis=1)
+        confidence = probabilities.max(axis=1)
+        correct = predicted == labels
+        confident = confidence >= min_confidence
+        row = {
+            "frames": frames,
+            "accuracy": float(correct.mean()),
+            "confident": float(confident.mean()),
+            "confident_accuracy": float(correct[confident].mean()) if confident.any() else None,
+        }
+        for name, mask in groups.items():
+            row[f"{name}_accuracy"] = float(correct[mask].mean()) if mask.any() else None
+        rows.append(row)
+    return rows
+
+
+def earliest_frames(rows: list, key: str = "accuracy", target: float = DEFAULT_TARGET_ACCURACY):
+    """أقل عدد إطارات تصل فيه الدقة (key) إلى target، أو None"""
+    for row in rows:
+        if row.get(key) is not None and row[key] >= target:
+            return row["frames"]
+    return None
+
+
+def print_frames_report(rows: list, target: float = DEFAULT_TARGET_ACCURACY):
+    print(f"\n{'frames':>6} {'accuracy':>9} {'static':>8} {'dynamic':>8} {'confident':>10} "
+          f"{'acc@conf':>9}")
+    print("-" * 56)
+    fmt = lambda v: f"{v:.1%}" if v is not None else "—"
+    for r in rows:
+        print(f"{r['frames']:>6} {fmt(r['accuracy']):>9} {fmt(r.get('static_accuracy')):>8} "
+              f"{fmt(r.get('dynamic_accuracy')):>8} {fmt(r['confident']):>10} "
+              f"{fmt(r['confident_accuracy']):>9}")
+    for key, name in (("static_accuracy", "الإشارات الثابتة"), ("dynamic_accuracy", "الإشارات الحركية"),
+                      ("accuracy", "الكل")):
+        frames = earliest_frames(rows, key, target)
+        print(f"   {name}: دقة ≥ {target:.0%} " +
+              (f"بعد {frames} إطار" if frames else "غير محققة"))
+
+
+def evaluation_set(num_classes: int, samples: int, sequence_length: int, seed: int):
+    """
+    تسلسلات تقييم مستقلة عن بيانات التدريب (نفس القوالب، عينات مختلفة)
+    المخرجات: X (N, T, 63)، labels (N,)، {"static": mask, "dynamic": mask}
+    """
+    from .landmarks import normalize_landmarks
+    from .synthetic_data import SyntheticHandGenerator
+
+    generator = SyntheticHandGenerator(num_classes, sequence_length, seed=seed)
+    landmarks, labels = generator.generate(samples, seed=1000)
+    dynamic = generator.dynamic[labels]
+    return normalize_landmarks(landmarks), labels, {"static": ~dynamic, "dynamic": dynamic}
+
+
+def run(args):
+    from .verify import load_classifier
+
+    results = {}
+    for model_path in args.model:
+        classifier, error = load_classifier(model_path, labels=[], threads=1)
+        if classifier is None:
+            print(f"⚠️  {model_path}: لا يعمل هنا، تم تخطيه ({error})")
+            continue
+        if not classifier.is_sequence_model:
+            print(f"⏭️  {model_path}: نموذج Dense (إطار واحد)")
+            continue
+        X, labels, groups = evaluation_set(classifier.num_classes, args.samples,
+                                           args.sequence_length, args.seed)
+        if classifier.variable_length:
+            predict = classifier.predict
+            mode = "طول متغير"
+        else:
+            predict = lambda x: classifier.predict(pad_repeat(x, classifier.sequence_length))
+            mode = f"طول ثابت {classifier.sequence_length} + تكرار آخر إطار"
+        print(f"\n📊 {model_path} ({mode}, {len(X)} تسلسل)")
+        rows = accuracy_by_frames(predict, X, labels, groups, args.sequence_length,
+                                  args.min_confidence)
+        print_frames_report(rows, args.target_accuracy)
+        results[str(model_path)] = rows
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+        print(f"\n📄 Saved: {args.json}")
+    return 0
@@ -0,0 +1,405 @@
+"""
+handspeak serve - خادم استدلال محلي مع تجميع ديناميكي للطلبات (Dynamic batching)
+
+لعدة كاميرات على جهاز واحد: بدل استدلال batch=1 لكل طلب (مثل SignLanguageClassifier)،
+الطلبات المتزامنة تُجمع في دفعات صغيرة وتُنفَّذ على مجموعة من Interpreters.
+
+API (HTTP/1.1 مع keep-alive، على TCP أو Unix socket مع --unix):
+- POST /classify  {"frame": [63 قيمة]} أو {"window": [[63 قيمة], ...]} (إحداثيات مطبّعة)
+  → {"index", "label", "confidence", "batch_size", "latency_ms"}
+  نموذج LSTM: النافذة تُجهَّز مثل classifySequence (تكرار آخر إطار إذا كانت أقصر)،
+  و "frame" = نافذة من إطار واحد. نموذج Dense: آخر إطار في "window"
+- GET /metrics   → عمق الطابور، توزيع أحجام الدفعات، زمن الاستجابة p50/p90/p99 (آخر
+  --metrics-window طلب)، الإنتاجية. ?reset=1 يصفّر العدادات بعد القراءة
+- GET /health    → نوع النموذج وطول التسلسل وعدد التصنيفات
+
+التجميع: أول طلب في الطابور يفتح دفعة تُغلق عند --max-batch طلب أو بعد --max-wait-ms من
+وصوله، ثم تُنفَّذ على أول Interpreter متاح (كل Interpreter في thread، و invoke لا يحجز
+الـ GIL). أثناء انشغال كل الـ Interpreters تتجمع الطلبات فتكبر الدفعة التالية تلقائياً.
+
+ملاحظة: نماذج export_lstm_model (batch=1 ثابت) تُنفَّذ عينة عينة داخل الدفعة.
+
+الاستخدام:
+    python -m handspeak serve --model arabic_sign_dense.tflite --interpreters 2
+    python -m handspeak loadgen --streams 8
+"""
+
+import json
+import time
+from collections import Counter, deque
+from urllib.parse import parse_qs, urlsplit
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+DEFAULT_MAX_BATCH = 32
+DEFAULT_MAX_WAIT_MS = 2.0
+
+
+def add_arguments(parser):
+    parser.add_argument('--model', type=str, required=True, help='ملف .tflite')
+    parser.add_argument('--host', type=str, default=DEFAULT_HOST)
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT)
+    parser.add_argument('--unix', type=str, default=None, help='Unix socket بدل TCP')
+    parser.add_argument('--max-batch', type=int, default=DEFAULT_MAX_BATCH, help='أقصى حجم دفعة')
+    parser.add_argument('--max-wait-ms', type=float, default=DEFAULT_MAX_WAIT_MS,
+                        help='أقصى انتظار لاكتمال الدفعة من وصول أول طلب')
+    parser.add_argument('--interpreters', type=int, default=2, help='عدد الـ Interpreters')
+    parser.add_argument('--threads', type=int, default=1, help='threads لكل Interpreter')
+    parser.add_argument('--metrics-window', type=int, default=10000,
+                        help='عدد الطلبات الأخيرة في حساب النسب المئوية')
+    parser.add_argument('--log-interval', type=float, default=10.0,
+                        help='طباعة المقاييس كل N ثانية (0 = تعطيل)')
+
+
+def percentile(values, q: float):
+    """النسبة المئوية q (0-100) بطريقة nearest-rank، أو None لقائمة فارغة"""
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = max(1, -(-len(ordered) * q // 100))
+    return float(ordered[int(rank) - 1])
+
+
+def latency_summary(values) -> dict:
+    return {"p50": percentile(values, 50), "p90": percentile(values, 90),
+            "p99": percentile(values, 99), "max": max(values) if values else None}
+
+
+class Metrics:
+    """عدادات الخادم (تُحدَّث من event loop فقط)"""
+
+    def __init__(self, window: int = 10000):
+        self.window = window
+        self.reset()
+
+    def reset(self):
+        self.started = time.perf_counter()
+        self.requests = 0
+        self.errors = 0
+        self.batches = 0
+        self.batch_sizes = Counter()
+        self.max_queue_depth = 0
+        self.latency_ms = deque(maxlen=self.window)      # وصول الطلب → النتيجة
+        self.queue_ms = deque(maxlen=self.window)        # وصول الطلب → بدء تنفيذ دفعته
+        self.inference_ms = deque(maxlen=self.window)    # زمن تنفيذ كل دفعة
+
+    def snapshot(self, queue_depth: int, busy: int, interpreters: int) -> dict:
+        elapsed = time.perf_counter() - self.started
+        return {
+            "uptime_s": elapsed,
+            "requests": self.requests,
+            "errors": self.errors,
+            "requests_per_sec": self.requests / elapsed if elapsed > 0 else None,
+            "queue_depth": queue_depth,
+            "max_queue_depth": self.max_queue_depth,
+            "busy_interpreters": busy,
+            "interpreters": interpreters,
+            "batches": self.batches,
+            "mean_batch_size": self.requests / self.batches if self.batches else None,
+            "batch_size_histogram": {str(k): v for k, v in sorted(self.batch_sizes.items())},
+            "latency_ms": latency_summary(self.latency_ms),
+            "queue_ms": latency_summary(self.queue_ms),
+            "inference_ms_per_batch": latency_summary(self.inference_ms),
+        }
+
+
+def run_batch(classifier, inputs: list):
+    """
+    تنفيذ دفعة على Interpreter واحد (في thread)
+    المدخلات بأشكال مختلفة (نوافذ بطول متغير) تُنفَّذ كمجموعات منفصلة
+    المخرجات: [(index, confidence)] بنفس الترتيب
+    """
+    import numpy as np
+
+    groups = {}
+    for i, x in enumerate(inputs):
+        groups.setdefault(x.shape, []).append(i)
+    results = [None] * len(inputs)
+    for indices in groups.values():
+        probabilities = classifier.predict(np.stack([inputs[i] for i in indices]))
+        for i, row in zip(indices, probabilities):
+            index = int(row.argmax())
+            results[i] = (index, float(row[index]))
+    return results
+
+
+class DynamicBatcher:
+    """
+    طابور طلبات → دفعات (max_batch / max_wait) → مجموعة Interpreters
+    submit() ينتظر النتيجة: (index, confidence, batch_size)
+    """
+
+    def __init__(self, classifiers: list, max_batch: int = DEFAULT_MAX_BATCH,
+                 max_wait_ms: float = DEFAULT_MAX_WAIT_MS, metrics: Metrics = None):
+        import asyncio
+        from concurrent.futures import ThreadPoolExecutor
+
+        self.classifiers = classifiers
+        self.max_batch = max_batch
+        self.max_wait = max_wait_ms / 1000.0
+        self.metrics = metrics or Metrics()
+        self.queue = asyncio.Queue()
+        self.free = asyncio.Queue()
+        for classifier in classifiers:
+            self.free.put_nowait(classifier)
+        self.executor = ThreadPoolExecutor(max_workers=len(classifiers),
+                                           thread_name_prefix="interpreter")
+        self._tasks = set()
+
+    @property
+    def busy(self) -> int:
+        return len(self.classifiers) - self.free.qsize()
+
+    async def submit(self, x):
+        import asyncio
+
+        future = asyncio.get_running_loop().create_future()
+        self.queue.put_nowait((x, future, time.perf_counter()))
+        self.metrics.max_queue_depth = max(self.metrics.max_queue_depth, self.queue.qsize())
+        return await future
+
+    def _drain(self, batch: list):
+        while len(batch) < self.max_batch and not self.queue.empty():
+            batch.append(self.queue.get_nowait())
+
+    async def run(self):
+        """حلقة التجميع (task واحد طوال عمر الخادم)"""
+        import asyncio
+
+        while True:
+            batch = [await self.queue.get()]
+            deadline = batch[0][2] + self.max_wait
+            while len(batch) < self.max_batch:
+                timeout = deadline - time.perf_counter()
+                if timeout <= 0:
+                    self._drain(batch)
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self.queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            classifier = await self.free.get()
+            # طلبات وصلت أثناء انتظار Interpreter متاح تنضم لنفس الدفعة
+            self._drain(batch)
+            task = asyncio.create_task(self._execute(classifier, batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _execute(self, classifier, batch: list):
+        import asyncio
+
+        start = time.perf_counter()
+        try:
+            results = await asyncio.get_running_loop().run_in_executor(
+                self.executor, run_batch, classifier, [x for x, _, _ in batch])
+        except Exception as e:
+            self.metrics.errors += len(batch)
+            for _, future, _ in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        finally:
+            self.free.put_nowait(classifier)
+        end = time.perf_counter()
+
+        metrics = self.metrics
+        metrics.batches += 1
+        metrics.requests += len(batch)
+        metrics.batch_sizes[len(batch)] += 1
+        metrics.inference_ms.append((end - start) * 1000.0)
+        for (_, future, arrival), (index, confidence) in zip(batch, results):
+            metrics.queue_ms.append((start - arrival) * 1000.0)
+            metrics.latency_ms.append((end - arrival) * 1000.0)
+            if not future.done():
+                future.set_result((index, confidence, len(batch)))
+
+    def close(self):
+        for task in self._tasks:
+            task.cancel()
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+
+# ---- HTTP/1.1 (بدون اعتماديات خارجية) ----
+
+async def read_message(reader):
+    """
+    قراءة طلب أو استجابة HTTP: (start_line, headers, body)، أو None عند إغلاق الاتصال
+    """
+    line = await reader.readline()
+    if not line:
+        return None
+    headers = {}
+    while True:
+        header = await reader.readline()
+        if header in (b"\r\n", b"\n", b""):
+            break
+        name, _, value = header.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+    length = int(headers.get("content-length", 0))
+    body = await reader.readexactly(length) if length else b""
+    return line.decode("latin-1").strip(), headers, body
+
+
+def encode_response(status: int, payload: dict, keep_alive: bool = True) -> bytes:
+    reasons = {200: "OK", 400: "Bad Request", 404: "Not Found", 500: "Internal Server Error"}
+    body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+    head = (f"HTTP/1.1 {status} {reasons.get(status, '')}\r\n"
+            f"Content-Type: application/json; charset=utf-8\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n")
+    return head.encode("latin-1") + body
+
+
+class InferenceServer:
+    """مسارات HTTP فوق DynamicBatcher"""
+
+    def __init__(self, batcher: DynamicBatcher, labels: list):
+        self.batcher = batcher
+        self.labels = labels
+        self.model = batcher.classifiers[0]
+
+    def health(self) -> dict:
+        return {
+            "model": self.model.model_path.name,
+            "sequence_model": bool(self.model.is_sequence_model),
+            "variable_length": bool(self.model.variable_length),
+            "sequence_length": int(self.model.sequence_length),
+            "num_classes": self.model.num_classes,
+            "interpreters": len(self.batcher.classifiers),
+            "max_batch": self.batcher.max_batch,
+            "max_wait_ms": self.batcher.max_wait * 1000.0,
+        }
+
+    def metrics(self, reset: bool = False) -> dict:
+        snapshot = self.batcher.metrics.snapshot(self.batcher.queue.qsize(), self.batcher.busy,
+                                                 len(self.batcher.classifiers))
+        if reset:
+            self.batcher.metrics.reset()
+        return snapshot
+
+    def prepare(self, request: dict):
+        """JSON الطلب → مدخل النموذج (ValueError لطلب غير صالح)"""
+        import numpy as np
+
+        from .landmarks import INPUT_SIZE
+
+        if "window" in request:
+            frames = np.asarray(request["window"], dtype=np.float32)
+        elif "frame" in request:
+            frames = np.asarray(request["frame"], dtype=np.float32)[None]
+        else:
+            raise ValueError('expected "frame" or "window"')
+        if frames.ndim != 2 or frames.shape[1] != INPUT_SIZE or len(frames) == 0:
+            raise ValueError(f"frames must have {INPUT_SIZE} values each, got shape {list(frames.shape)}")
+        if not self.model.is_sequence_model:
+            return frames[-1]
+        return self.model.pad_sequence(frames)
+
+    async def classify(self, body: bytes) -> tuple:
+        start = time.perf_counter()
+        try:
+            x = self.prepare(json.loads(body))
+        except (ValueError, TypeError) as e:
+            self.batcher.metrics.errors += 1
+            return 400, {"error": str(e)}
+        index, confidence, batch_size = await self.batcher.submit(x)
+        return 200, {
+            "index": index,
+            "label": self.labels[index] if index < len(self.labels) else "",
+            "confidence": confidence,
+            "batch_size": batch_size,
+            "latency_ms": (time.perf_counter() - start) * 1000.0,
+        }
+
+    async def route(self, start_line: str, body: bytes) -> tuple:
+        method, target, *_ = start_line.split(" ")
+        url = urlsplit(target)
+        if method == "POST" and url.path == "/classify":
+            return await self.classify(body)
+        if method == "GET" and url.path == "/metrics":
+            return 200, self.metrics(reset=parse_qs(url.query).get("reset") == ["1"])
+        if method == "GET" and url.path == "/health":
+            return 200, self.health()
+        return 404, {"error": f"{method} {url.path} not found"}
+
+    async def handle(self, reader, writer):
+        """اتصال واحد: عدة طلبات بالتتابع (keep-alive)"""
+        import asyncio
+
+        try:
+            while True:
+                message = await read_message(reader)
+                if message is None:
+                    break
+                start_line, headers, body = message
+                keep_alive = headers.get("connection", "").lower() != "close"
+                try:
+                    status, payload = await self.route(start_line, body)
+                except Exception as e:
+                    status, payload = 500, {"error": str(e)}
+                writer.write(encode_response(status, payload, keep_alive))
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+
+def print_metrics(m: dict):
+    fmt = lambda v: "—" if v is None else f"{v:.1f}"
+    latency = m["latency_ms"]
+    print(f"📈 {m['requests']:,} req ({fmt(m['requests_per_sec'])}/s) | "
+          f"batch {fmt(m['mean_batch_size'])} avg | queue {m['queue_depth']} (max {m['max_queue_depth']}) | "
+          f"latency p50 {fmt(latency['p50'])}ms p90 {fmt(latency['p90'])}ms p99 {fmt(latency['p99'])}ms",
+          flush=True)
+
+
+async def serve(args):
+    import asyncio
+
+    from .landmarks import load_labels
+    from .sign_classifier import SignClassifier
+
+    labels = load_labels()
+    classifiers = [SignClassifier(args.model, labels=labels, num_threads=args.threads)
+                   for _ in range(args.interpreters)]
+    batcher = DynamicBatcher(classifiers, args.max_batch, args.max_wait_ms,
+                             Metrics(args.metrics_window))
+    server = InferenceServer(batcher, labels)
+    batching = asyncio.create_task(batcher.run())
+
+    if args.unix:
+        listener = await asyncio.start_unix_server(server.handle, path=args.unix)
+        address = f"unix:{args.unix}"
+    else:
+        listener = await asyncio.start_server(server.handle, args.host, args.port)
+        address = f"http://{args.host}:{args.port}"
+    info = server.health()
+    print(f"🛰️  Serving {info['model']} on {address}")
+    print(f"   {'LSTM' if info['sequence_model'] else 'Dense'}, {info['num_classes']} classes | "
+          f"{args.interpreters} interpreter(s) × {args.threads} thread(s) | "
+          f"max batch {args.max_batch}, max wait {args.max_wait_ms:g}ms", flush=True)
+    try:
+        async with listener:
+            if args.log_interval > 0:
+                while True:
+                    await asyncio.sleep(args.log_interval)
+                    print_metrics(server.metrics())
+            else:
+                await listener.serve_forever()
+    finally:
+        batching.cancel()
+        batcher.close()
+        print_metrics(server.metrics())
+
+
+def run(args):
+    import asyncio
+
+    try:
+        asyncio.run(serve(args))
+    except KeyboardInterrupt:
+        print("\n👋 Stopped")
+    return 0
@@ -0,0 +1,115 @@
+"""
+نسخة Python من SignLanguageClassifier (للأدوات على الكمبيوتر)
+
+- classify: إطار واحد [63] (Dense)
+- classify_sequence: تسلسل إطارات (LSTM)، مع تكرار آخر إطار إذا كان التسلسل
+  أقصر من المطلوب، تماماً مثل التطبيق (نماذج الطول المتغير تأخذ الإطارات كما هي)
+- predict: استدلال على دفعة كاملة (Batch) دفعة واحدة
+
+يعمل مع tensorflow أو ai_edge_litert أو tflite_runtime (أيها متوفر).
+"""
+
+from pathlib import Path
+
+import numpy as np
+
+from .landmarks import INPUT_SIZE, SEQUENCE_LENGTH, load_labels
+
+
+def load_interpreter(model_path, num_threads: int = 4):
+    """إنشاء Interpreter من أول مكتبة متوفرة"""
+    model_path = str(model_path)
+    try:
+        import tensorflow as tf
+        return tf.lite.Interpreter(model_path=model_path, num_threads=num_threads)
+    except ImportError:
+        pass
+    try:
+        from ai_edge_litert.interpreter import Interpreter
+    except ImportError:
+        from tflite_runtime.interpreter import Interpreter
+    return Interpreter(model_path=model_path, num_threads=num_threads)
+
+
+def model_output_classes(model_path) -> int:
+    """عدد مخرجات النموذج بدون allocate_tensors (يعمل أيضاً مع نماذج تحتاج Flex)"""
+    return int(load_interpreter(model_path, num_threads=1).get_output_details()[0]['shape'][-1])
+
+
+class SignClassifier:
+    """غلاف حول نموذج TFLite بنفس سلوك SignLanguageClassifier في التطبيق"""
+
+    def __init__(self, model_path, labels: list = None, num_threads: int = 4):
+        self.model_path = Path(model_path)
+        self.interpreter = load_interpreter(model_path, num_threads)
+        self.interpreter.allocate_tensors()
+        self._input = self.interpreter.get_input_details()[0]
+        self._output = self.interpreter.get_output_details()[0]
+
+        shape = list(self._input['shape'])
+        signature = list(self._input.get('shape_signature', shape))
+        # [1, 63] → Dense، [1, T, 63] → LSTM، [1, -1, 63] → LSTM بطول متغير
+        self.is_sequence_model = len(shape) == 3
+        self.variable_length = self.is_sequence_model and signature[1] == -1
+        # نماذج export_lstm_model بـ batch=1 ثابت → الدفعات تُنفَّذ عينة عينة
+        self.fixed_batch = signature[0] != -1
+        if self.variable_length:
+            self.sequence_length = SEQUENCE_LENGTH  # أقصى نافذة
+        else:
+            self.sequence_length = int(shape[1]) if self.is_sequence_model else 1
+
+        self.num_classes = int(self._output['shape'][-1])
+        self.labels = labels if labels is not None else load_labels()
+
+    def label(self, index: int) -> str:
+        return self.labels[index] if 0 <= index < len(self.labels) else ""
+
+    def _resize(self, shape):
+        if list(self._input['shape']) != list(shape):
+            self.interpreter.resize_tensor_input(self._input['index'], list(shape))
+            self.interpreter.allocate_tensors()
+            self._input = self.interpreter.get_input_details()[0]
+            self._output = self.interpreter.get_output_details()[0]
+
+    def predict(self, inputs: np.ndarray) -> np.ndarray:
+        """
+        استدلال على دفعة: (B, 63) أو (B, T, 63) → احتمالات (B, num_classes)
+        """
+        inputs = np.ascontiguousarray(inputs, dtype=np.float32)
+        if self.fixed_batch and len(inputs) != self._input['shape'][0]:
+            return np.concatenate([self.predict(inputs[i:i + 1]) for i in range(len(inputs))])
+        self._resize(inputs.shape)
+        self.interpreter.set_tensor(self._input['index'], inputs)
+        self.interpreter.invoke()
+        return self.interpreter.get_tensor(self._output['index']).copy()
+
+    def pad_sequence(self, sequence, sequence_length: int = None) -> np.ndarray:
+        """
+        تجهيز تسلسل بطول ثابت مثل classifySequence:
+        تكرار آخر إطار إذا كان أقصر، أو أخذ آخر sequence_length إطار
+        """
+        sequence_length = sequence_length or self.sequence_length
+        frames = np.asarray(sequence, dtype=np.float32).reshape(-1, INPUT_SIZE)
+        if len(frames) >= sequence_length or self.variable_length:
+            return frames[-sequence_length:]
+        padding = np.repeat(frames[-1:], sequence_length - len(frames), axis=0)
+        return np.concatenate([frames, padding])
+
+    def classify(self, landmarks):
+        """تصنيف إطار واحد → (index, confidence)"""
+        frame = np.asarray(landmarks, dtype=np.float32).reshape(1, INPUT_SIZE)
+        if self.is_sequence_model:
+            frame = self.pad_sequence(frame)[None]
+        probabilities = self.predict(frame)[0]
+        index = int(np.argmax(probabilities))
+        return index, float(probabilities[index])
+
+    def classify_sequence(self, sequence):
+        """تصنيف تسلسل إطارات → (index, confidence)"""
+        if not self.is_sequence_model:
+            # مثل التطبيق: الرجوع إلى تصنيف آخر إطار
+            return self.classify(np.asarray(sequence)[-1])
+        window = self.pad_sequence(sequence, self.sequence_length)
+        probabilities = self.predict(window[None])[0]
+        index = int(np.argmax(probabilities))
+        return index, float(probabilities[index])
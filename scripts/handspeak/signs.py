@@ -0,0 +1,46 @@
+"""
+قائمة مجلدات الإشارات في assets/signs (اسم المجلد، النص العربي)
+"""
+
+SIGN_FOLDERS = [
+    # الحروف
+    ("alef", "أ"), ("baa", "ب"), ("taa", "ت"), ("thaa", "ث"),
+    ("jeem", "ج"), ("haa", "ح"), ("khaa", "خ"), ("daal", "د"),
+    ("thal", "ذ"), ("raa", "ر"), ("zaay", "ز"), ("seen", "س"),
+    ("sheen", "ش"), ("saad", "ص"), ("daad", "ض"), ("taa2", "ط"),
+    ("dhaa", "ظ"), ("ain", "ع"), ("ghain", "غ"), ("faa", "ف"),
+    ("qaaf", "ق"), ("kaaf", "ك"), ("laam", "ل"), ("meem", "م"),
+    ("noon", "ن"), ("haa2", "ه"), ("waaw", "و"), ("yaa", "ي"),
+    # الكلمات
+    ("marhaba", "مرحبا"), ("shokran", "شكرا"), ("naam", "نعم"),
+    ("la", "لا"), ("min_fadlak", "من فضلك"), ("asef", "آسف"),
+    ("sabah_alkhair", "صباح الخير"), ("masaa_alkhair", "مساء الخير"),
+    ("kaif_halak", "كيف حالك"), ("bikhair", "بخير"),
+    ("assalamu_alaikum", "السلام عليكم"),
+]
+
+
+def arabic_folder_map() -> dict:
+    """خريطة الاسم العربي (بمسافات أو _) → اسم المجلد"""
+    folder_map = {}
+    for folder, arabic in SIGN_FOLDERS:
+        folder_map[arabic] = folder
+        folder_map[arabic.replace(" ", "_")] = folder
+    return folder_map
+
+
+def resolve_folder(name: str):
+    """
+    تحديد مجلد الإشارة من اسم مجلد مصدر (عربي أو إنجليزي)، أو None إذا لم يُعرف
+    """
+    folder_map = arabic_folder_map()
+    no_spaces = name.replace(" ", "_")
+    if name in folder_map:
+        return folder_map[name]
+    if no_spaces in folder_map:
+        return folder_map[no_spaces]
+    folders = {folder for folder, _ in SIGN_FOLDERS}
+    for candidate in (name, no_spaces):
+        if candidate in folders:
+            return candidate
+    return None
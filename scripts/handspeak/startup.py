@@ -0,0 +1,110 @@
+"""
+handspeak check-startup - التحقق من أن --help والأوامر الخفيفة لا تستورد مكتبات ثقيلة
+
+يشغّل كل أمر في عملية منفصلة مع python -X importtime ويفشل (exit code 1) إذا:
+- تم استيراد أي مكتبة من HEAVY_MODULES
+- تجاوز زمن الاستيراد الكلي الميزانية (--budget-ms)
+
+نفس الفحص يعمل تلقائياً في tests/test_startup.py (python -m pytest tests).
+"""
+
+import subprocess
+import sys
+import time
+
+from .paths import SCRIPTS_DIR
+
+HEAVY_MODULES = ("tensorflow", "keras", "numpy", "PIL", "gdown", "tqdm", "requests",
+                 "cv2", "mediapipe", "ai_edge_litert", "tflite_runtime")
+
+DEFAULT_BUDGET_MS = 50.0
+
+
+def add_arguments(parser):
+    parser.add_argument('--budget-ms', type=float, default=DEFAULT_BUDGET_MS,
+                        help=f'أقصى زمن استيراد مسموح (افتراضي: {DEFAULT_BUDGET_MS:.0f}ms)')
+
+
+def default_probes(work_dir) -> list:
+    """
+    --help للأداة ولكل أمر (بناء الـ parser يستورد كل وحدات الأوامر)
+    + تشغيل فعلي للأوامر الخفيفة (sync على مجلد فارغ)
+    """
+    from .cli import COMMANDS
+
+    probes = [["--help"]] + [[command, "--help"] for command in COMMANDS]
+    probes.append(["sync", "--source", str(work_dir), "--target", str(work_dir / "signs")])
+    return probes
+
+
+def parse_importtime(stderr: str) -> list:
+    """
+    قراءة مخرجات -X importtime
+    المخرجات: قائمة (اسم الوحدة، الزمن التراكمي بالـ µs، هل هي في المستوى الأعلى)
+    """
+    entries = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|", 2)
+        if not cumulative.strip().isdigit():
+            continue  # سطر العناوين
+        entries.append((name.strip(), int(cumulative), not name[1:].startswith(" ")))
+    return entries
+
+
+def _importtime(args: list):
+    start = time.perf_counter()
+    process = subprocess.run([sys.executable, "-X", "importtime", *args],
+                             cwd=SCRIPTS_DIR, capture_output=True, text=True)
+    return process, parse_importtime(process.stderr), (time.perf_counter() - start) * 1000.0
+
+
+def import_baseline():
+    """
+    وحدات يستوردها المفسّر نفسه عند البدء (مثل site) - لا تُحسب في زمن الأوامر
+    المخرجات: (أسماء الوحدات، زمن بدء المفسّر بالـ ms)
+    """
+    _, entries, wall_ms = _importtime(["-c", "pass"])
+    return {name for name, _, _ in entries}, wall_ms
+
+
+def probe(args: list, baseline: set = frozenset()) -> dict:
+    """
+    تشغيل python -m handspeak <args>
+    زمن الاستيراد لا يشمل ما يستورده المفسّر نفسه عند البدء (baseline، مثل site)
+    """
+    process, entries, wall_ms = _importtime(["-m", "handspeak", *args])
+    import_us = sum(cumulative for name, cumulative, top in entries
+                    if top and name not in baseline)
+    heavy = sorted({name.split(".")[0] for name, _, _ in entries} & set(HEAVY_MODULES))
+    return {"args": args, "returncode": process.returncode, "wall_ms": wall_ms,
+            "import_ms": import_us / 1000.0, "heavy": heavy}
+
+
+def check_startup(budget_ms: float, probes: list) -> bool:
+    baseline, baseline_ms = import_baseline()
+    ok = True
+    print(f"🐍 Interpreter startup: {baseline_ms:.1f}ms (not counted)")
+    print(f"{'command':<28} {'imports':>9} {'wall':>9}  heavy imports")
+    print("-" * 70)
+    for args in probes:
+        result = probe(args, baseline)
+        passed = (result["returncode"] == 0 and not result["heavy"]
+                  and result["import_ms"] <= budget_ms)
+        ok = ok and passed
+        command = ' '.join(args) if len(args) < 3 else ' '.join(args[:2]) + ' ...'
+        print(f"{'✅' if passed else '❌'} {command:<26} {result['import_ms']:>7.1f}ms "
+              f"{result['wall_ms']:>7.1f}ms  {', '.join(result['heavy']) or '—'}")
+    print()
+    print(f"{'✅ Startup within budget' if ok else '❌ Startup budget exceeded'} "
+          f"({budget_ms:.0f}ms, no heavy imports)")
+    return ok
+
+
+def run(args):
+    import tempfile
+    from pathlib import Path
+
+    with tempfile.TemporaryDirectory() as work_dir:
+        return 0 if check_startup(args.budget_ms, default_probes(Path(work_dir))) else 1
@@ -0,0 +1,61 @@
+"""
+handspeak sync - نسخ الصور من مجلد محلي إلى assets/signs
+
+أسماء المجلدات المصدر يمكن أن تكون بالعربية (أ، مرحبا، من فضلك) أو بأسماء
+مجلدات التطبيق (alef، marhaba). الصور تُرقّم 1.png، 2.png، ...
+"""
+
+import shutil
+from pathlib import Path
+
+from .paths import SIGNS_DIR
+from .signs import resolve_folder
+
+IMAGE_EXTENSIONS = ('.png', '.jpg', '.jpeg')
+
+
+def add_arguments(parser):
+    parser.add_argument('--source', type=str, required=True,
+                        help='المجلد المصدر (مثال: C:/Users/HP/Desktop/صور الإشارات)')
+    parser.add_argument('--target', type=str, default=str(SIGNS_DIR),
+                        help='المجلد الهدف (افتراضي: app/src/main/assets/signs)')
+
+
+def copy_images_from_folder(source_dir, target_dir) -> int:
+    """نسخ الصور من مجلد محلي إلى assets، يعيد عدد الصور المنسوخة (أو -1 عند الخطأ)"""
+    source = Path(source_dir)
+    target = Path(target_dir)
+
+    if not source.exists():
+        print(f"❌ المجلد المصدر غير موجود: {source}")
+        return -1
+
+    target.mkdir(parents=True, exist_ok=True)
+    print(f"📁 المصدر: {source}")
+    print(f"📁 الهدف: {target}")
+    print("=" * 60)
+
+    copied_count = 0
+    for item in sorted(source.iterdir()):
+        if not item.is_dir():
+            continue
+        target_folder = resolve_folder(item.name)
+        if target_folder is None:
+            print(f"⚠️  مجلد غير معروف: {item.name}")
+            continue
+
+        target_path = target / target_folder
+        target_path.mkdir(parents=True, exist_ok=True)
+        image_files = sorted(f for f in item.iterdir() if f.suffix.lower() in IMAGE_EXTENSIONS)
+        for idx, image_file in enumerate(image_files, start=1):
+            shutil.copy2(image_file, target_path / f"{idx}.png")
+            print(f"✅ نسخ: {item.name}/{image_file.name} → {target_folder}/{idx}.png")
+            copied_count += 1
+
+    print("=" * 60)
+    print(f"✅ تم نسخ {copied_count} صورة!")
+    return copied_count
+
+
+def run(args):
+    return 0 if copy_images_from_folder(args.source, args.target) >= 0 else 1
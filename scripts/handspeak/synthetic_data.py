@@ -0,0 +1,263 @@
+#!/usr/bin/env python3
+"""
+مولّد بيانات يد اصطناعية (21 landmark) لاختبارات الأداء والتدريب التجريبي
+
+بدلاً من ضوضاء np.random.random، يعتمد المولّد على نموذج حركي بسيط لليد:
+- قالب وضعية لكل تصنيف (انثناء الأصابع، تباعدها، دوران المعصم)
+- إشارات ثابتة وأخرى متحركة (حركة المعصم وانثناء الأصابع عبر الزمن)
+- عمق وحجم وموقع مختلف لكل عينة + ضوضاء قياس
+
+كل العمليات Vectorized بـ NumPy، والنتائج قابلة للتكرار (seed)
+ويمكن توليدها على دفعات (stream).
+
+المخرجات: تسلسلات بشكل (N, T, 21, 3) بنفس إحداثيات MediaPipe
+(x و y في مجال الصورة 0-1، و z عمق نسبي للمعصم).
+
+الاستخدام:
+    python -m handspeak.synthetic_data --benchmark --count 2000000
+    python -m handspeak.synthetic_data --count 10000 --classes 48 --output synthetic.npz
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from .landmarks import NUM_LANDMARKS, SEQUENCE_LENGTH, normalize_landmarks
+
+# ---- نموذج اليد (إحداثيات الكف: المعصم في الأصل، y باتجاه الأصابع) ----
+# ترتيب MediaPipe: 0 معصم، الإبهام 1-4، السبابة 5-8، الوسطى 9-12، البنصر 13-16، الخنصر 17-20
+
+FINGER_BASES = np.array([
+    [0.20, 0.15, 0.0],    # الإبهام (CMC)
+    [0.16, 0.85, 0.0],    # السبابة (MCP)
+    [0.00, 0.90, 0.0],    # الوسطى
+    [-0.15, 0.85, 0.0],   # البنصر
+    [-0.28, 0.75, 0.0],   # الخنصر
+], dtype=np.float32)
+
+BONE_LENGTHS = np.array([
+    [0.33, 0.27, 0.22],
+    [0.42, 0.25, 0.20],
+    [0.47, 0.28, 0.21],
+    [0.43, 0.27, 0.20],
+    [0.33, 0.20, 0.18],
+], dtype=np.float32)
+
+REST_ABDUCTION = np.array([0.90, 0.12, 0.0, -0.12, -0.25], dtype=np.float32)
+
+# اتجاه الانثناء: الأصابع تنثني نحو الكاميرا (z سالب)، والإبهام عبر الكف
+BEND_NORMALS = np.array([
+    [-0.6, 0.0, -0.8],
+    [0.0, 0.0, -1.0],
+    [0.0, 0.0, -1.0],
+    [0.0, 0.0, -1.0],
+    [0.0, 0.0, -1.0],
+], dtype=np.float32)
+
+MAX_CURL = 1.7  # أقصى انثناء لكل مفصل (راديان)
+
+
+def _rotation_matrices(angles: np.ndarray) -> np.ndarray:
+    """(..., 3) [roll, pitch, yaw] → مصفوفات دوران (..., 3, 3) = Rz @ Rx @ Ry"""
+    roll, pitch, yaw = angles[..., 0], angles[..., 1], angles[..., 2]
+    cr, sr = np.cos(roll), np.sin(roll)
+    cp, sp = np.cos(pitch), np.sin(pitch)
+    cy, sy = np.cos(yaw), np.sin(yaw)
+    rot = np.empty(angles.shape[:-1] + (3, 3), dtype=np.float32)
+    rot[..., 0, 0] = cr * cy - sr * sp * sy
+    rot[..., 0, 1] = -sr * cp
+    rot[..., 0, 2] = cr * sy + sr * sp * cy
+    rot[..., 1, 0] = sr * cy + cr * sp * sy
+    rot[..., 1, 1] = cr * cp
+    rot[..., 1, 2] = sr * sy - cr * sp * cy
+    rot[..., 2, 0] = -cp * sy
+    rot[..., 2, 1] = sp
+    rot[..., 2, 2] = cp * cy
+    return rot
+
+
+def _cumsum3(values: np.ndarray) -> np.ndarray:
+    """مجموع تراكمي على محور أخير بطول 3 (أسرع من np.cumsum لهذا الحجم)"""
+    values[..., 1] += values[..., 0]
+    values[..., 2] += values[..., 1]
+    return values
+
+
+def _joint_axes(curl: np.ndarray, abduction: np.ndarray):
+    """
+    مواقع المفاصل لكل محور على حدة: ثلاث مصفوفات (..., 21)
+
+    كل محور يُحسب منفصلاً لتجنب مصفوفات وسيطة بحجم (..., 5, 3, 3)،
+    وترتيب (إصبع، مفصل) يطابق ترتيب MediaPipe مباشرة بعد reshape.
+    """
+    phi = _cumsum3(curl.copy())
+    cos_phi, sin_phi = np.cos(phi), np.sin(phi)
+    in_plane = (np.sin(abduction)[..., None], np.cos(abduction)[..., None], 0.0)
+
+    shape = np.broadcast_shapes(curl.shape[:-2], abduction.shape[:-1])
+    axes = []
+    for axis in range(3):
+        joints = np.empty(shape + (5, 4), dtype=np.float32)
+        joints[..., 0] = FINGER_BASES[:, axis]
+        direction = in_plane[axis] * cos_phi + BEND_NORMALS[:, axis, None] * sin_phi
+        joints[..., 1:] = _cumsum3(direction * BONE_LENGTHS) + FINGER_BASES[:, axis, None]
+        wrist = np.zeros(shape + (1,), dtype=np.float32)
+        axes.append(np.concatenate([wrist, joints.reshape(shape + (20,))], axis=-1))
+    return axes
+
+
+def forward_kinematics(curl: np.ndarray, abduction: np.ndarray) -> np.ndarray:
+    """
+    حساب مواقع المفاصل في إحداثيات الكف
+
+    curl: (..., 5, 3) زوايا الانثناء لكل مفصل
+    abduction: (..., 5) زاوية كل إصبع عن محور الكف
+    المخرجات: (..., 21, 3)
+    """
+    return np.stack(_joint_axes(curl, abduction), axis=-1)
+
+
+class SyntheticHandGenerator:
+    """
+    مولّد تسلسلات يد اصطناعية مع قالب وضعية لكل تصنيف
+
+    القوالب تُشتق من seed فقط، لذلك نفس seed يعطي نفس التصنيفات دائماً.
+    """
+
+    def __init__(self, num_classes: int, sequence_length: int = SEQUENCE_LENGTH,
+                 seed: int = 0, dynamic_fraction: float = 0.4, noise: float = 0.004):
+        self.num_classes = num_classes
+        self.sequence_length = sequence_length
+        self.seed = seed
+        self.noise = noise
+
+        rng = np.random.default_rng([seed, 0])
+        c = num_classes
+        self.curl = rng.uniform(0.0, 1.4, (c, 5, 3)).astype(np.float32)
+        self.abduction = (REST_ABDUCTION + rng.normal(0.0, 0.12, (c, 5))).astype(np.float32)
+        self.orientation = rng.normal(0.0, [0.35, 0.25, 0.35], (c, 3)).astype(np.float32)
+        self.dynamic = rng.random(c) < dynamic_fraction
+        dyn = self.dynamic[:, None].astype(np.float32)
+        # الإشارات الثابتة تحتفظ برعشة بسيطة فقط
+        self.translation_amp = (rng.uniform(0.03, 0.12, (c, 2)) * dyn + 0.003).astype(np.float32)
+        self.rotation_amp = (rng.uniform(0.1, 0.5, (c, 3)) * dyn + 0.01).astype(np.float32)
+        self.articulation_amp = (rng.uniform(0.0, 0.6, (c, 5)) * dyn + 0.02).astype(np.float32)
+        self.frequency = rng.uniform(0.5, 1.5, c).astype(np.float32)
+
+        self._rng = np.random.default_rng([seed, 1])
+
+    def generate(self, n: int, seed: int = None, labels: np.ndarray = None,
+                 time_span: float = 1.0):
+        """
+        توليد n تسلسل
+
+        seed: لتوليد دفعة محددة بشكل مستقل (وإلا يتقدم المولّد الداخلي)
+        labels: تصنيفات محددة (وإلا عشوائية)
+        time_span: مدة التسلسل بوحدة "تسلسل التدريب" (2.0 = ضعف المدة بنفس سرعة الحركة)
+        المخرجات: (landmarks (n, T, 21, 3) float32, labels (n,) int64)
+        """
+        rng = self._rng if seed is None else np.random.default_rng([self.seed, 2, seed])
+        t_len = self.sequence_length
+        if labels is None:
+            labels = rng.integers(0, self.num_classes, n)
+        labels = np.asarray(labels, dtype=np.int64)
+        n = len(labels)
+
+        # تغيرات لكل عينة حول قالب التصنيف
+        curl = self.curl[labels] + rng.normal(0.0, 0.08, (n, 5, 3)).astype(np.float32)
+        abduction = self.abduction[labels] + rng.normal(0.0, 0.04, (n, 5)).astype(np.float32)
+        orientation = self.orientation[labels] + rng.normal(0.0, 0.12, (n, 3)).astype(np.float32)
+        center = rng.uniform(0.35, 0.65, (n, 2)).astype(np.float32)
+        depth = rng.uniform(0.8, 1.25, n).astype(np.float32)
+        scale = (rng.uniform(0.16, 0.26, n) / depth).astype(np.float32)
+        phase = rng.random(n, dtype=np.float32)
+        speed = rng.uniform(0.8, 1.2, n).astype(np.float32)
+
+        # الحركة الزمنية
+        t = np.linspace(0.0, time_span, t_len, dtype=np.float32)
+        angle = 2.0 * np.pi * (self.frequency[labels, None] * speed[:, None] * t + phase[:, None])
+        osc, osc2 = np.sin(angle), np.cos(angle)  # (n, T)
+
+        curl_t = curl[:, None] + self.articulation_amp[labels][:, None, :, None] * osc[..., None, None]
+        np.clip(curl_t, 0.0, MAX_CURL, out=curl_t)
+        orient_t = orientation[:, None] + self.rotation_amp[labels][:, None] * osc[..., None]
+        trans = self.translation_amp[labels][:, None]
+        center_t = center[:, None] + np.stack([trans[..., 0] * osc, trans[..., 1] * osc2], axis=-1)
+
+        px, py, pz = _joint_axes(curl_t, abduction[:, None])  # كل منها (n, T, 21)
+        rot = _rotation_matrices(orient_t) * scale[:, None, None, None]  # (n, T, 3, 3)
+
+        # دوران + إسقاط على الصورة: y في الصورة للأسفل، z نسبي للمعصم
+        out = np.empty((n, t_len, NUM_LANDMARKS, 3), dtype=np.float32)
+        offsets = (center_t[..., 0:1], center_t[..., 1:2], 0.0)
+        for axis, sign in ((0, 1.0), (1, -1.0), (2, 1.0)):
+            r = rot[..., axis, :, None] * sign
+            out[..., axis] = px * r[..., 0, :] + py * r[..., 1, :] + pz * r[..., 2, :] + offsets[axis]
+        if self.noise > 0:
+            out += self.noise * rng.standard_normal(out.shape, dtype=np.float32)
+        return out, labels
+
+    def stream(self, total: int, chunk_size: int = 65536):
+        """توليد total تسلسل على دفعات (قابلة للتكرار: الدفعة i تستخدم seed=i)"""
+        for index, start in enumerate(range(0, total, chunk_size)):
+            yield self.generate(min(chunk_size, total - start), seed=index)
+
+
+def make_dataset(n: int, num_classes: int, sequence_length: int = None, seed: int = 0,
+                 with_landmarks: bool = False):
+    """
+    بيانات تدريب جاهزة للنموذج (بعد التطبيع + one-hot)
+
+    sequence_length=None → Dense: (n, 63) من آخر إطار
+    sequence_length=T → LSTM: (n, T, 63)
+    with_landmarks=True → يضيف النقاط الخام بنفس الشكل (لميزات features.py الهندسية)
+    """
+    generator = SyntheticHandGenerator(num_classes, sequence_length or 1, seed=seed)
+    landmarks, labels = generator.generate(n, seed=0)
+    features = normalize_landmarks(landmarks)
+    landmarks = landmarks.reshape(features.shape)
+    if sequence_length is None:
+        features, landmarks = features[:, -1], landmarks[:, -1]
+    one_hot = np.eye(num_classes, dtype=np.float32)[labels]
+    if with_landmarks:
+        return features, one_hot, landmarks
+    return features, one_hot
+
+
+def main():
+    parser = argparse.ArgumentParser(description='مولّد بيانات يد اصطناعية')
+    parser.add_argument('--count', type=int, default=100000, help='عدد التسلسلات')
+    parser.add_argument('--classes', type=int, default=48, help='عدد التصنيفات')
+    parser.add_argument('--sequence-length', type=int, default=SEQUENCE_LENGTH)
+    parser.add_argument('--chunk-size', type=int, default=65536)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', type=str, default=None, help='حفظ إلى ملف .npz')
+    parser.add_argument('--benchmark', action='store_true', help='قياس سرعة التوليد فقط')
+
+    args = parser.parse_args()
+
+    generator = SyntheticHandGenerator(args.classes, args.sequence_length, seed=args.seed)
+    print(f"🧪 Generating {args.count:,} sequences "
+          f"(T={args.sequence_length}, classes={args.classes}, "
+          f"dynamic={int(generator.dynamic.sum())})")
+
+    start = time.perf_counter()
+    chunks = []
+    for landmarks, labels in generator.stream(args.count, args.chunk_size):
+        if not args.benchmark:
+            chunks.append((landmarks, labels))
+    elapsed = time.perf_counter() - start
+
+    rate = args.count / elapsed * 60
+    print(f"⏱️  {elapsed:.2f}s → {rate:,.0f} sequences/min")
+
+    if args.output and chunks:
+        landmarks = np.concatenate([c[0] for c in chunks])
+        labels = np.concatenate([c[1] for c in chunks])
+        np.savez_compressed(args.output, landmarks=landmarks, labels=labels)
+        print(f"✅ Saved: {args.output} {landmarks.shape}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,264 @@
+"""
+handspeak train - تدريب نموذج لغة الإشارة العربية على الحروف والإشارات الجديدة
+يدعم LSTM و Dense Neural Network
+
+--variable-length: LSTM بطول متغير (Masking + دفعات حسب الطول، راجع sequences.py)
+يُصدَّر ببعد زمني ديناميكي، أو بعدة أطوال ثابتة مع --export-lengths
+
+--run-dir: تدريب قابل للاستئناف (راجع runs.py) - checkpoint كل epoch، استئناف تلقائي،
+early stopping واستعادة أفضل نموذج حسب val_loss، وجدولة معدل التعلم.
+التحويل إلى TFLite من best.keras، ويمكن إعادته وحده: handspeak export --run-dir
+
+--arch cascade: تدريب Dense و LSTM على نفس البيانات (نفس seed → نفس قوالب التصنيفات
+وترتيب labels.json)، تصدير الاثنين، والتحقق من أن مخرجاتهما تطابق labels.json، ثم كتابة
+cascade.json (الترتيب + الإشارات الحركية، راجع cascade.py). الحدود تُضبط بـ handspeak tune-cascade
+"""
+
+from pathlib import Path
+
+from .export import add_verify_arguments
+from .paths import LABELS_FILE, SCRIPTS_DIR
+
+DEFAULT_NUM_CLASSES = 48  # 28 حرف + 20 إشارة جديدة
+
+
+def add_arguments(parser):
+    parser.add_argument('--arch', choices=("lstm", "dense", "cascade"), default="lstm",
+                        help='نوع النموذج (افتراضي: lstm، cascade = الاثنان معاً)')
+    parser.add_argument('--samples', type=int, default=4800,
+                        help='عدد العينات الاصطناعية للتدريب التجريبي')
+    parser.add_argument('--epochs', type=int, default=3)
+    parser.add_argument('--batch-size', type=int, default=64)
+    parser.add_argument('--sequence-length', type=int, default=10, help='طول التسلسل للـ LSTM')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--variable-length', action='store_true',
+                        help='LSTM بطول متغير: تصنيف قبل اكتمال sequence-length إطار')
+    parser.add_argument('--min-length', type=int, default=1,
+                        help='أقل طول تسلسل في التدريب (مع --variable-length)')
+    parser.add_argument('--buckets', type=int, nargs='+', default=[3, 5, 8],
+                        help='حدود مجموعات الطول للدفعات (مع --variable-length)')
+    parser.add_argument('--export-lengths', type=int, nargs='+', default=None,
+                        help='تصدير بأطوال ثابتة بدل البعد الديناميكي (مع --variable-length)')
+    parser.add_argument('--run-dir', type=str, default=None,
+                        help='مجلد تشغيل قابل للاستئناف (checkpoints + best.keras)')
+    parser.add_argument('--fresh', action='store_true', help='حذف مجلد التشغيل والبدء من جديد')
+    parser.add_argument('--patience', type=int, default=5,
+                        help='early stopping بعد N epochs بدون تحسن val_loss (0 = تعطيل، مع --run-dir)')
+    parser.add_argument('--learning-rate', type=float, default=1e-3)
+    parser.add_argument('--lr-schedule', choices=("cosine", "plateau", "constant"), default="cosine",
+                        help='جدولة معدل التعلم (مع --run-dir)')
+    parser.add_argument('--output', type=str, default=None,
+                        help='ملف .tflite (افتراضي: scripts/arabic_sign_<arch>.tflite)، '
+                             'أو مجلد مع --arch cascade')
+    add_verify_arguments(parser)
+
+
+def load_num_classes(labels_file: Path = LABELS_FILE) -> int:
+    """قراءة labels.json لتحديد عدد التصنيفات"""
+    import json
+
+    if labels_file.exists():
+        with open(labels_file, 'r', encoding='utf-8') as f:
+            labels = json.load(f)
+        print(f"✅ تم تحميل {len(labels)} تصنيف من labels.json")
+        print(f"   التصنيفات: {', '.join(labels[:5])}... (+ {len(labels) - 5} أكثر)")
+        return len(labels)
+    print(f"⚠️  لم يتم العثور على labels.json، استخدام القيمة الافتراضية: {DEFAULT_NUM_CLASSES}")
+    return DEFAULT_NUM_CLASSES
+
+
+def fit_variable_length(model, X, y, args, callbacks: list = None):
+    """
+    تدريب على بدايات التسلسلات (أول k إطار) بأطوال عشوائية في دفعات حسب الطول،
+    ثم طباعة الدقة حسب عدد الإطارات على بيانات التحقق
+    """
+    from .sequences import accuracy_by_frames, bucketed_dataset, print_frames_report, random_lengths
+    from .synthetic_data import SyntheticHandGenerator
+
+    split = int(len(X) * 0.8)
+    lengths = random_lengths(len(X), args.sequence_length, args.min_length, seed=args.seed)
+    train = bucketed_dataset(X[:split], y[:split], lengths[:split], args.batch_size,
+                             args.buckets, seed=args.seed)
+    val = bucketed_dataset(X[split:], y[split:], lengths[split:], args.batch_size,
+                           args.buckets, shuffle=False)
+    history = model.fit(train, validation_data=val, epochs=args.epochs, verbose=1,
+                        callbacks=callbacks)
+
+    # القوالب تُشتق من seed فقط → نفس تصنيفات make_dataset
+    X_val, labels = X[split:], y[split:].argmax(axis=1)
+    dynamic = SyntheticHandGenerator(y.shape[1], seed=args.seed).dynamic[labels]
+    rows = accuracy_by_frames(lambda x: model.predict(x, batch_size=256, verbose=0), X_val, labels,
+                              {"static": ~dynamic, "dynamic": dynamic})
+    print("\n📉 الدقة حسب عدد الإطارات:")
+    print_frames_report(rows)
+    return history
+
+
+def train_cascade(args) -> int:
+    """
+    تدريب وتصدير Dense ثم LSTM (كل منهما عبر run)، ثم التحقق من الملفين وكتابة cascade.json
+    --run-dir يصبح <run-dir>/dense و <run-dir>/lstm
+    """
+    from argparse import Namespace
+
+    from .cascade import check_labels, default_config, dynamic_labels, save_config
+    from .landmarks import load_labels
+    from .models import MODEL_FILES
+    from .synthetic_data import make_dataset
+
+    output_dir = Path(args.output) if args.output else SCRIPTS_DIR
+    output_dir.mkdir(parents=True, exist_ok=True)
+    for arch in ("dense", "lstm"):
+        print(f"\n{'#' * 60}\n# Cascade: {arch.upper()}\n{'#' * 60}")
+        status = run(Namespace(**{
+            **vars(args), "arch": arch, "output": str(output_dir / MODEL_FILES[arch]),
+            "variable_length": args.variable_length and arch == "lstm",
+            "run_dir": str(Path(args.run_dir) / arch) if args.run_dir else None}))
+        if status:
+            return status
+
+    labels = load_labels()
+    config = default_config(labels)
+    lstm_file = output_dir / MODEL_FILES["lstm"]
+    if args.variable_length and args.export_lengths:
+        lstm_files = [lstm_file.with_name(f"{lstm_file.stem}_t{length}{lstm_file.suffix}")
+                      for length in args.export_lengths]
+    else:
+        lstm_files = [lstm_file]
+    try:
+        check_labels(config, labels, [output_dir / MODEL_FILES["dense"]] + lstm_files)
+    except ValueError as e:
+        print(f"❌ {e}")
+        return 1
+
+    # الإشارات الحركية من نفس تسلسلات تدريب LSTM
+    X, y = make_dataset(args.samples, len(labels), args.sequence_length, seed=args.seed)
+    config["dynamic_labels"] = dynamic_labels(X, y.argmax(axis=1), labels, config["motion_threshold"])
+    config_file = save_config(config, output_dir / "cascade.json")
+    print(f"\n✅ Cascade: {len(labels)} تصنيف بنفس ترتيب labels.json في النموذجين، "
+          f"{len(config['dynamic_labels'])} إشارة حركية")
+    print(f"💾 {config_file}")
+    print(f"   انسخ {MODEL_FILES['dense']} و {MODEL_FILES['lstm']} و cascade.json إلى app/src/main/assets/")
+    print(f"   ثم اضبط الحدود: python -m handspeak tune-cascade --dense {output_dir / MODEL_FILES['dense']} "
+          f"--lstm {output_dir / MODEL_FILES['lstm']} --config {config_file} --write-config")
+    return 0
+
+
+def run(args):
+    if args.arch == "cascade":
+        return train_cascade(args)
+
+    from .export import export_model, verify_files
+    from .landmarks import INPUT_SIZE
+    from .models import MODEL_FILES, compile_model, create_model
+    from .synthetic_data import make_dataset
+
+    print("🚀 تدريب نموذج لغة الإشارة العربية")
+    print("=" * 60)
+
+    num_classes = load_num_classes()
+    use_lstm = args.arch == "lstm"
+    if args.variable_length and not use_lstm:
+        print("❌ --variable-length يتطلب --arch lstm")
+        return 2
+
+    print(f"\n📊 إعدادات النموذج:")
+    print(f"   - عدد التصنيفات: {num_classes}")
+    print(f"   - حجم المدخل: {INPUT_SIZE} (21 landmarks × 3)")
+    print(f"   - نوع النموذج: {'LSTM' if use_lstm else 'Dense NN'}")
+    if args.variable_length:
+        print(f"   - طول التسلسل: {args.min_length}-{args.sequence_length} (متغير)")
+    elif use_lstm:
+        print(f"   - طول التسلسل: {args.sequence_length}")
+
+    print(f"\n🔧 إنشاء النموذج...")
+    if args.variable_length:
+        model = create_model(args.arch, num_classes, None, masking=True)
+    else:
+        model = create_model(args.arch, num_classes, args.sequence_length)
+    model = compile_model(model, args.learning_rate)
+    print("\n📊 ملخص النموذج:")
+    model.summary()
+    print(f"\n📈 إجمالي المعاملات: {model.count_params():,}")
+
+    # بيانات اصطناعية (نموذج حركي لليد، راجع synthetic_data.py)
+    print("\n🧪 إنشاء بيانات اصطناعية...")
+    sequence_length = args.sequence_length if use_lstm else None
+    X_train, y_train = make_dataset(args.samples, num_classes, sequence_length, seed=args.seed)
+    print(f"   - عدد العينات: {len(X_train)} | الشكل: {X_train.shape}")
+
+    callbacks, state = None, None
+    if args.run_dir:
+        from .runs import BEST_MODEL_FILE, prepare_run, training_callbacks
+
+        run_dir = Path(args.run_dir)
+        config = {"arch": args.arch, "num_classes": num_classes, "samples": args.samples,
+                  "sequence_length": args.sequence_length, "variable_length": args.variable_length,
+                  "seed": args.seed, "batch_size": args.batch_size, "epochs": args.epochs,
+                  "learning_rate": args.learning_rate, "lr_schedule": args.lr_schedule,
+                  "patience": args.patience}
+        try:
+            state = prepare_run(run_dir, config, args.fresh)
+        except ValueError as e:
+            print(f"❌ {e}")
+            return 2
+        done = len(state["epochs"])
+        if done:
+            print(f"\n♻️  استئناف من {run_dir} (اكتمل {done} epoch، أفضل: epoch {state['best_epoch']})")
+        callbacks = training_callbacks(run_dir, state, args.epochs, args.learning_rate,
+                                       args.lr_schedule, args.patience)
+
+    if state and state["stopped_early"]:
+        print(f"\n⏹️  التدريب توقف مبكراً سابقاً (epoch {state['best_epoch']}) - التحويل فقط")
+    else:
+        print(f"\n🏋️  تدريب تجريبي ({args.epochs} epochs)...")
+        if args.variable_length:
+            history = fit_variable_length(model, X_train, y_train, args, callbacks)
+        else:
+            history = model.fit(
+                X_train,
+                y_train,
+                epochs=args.epochs,
+                batch_size=args.batch_size,
+                verbose=1,
+                validation_split=0.2,
+                callbacks=callbacks
+            )
+        if history.history.get('val_accuracy'):
+            print(f"   ✅ دقة التحقق: {history.history['val_accuracy'][-1]:.2%}")
+
+    if args.run_dir:
+        # التحويل دائماً من أفضل checkpoint (نفس خطوة export --run-dir)
+        if (run_dir / BEST_MODEL_FILE).exists():
+            model.load_weights(run_dir / BEST_MODEL_FILE)
+        best = state["best_val_loss"]
+        print(f"   🏆 أفضل val_loss: {'—' if best is None else f'{best:.4f}'} "
+              f"(epoch {state['best_epoch'] or '—'})")
+
+    print("\n🔄 تحويل إلى TFLite...")
+    model_name = MODEL_FILES[args.arch]
+    output_file = Path(args.output) if args.output else SCRIPTS_DIR / model_name
+    try:
+        files = export_model(model, output_file, args.export_lengths)
+    except Exception as e:
+        print(f"\n❌ خطأ في تحويل النموذج: {e}")
+        print(f"   تأكد من تثبيت TensorFlow بشكل صحيح")
+        if args.run_dir:
+            print(f"   التدريب محفوظ - أعد التحويل فقط: python -m handspeak export --run-dir {args.run_dir}")
+        return 1
+    if not verify_files(args, files, model):
+        return 1
+
+    print(f"\n📋 الخطوات التالية:")
+    print(f"   1. انسخ الملف إلى: app/src/main/assets/{model_name}")
+    print(f"   2. أعد بناء التطبيق (Clean & Rebuild)")
+    print(f"   3. اختبر التطبيق")
+    print(f"\n⚠️  ملاحظة مهمة:")
+    print(f"   هذا نموذج تجريبي للاختبار فقط!")
+    print(f"   للاستخدام الفعلي، درّب النموذج على بيانات حقيقية:")
+    print(f"   - استخدم Google Colab للتدريب")
+    print(f"   - أو استخدم بيانات تدريب من dataset حقيقي")
+    print(f"   - راجع SETUP_MODELS.md للتفاصيل")
+    print("\n" + "=" * 60)
+    print("✅ اكتمل!")
+    return 0
@@ -0,0 +1,214 @@
+"""
+handspeak tune-cascade - اختيار حدود الـ Cascade (Dense أولاً، LSTM عند الحاجة) على تدفق تحقق
+
+النسخة المرجعية في handspeak/cascade.py (مطابقة لـ CascadeClassifier.kt).
+الأداة تعيد تشغيل تدفق (replay_simulator.py و motion_gate.py في scripts/) وتشغّل النموذجين
+على كل إطار فيه يد
+دفعة واحدة، ثم تطبّق قاعدة الـ Cascade لكل مجموعة حدود وتقارن مع LSTM وحده:
+
+- lstm%: نسبة الإطارات التي احتاجت LSTM
+- cost: متوسط زمن الاستدلال لكل إطار = Dense + lstm% × LSTM (زمن batch=1 المقاس،
+  أو --dense-ms / --lstm-ms لمحاكاة جهاز آخر)
+- recall: نسبة إطارات الإشارات المصنّفة بشكل صحيح وبثقة ≥ MIN_CONFIDENCE
+- acc: الدقة على الإطارات المقبولة فقط، agree: التطابق مع LSTM وحده
+
+يتم اختيار أرخص إعداد لا ينقص recall فيه عن LSTM وحده بأكثر من --tolerance،
+ويمكن حفظه في assets/cascade.json للتطبيق (--write-config).
+
+الاستخدام:
+    python -m handspeak tune-cascade --dense arabic_sign_dense.tflite --lstm arabic_sign_lstm.tflite
+    python -m handspeak tune-cascade --dense arabic_sign_dense.tflite --lstm arabic_sign_lstm.tflite \
+        --write-config
+"""
+
+import itertools
+import json
+import math
+
+from .paths import CASCADE_FILE
+
+DENSE_THRESHOLDS = (0.5, 0.6, 0.7, 0.8, 0.9, 0.95, 0.99)
+MOTION_THRESHOLDS = (0.04, 0.06, 0.08, 0.12, float("inf"))
+
+
+def add_arguments(parser):
+    parser.add_argument('--dense', type=str, required=True, help='نموذج Dense (.tflite)')
+    parser.add_argument('--lstm', type=str, required=True, help='نموذج LSTM (.tflite)')
+    parser.add_argument('--config', type=str, default=str(CASCADE_FILE),
+                        help='cascade.json (ترتيب التصنيفات + الإشارات الحركية)')
+    parser.add_argument('--stream', type=str, default=None,
+                        help='تسجيل .npz أو .csv (افتراضي: تدفق اصطناعي)')
+    parser.add_argument('--signs', type=int, default=60, help='عدد الإشارات في التدفق الاصطناعي')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--threads', type=int, default=4)
+    parser.add_argument('--dense-ms', type=float, default=None, help='زمن Dense ثابت بدل المقاس')
+    parser.add_argument('--lstm-ms', type=float, default=None, help='زمن LSTM ثابت بدل المقاس')
+    parser.add_argument('--dense-thresholds', type=float, nargs='+', default=list(DENSE_THRESHOLDS))
+    parser.add_argument('--motion-thresholds', type=float, nargs='+', default=list(MOTION_THRESHOLDS),
+                        help='inf = بدون شرط الحركة')
+    parser.add_argument('--tolerance', type=float, default=0.01,
+                        help='أقصى نقص مقبول في recall عن LSTM وحده')
+    parser.add_argument('--write-config', action='store_true',
+                        help='حفظ أفضل حدود في --config (للتطبيق)')
+    parser.add_argument('--json', type=str, default=None, help='حفظ النتائج في ملف JSON')
+
+
+def measure_ms(classifier, threads: int) -> float:
+    """زمن استدلال واحد (batch=1، p50) مثل التطبيق"""
+    from .benchmark import benchmark_model
+
+    return benchmark_model(classifier.model_path, runs=100, num_threads=threads,
+                           batch_sizes=(1,))["batches"][0]["p50_ms"]
+
+
+def stream_motion(stream, sequence_length: int):
+    """حركة نافذة كل إطار فيه يد (نفس Ring buffer في classifier_inputs)، 0 لغيره"""
+    import numpy as np
+
+    from .cascade import rolling_motion
+
+    motion = np.zeros(len(stream), dtype=np.float32)
+    present = np.flatnonzero(stream.present)
+    if len(present):
+        motion[present] = rolling_motion(stream.features[present], sequence_length)
+    return motion
+
+
+def evaluate(stream, dense_out, lstm_out, motion, cascade, dense_ms: float, lstm_ms: float,
+             lstm_only: dict) -> dict:
+    """cascade: Cascade من cascade.py"""
+    import numpy as np
+
+    from motion_gate import score_predictions
+
+    dense_predicted, dense_confidence = dense_out
+    lstm_predicted, lstm_confidence = lstm_out
+    present = stream.present
+    escalate = present & cascade.needs_lstm(np.maximum(dense_predicted, 0), dense_confidence, motion)
+    predicted = np.where(escalate, lstm_predicted, dense_predicted)
+    confidence = np.where(escalate, lstm_confidence, dense_confidence)
+    lstm_rate = float(escalate.sum() / max(present.sum(), 1))
+    cost = dense_ms + lstm_rate * lstm_ms
+    return {
+        "dense_threshold": cascade.dense_threshold,
+        "motion_threshold": cascade.motion_threshold,
+        "lstm_rate": lstm_rate,
+        "cost_ms_per_frame": cost,
+        "cost_saved": 1.0 - cost / lstm_ms if lstm_ms > 0 else None,
+        "agreement_with_lstm": float((predicted[present] == lstm_predicted[present]).mean())
+        if present.any() else None,
+        "cascade": score_predictions(stream, predicted, confidence),
+        "lstm_only": lstm_only,
+    }
+
+
+def best_config(results: list, tolerance: float):
+    """أرخص إعداد ضمن tolerance من recall الـ LSTM وحده، أو None"""
+    candidates = [r for r in results
+                  if r["cascade"]["frame_recall"] is not None and r["lstm_only"]["frame_recall"] is not None
+                  and r["cascade"]["frame_recall"] >= r["lstm_only"]["frame_recall"] - tolerance]
+    return min(candidates, key=lambda r: r["cost_ms_per_frame"]) if candidates else None
+
+
+def json_threshold(value: float):
+    """inf (بدون شرط الحركة) → None: JSON لا يدعم Infinity (نفس null في cascade.json)"""
+    return None if math.isinf(value) else value
+
+
+def json_result(result: dict) -> dict:
+    return result and {**result, "motion_threshold": json_threshold(result["motion_threshold"])}
+
+
+def _fmt(value, spec):
+    """spec بدون عرض: العرض يُطبَّق على الناتج (:>N) حتى تبقى — بنفس عرض العمود"""
+    return "—" if value is None else format(value, spec)
+
+
+def print_report(results):
+    print(f"{'dense≥':>6} {'motion<':>7} {'lstm%':>7} {'cost':>9} {'saved':>7} {'recall':>7} "
+          f"{'Δrecall':>8} {'acc':>7} {'agree':>7} {'onset':>8}")
+    print("-" * 84)
+    for r in results:
+        cascade, lstm = r["cascade"], r["lstm_only"]
+        d_recall = (None if cascade["frame_recall"] is None or lstm["frame_recall"] is None
+                    else cascade["frame_recall"] - lstm["frame_recall"])
+        print(f"{r['dense_threshold']:>6.2f} {r['motion_threshold']:>7.3f} {r['lstm_rate']:>7.1%} "
+              f"{r['cost_ms_per_frame']:>7.3f}ms {_fmt(r['cost_saved'], '.1%'):>7} "
+              f"{_fmt(cascade['frame_recall'], '.1%'):>7} {_fmt(d_recall, '+.1%'):>8} "
+              f"{_fmt(cascade['accuracy'], '.1%'):>7} {_fmt(r['agreement_with_lstm'], '.1%'):>7} "
+              f"{_fmt(cascade['onset_latency_ms_mean'], '.0f'):>6}ms")
+
+
+def run(args):
+    from .cascade import Cascade, check_labels, load_config, save_config
+    from .landmarks import load_labels
+    from .sign_classifier import SignClassifier
+
+    from motion_gate import frame_predictions, score_predictions
+    from replay_simulator import load_stream, synthetic_stream
+
+    labels = load_labels()
+    config = load_config(args.config)
+    try:
+        check_labels(config, labels, [args.dense, args.lstm])
+    except ValueError as e:
+        print(f"❌ {e}")
+        return 2
+    dense = SignClassifier(args.dense, labels=labels, num_threads=args.threads)
+    lstm = SignClassifier(args.lstm, labels=labels, num_threads=args.threads)
+    if dense.is_sequence_model or not lstm.is_sequence_model:
+        print("❌ --dense must be a single-frame model and --lstm a sequence model")
+        return 2
+
+    if args.stream:
+        stream = load_stream(args.stream, labels)
+    else:
+        stream = synthetic_stream(dense.num_classes, num_signs=args.signs, seed=args.seed)
+    print(f"🎬 Stream: {stream.name} | {len(stream)} frames | {len(stream.segments())} signs")
+    print(f"🏃 Dynamic labels: {len(config.get('dynamic_labels', []))} من {len(labels)}")
+
+    dense_ms = args.dense_ms if args.dense_ms is not None else measure_ms(dense, args.threads)
+    lstm_ms = args.lstm_ms if args.lstm_ms is not None else measure_ms(lstm, args.threads)
+    print(f"⏱️  Dense {dense_ms:.3f}ms | LSTM {lstm_ms:.3f}ms per inference")
+
+    dense_out = frame_predictions(stream, dense)
+    lstm_out = frame_predictions(stream, lstm)
+    motion = stream_motion(stream, lstm.sequence_length)
+    lstm_only = score_predictions(stream, *lstm_out)
+    dense_only = score_predictions(stream, *dense_out)
+
+    results = []
+    for dense_threshold, motion_threshold in itertools.product(args.dense_thresholds,
+                                                               args.motion_thresholds):
+        cascade = Cascade(dense, lstm, dense_threshold, motion_threshold,
+                          config.get("dynamic_labels", ()))
+        results.append(evaluate(stream, dense_out, lstm_out, motion, cascade,
+                                dense_ms, lstm_ms, lstm_only))
+
+    print(f"📊 LSTM only:  recall {_fmt(lstm_only['frame_recall'], '.1%')} | "
+          f"acc {_fmt(lstm_only['accuracy'], '.1%')} | cost {lstm_ms:.3f}ms/frame")
+    print(f"📊 Dense only: recall {_fmt(dense_only['frame_recall'], '.1%')} | "
+          f"acc {_fmt(dense_only['accuracy'], '.1%')} | cost {dense_ms:.3f}ms/frame")
+    print()
+    print_report(results)
+
+    best = best_config(results, args.tolerance)
+    if best is None:
+        print(f"\n⚠️  لا يوجد إعداد ضمن {args.tolerance:.0%} من LSTM وحده")
+    else:
+        print(f"\n🏁 أفضل إعداد: dense≥{best['dense_threshold']:.2f} motion<{best['motion_threshold']:g} → "
+              f"LSTM في {best['lstm_rate']:.1%} من الإطارات، "
+              f"{best['cost_ms_per_frame']:.3f}ms/frame ({_fmt(best['cost_saved'], '.0%')} أقل)")
+        if args.write_config:
+            config.update(dense_threshold=best["dense_threshold"],
+                          motion_threshold=json_threshold(best["motion_threshold"]))
+            print(f"💾 Saved: {save_config(config, args.config)}")
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump({"stream": stream.name, "dense_ms": dense_ms, "lstm_ms": lstm_ms,
+                       "dense_only": dense_only, "best": json_result(best),
+                       "results": [json_result(r) for r in results]},
+                      f, ensure_ascii=False, indent=2, allow_nan=False)
+        print(f"\n📄 Saved: {args.json}")
+    return 0
@@ -0,0 +1,358 @@
+"""
+handspeak verify - بوابة تحقق بعد التحويل: Keras ↔ .tflite الجديد ↔ النموذج الحالي في assets
+
+نفس العينات (يد اصطناعية بعد التطبيع، راجع synthetic_data.py) تمر على النماذج الثلاثة
+دفعة واحدة لكل نموذج (Batch)، ثم:
+- عدد مخرجات كل نموذج = عدد labels.json (مثل نموذج 28 تصنيف مع 48 في labels.json)
+- أقصى فرق مطلق بين الاحتمالات، ونسبة تطابق التصنيف الأعلى (top-1)
+- نسبة الاختلاف لكل تصنيف (حسب تصنيف النموذج المرجعي) وأسوأ التصنيفات
+
+البوابة تفشل إذا اختلف عدد المخرجات، أو تجاوز فرق Keras ↔ .tflite الحد --max-diff،
+أو قل التطابق عن --min-agreement. المقارنة مع النموذج الحالي في assets للمعلومات فقط
+(النموذج الجديد قد يختلف عنه عمداً بعد إعادة التدريب)، إلا مع --min-reference-agreement.
+اختلاف top-1 بين تصنيفين شبه متساويين في المرجع (ضمن TIE_MARGIN) يُعدّ تعادلاً لا اختلافاً،
+بحد أقصى --max-ties من العينات (التقرير يذكر عدد المستثنى). إذا كان المرجع نفسه بلا
+تصنيف أعلى واضح (أعلى احتمالين ضمن TIE_MARGIN) في أكثر من --max-ties من العينات -
+نموذج تجريبي أو مدرّب لـ epoch واحد بمخرجات شبه منتظمة - فـ top-1 غير حاسم ولا يُفشل
+البوابة (مع تحذير)، ويبقى فحص max |Δ| وعدد المخرجات.
+ملف LSTM لا يعمل هنا (Select TF Ops بدون Flex) يُقارن مع Keras عبر نسخة batch=1 من نفس
+الأوزان (export_lstm_model → عمليات WHILE أساسية بدون Flex). بدون نموذج Keras لا توجد
+مقارنة رقمية فتفشل البوابة، إلا مع --allow-skip (فحص عدد المخرجات فقط).
+
+export و train يشغّلان البوابة تلقائياً بعد كل تحويل (--no-verify للتخطي).
+
+الاستخدام:
+    python -m handspeak verify --tflite arabic_sign_dense.tflite --keras dense.keras
+    python -m handspeak verify --tflite arabic_sign_lstm.tflite --run-dir runs/lstm
+    python -m handspeak verify --tflite arabic_sign_lstm.tflite --reference old.tflite --json verify.json
+"""
+
+import json
+from pathlib import Path
+
+from .paths import ASSETS_DIR
+
+DEFAULT_SAMPLES = 4096
+DEFAULT_MAX_DIFF = 0.1
+DEFAULT_MIN_AGREEMENT = 0.99
+TIE_MARGIN = 1e-3  # اختلاف top-1 بين تصنيفين شبه متساويين في المرجع لا يُحسب
+DEFAULT_MAX_TIES = 0.02  # أقصى نسبة عينات تُستثنى كتعادل، والباقي يُحسب اختلافاً
+CHUNK_SIZE = 1024
+FLEX_ERROR = "requires Select TF Ops (Flex delegate)"
+WORST_CLASSES = 5
+
+
+def add_arguments(parser):
+    parser.add_argument('--tflite', type=str, nargs='+', required=True,
+                        help='ملفات .tflite الجديدة (عدة ملفات مع --export-lengths)')
+    parser.add_argument('--keras', type=str, default=None, help='نموذج .keras المصدر')
+    parser.add_argument('--run-dir', type=str, default=None,
+                        help='best.keras من مجلد تشغيل train --run-dir')
+    parser.add_argument('--reference', type=str, default=None,
+                        help='النموذج الحالي للمقارنة (افتراضي: assets/<اسم الملف>)')
+    parser.add_argument('--samples', type=int, default=DEFAULT_SAMPLES, help='عدد العينات')
+    parser.add_argument('--seed', type=int, default=42, help='seed قوالب التصنيفات (مثل train)')
+    parser.add_argument('--threads', type=int, default=4)
+    add_gate_arguments(parser)
+    parser.add_argument('--json', type=str, default=None, help='حفظ النتائج في ملف JSON')
+
+
+def add_gate_arguments(parser):
+    """حدود البوابة (مشتركة مع export و train)"""
+    parser.add_argument('--max-diff', type=float, default=DEFAULT_MAX_DIFF,
+                        help='أقصى فرق مطلق مقبول بين احتمالات Keras و .tflite')
+    parser.add_argument('--min-agreement', type=float, default=DEFAULT_MIN_AGREEMENT,
+                        help='أقل تطابق top-1 مقبول بين Keras و .tflite')
+    parser.add_argument('--min-reference-agreement', type=float, default=None,
+                        help='أقل تطابق top-1 مع النموذج الحالي في assets (افتراضي: للمعلومات فقط)')
+    parser.add_argument('--max-ties', type=float, default=DEFAULT_MAX_TIES,
+                        help='أقصى نسبة عينات تُستثنى كتعادل من top-1 (الباقي يُحسب اختلافاً)')
+    parser.add_argument('--allow-skip', action='store_true',
+                        help='النجاح حتى لو لم يعمل الملف هنا (Select TF Ops بدون Flex): فحص المخرجات فقط')
+
+
+def sample_inputs(num_classes: int, samples: int, sequence_length: int, seed: int = 42):
+    """
+    عينات التحقق (بعد التطبيع): (samples, sequence_length, 63) لكل التصنيفات بالتساوي
+    نفس قوالب train (نفس seed) لكن عينات غير عينات التدريب
+    النماذج أحادية الإطار تأخذ آخر إطار، وملفات الأطوال الثابتة آخر T إطار
+    """
+    import numpy as np
+
+    from .landmarks import normalize_landmarks
+    from .synthetic_data import SyntheticHandGenerator
+
+    generator = SyntheticHandGenerator(num_classes, sequence_length, seed=seed)
+    labels = np.arange(samples) % num_classes
+    landmarks, _ = generator.generate(samples, seed=1, labels=labels)
+    return normalize_landmarks(landmarks).astype(np.float32)
+
+
+def model_inputs(sequences, sequence_model: bool, sequence_length: int):
+    return sequences[:, -sequence_length:] if sequence_model else sequences[:, -1]
+
+
+def keras_outputs(model, sequences, sequence_length: int):
+    """احتمالات Keras على دفعات CHUNK_SIZE (نفس نافذة ملف .tflite المقارن)"""
+    from .models import is_sequence_model
+
+    inputs = model_inputs(sequences, is_sequence_model(model), sequence_length)
+    return model.predict(inputs, batch_size=CHUNK_SIZE, verbose=0)
+
+
+def input_length(model_path) -> int:
+    """طول نافذة ملف .tflite بدون allocate_tensors (1 = Dense)"""
+    from .landmarks import SEQUENCE_LENGTH
+    from .sign_classifier import load_interpreter
+
+    details = load_interpreter(model_path, num_threads=1).get_input_details()[0]
+    signature = list(details.get('shape_signature', details['shape']))
+    if len(signature) != 3:
+        return 1
+    return SEQUENCE_LENGTH if signature[1] == -1 else int(signature[1])
+
+
+def tflite_outputs(classifier, sequences):
+    """احتمالات TFLite على دفعات CHUNK_SIZE (SignClassifier.predict)"""
+    import numpy as np
+
+    inputs = model_inputs(sequences, classifier.is_sequence_model, classifier.sequence_length)
+    return np.concatenate([classifier.predict(inputs[i:i + CHUNK_SIZE])
+                           for i in range(0, len(inputs), CHUNK_SIZE)])
+
+
+def compare_outputs(expected, actual, labels: list, max_ties: float = DEFAULT_MAX_TIES) -> dict:
+    """
+    مقارنة احتمالات نموذجين على نفس العينات (expected = المرجع)
+    ties: اختلافات بين تصنيفين احتمالاهما في المرجع ضمن TIE_MARGIN. أقربها حتى
+    max_ties من العينات لا تُحسب في top1_agreement ولا per_class (ties_excluded)،
+    والباقي يُحسب اختلافاً حتى لا تخفي التعادلات اختلافاً حقيقياً
+    ambiguous: عينات أعلى احتمالين فيها في المرجع ضمن TIE_MARGIN؛ إذا تجاوزت max_ties
+    فالمرجع شبه منتظم و top1_decisive = False (ضوضاء التحويل تقلب التصنيف الأعلى عشوائياً)
+    per_class: لكل تصنيف يتوقعه المرجع، نسبة العينات التي يختلف فيها الآخر
+    """
+    import numpy as np
+
+    expected_top1 = expected.argmax(axis=1)
+    actual_top1 = actual.argmax(axis=1)
+    rows = np.arange(len(expected))
+    margin = expected[rows, expected_top1] - expected[rows, actual_top1]
+    disagree = expected_top1 != actual_top1
+    ties = np.flatnonzero(disagree & (margin <= TIE_MARGIN))
+    excluded = ties[np.argsort(margin[ties], kind="stable")[:int(max_ties * len(expected))]]
+    top2 = np.sort(expected, axis=1)[:, -2:]
+    ambiguous = int((top2[:, 1] - top2[:, 0] <= TIE_MARGIN).sum())
+    disagree[excluded] = False
+    num_classes = expected.shape[1]
+    counts = np.bincount(expected_top1, minlength=num_classes)
+    errors = np.bincount(expected_top1[disagree], minlength=num_classes)
+    per_class = [{"label": labels[c] if c < len(labels) else str(c), "samples": int(counts[c]),
+                  "disagreements": int(errors[c]), "rate": float(errors[c] / counts[c])}
+                 for c in range(num_classes) if counts[c]]
+    diff = np.abs(expected - actual)
+    return {
+        "samples": len(expected),
+        "max_abs_diff": float(diff.max()),
+        "mean_abs_diff": float(diff.mean()),
+        "top1_agreement": float(1.0 - disagree.mean()),
+        "ties": len(ties),
+        "ties_excluded": len(excluded),
+        "ambiguous": ambiguous,
+        "top1_decisive": ambiguous <= max_ties * len(expected),
+        "per_class": sorted(per_class, key=lambda c: -c["rate"]),
+    }
+
+
+def check_shape(name: str, num_classes: int, labels: list, failures: list, required: bool = True):
+    ok = num_classes == len(labels)
+    mark = "✅" if ok else ("❌" if required else "⚠️ ")
+    print(f"   {mark} {name}: {num_classes} مخرج (labels.json: {len(labels)})")
+    if not ok and required:
+        failures.append(f"{name} has {num_classes} outputs, labels.json has {len(labels)}")
+    return ok
+
+
+def print_comparison(title: str, result: dict):
+    print(f"\n🔍 {title}: max |Δ| {result['max_abs_diff']:.5f} | mean |Δ| {result['mean_abs_diff']:.6f} | "
+          f"top-1 {result['top1_agreement']:.2%}" +
+          (f" ({result['ties_excluded']}/{result['samples']} مستثناة كتعادل، "
+           f"{result['ties'] - result['ties_excluded']} تعادل فوق الحد محسوبة)"
+           if result["ties"] else ""))
+    if not result["top1_decisive"]:
+        print(f"   ⚠️  المرجع شبه منتظم ({result['ambiguous']}/{result['samples']} عينة بلا تصنيف أعلى "
+              f"واضح): top-1 غير حاسم، الفحص بـ max |Δ| فقط")
+    worst = [c for c in result["per_class"][:WORST_CLASSES] if c["disagreements"]]
+    if worst:
+        print("   أكثر التصنيفات اختلافاً: " +
+              ", ".join(f"{c['label']} {c['disagreements']}/{c['samples']}" for c in worst))
+
+
+def load_classifier(model_path, labels: list, threads: int):
+    """SignClassifier، أو (None، السبب) إذا لم يعمل هنا (Select TF Ops بدون Flex delegate)"""
+    from .sign_classifier import SignClassifier
+
+    try:
+        return SignClassifier(model_path, labels=labels, num_threads=threads), None
+    except (RuntimeError, ValueError) as e:
+        if "Select TensorFlow op" in str(e):
+            return None, FLEX_ERROR
+        return None, str(e).splitlines()[0]
+
+
+def flex_free_outputs(model, sequence_length: int, sequences, labels: list, threads: int):
+    """
+    احتمالات نسخة batch=1 من نموذج Keras الزمني (export_lstm_model) بدل ملف يحتاج Flex:
+    نفس الأوزان والتكميم، لكن LSTM يتحول إلى WHILE أساسية فيعمل هنا
+    المخرجات: (الاحتمالات، None) أو (None، السبب)
+    """
+    import tempfile
+
+    from .models import convert_to_tflite, export_lstm_model
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        proxy_file = Path(temp_dir) / f"flex_free_t{sequence_length}.tflite"
+        proxy_file.write_bytes(convert_to_tflite(export_lstm_model(model, sequence_length)))
+        classifier, error = load_classifier(proxy_file, labels, threads)
+        if classifier is None:
+            return None, error
+        return tflite_outputs(classifier, sequences), None
+
+
+def check_reference(tflite_file: Path, reference, labels: list):
+    """
+    النموذج الحالي المقابل (reference أو assets/<اسم الملف>) إذا وُجد وطابق عدد
+    مخرجاته labels.json، وإلا None (للمعلومات فقط: لا يُفشل البوابة)
+    """
+    from .sign_classifier import model_output_classes
+
+    reference_file = Path(reference) if reference else ASSETS_DIR / tflite_file.name
+    if not reference_file.exists() or reference_file.resolve() == tflite_file.resolve():
+        return None
+    if not check_shape(f"{reference_file.name} (الحالي)", model_output_classes(reference_file),
+                       labels, [], required=False):
+        return None
+    return reference_file
+
+
+def verify_export(tflite_files: list, model=None, reference=None, labels: list = None,
+                  samples: int = DEFAULT_SAMPLES, seed: int = 42, threads: int = 4,
+                  max_diff: float = DEFAULT_MAX_DIFF, min_agreement: float = DEFAULT_MIN_AGREEMENT,
+                  min_reference_agreement: float = None, max_ties: float = DEFAULT_MAX_TIES,
+                  allow_skip: bool = False) -> dict:
+    """
+    تشغيل البوابة على ملفات .tflite الجديدة
+    model: نموذج Keras المصدر (اختياري)، reference: النموذج الحالي (None = assets/<اسم الملف>)
+    ملف يحتاج Flex يُقارن عبر flex_free_outputs إذا توفر model الزمني، وإلا = فشل
+    إلا مع allow_skip (فحص المخرجات فقط)
+    المخرجات: {"passed": bool، "failures": [...]، "models": {...}}
+    """
+    import time
+
+    from .landmarks import SEQUENCE_LENGTH, load_labels
+    from .models import is_sequence_model
+    from .sign_classifier import model_output_classes
+
+    labels = labels if labels is not None else load_labels()
+    started = time.perf_counter()
+    failures = []
+    report = {"labels": len(labels), "samples": samples, "models": {}}
+    print(f"\n🧪 التحقق من التحويل ({samples} عينة، {len(labels)} تصنيف)...")
+
+    files = [Path(f) for f in tflite_files]
+    length = max([SEQUENCE_LENGTH] + [input_length(f) for f in files])
+    sequences = sample_inputs(len(labels), samples, length, seed)
+    expected = {}  # طول النافذة → احتمالات Keras
+    if model is not None:
+        check_shape("Keras", int(model.outputs[0].shape[-1]), labels, failures)
+
+    for tflite_file in files:
+        result = {"num_classes": model_output_classes(tflite_file)}
+        report["models"][tflite_file.name] = result
+        if not check_shape(tflite_file.name, result["num_classes"], labels, failures):
+            continue
+        classifier, error = load_classifier(tflite_file, labels, threads)
+        title = tflite_file.name
+        window = input_length(tflite_file)
+        outputs = None
+        if classifier is not None:
+            outputs = tflite_outputs(classifier, sequences)
+        elif error == FLEX_ERROR and model is not None and is_sequence_model(model):
+            # نماذج LSTM بـ Select TF Ops تعمل في التطبيق فقط: المقارنة عبر نسخة بدون Flex
+            print(f"   ℹ️  {tflite_file.name} يحتاج Flex: المقارنة عبر نسخة batch=1 من نفس الأوزان")
+            title = f"{tflite_file.name} (batch=1 بدون Flex)"
+            result["compared_via"] = "flex-free batch=1 conversion"
+            outputs, error = flex_free_outputs(model, window, sequences, labels, threads)
+        if outputs is None:
+            result["skipped"] = error
+            if allow_skip:
+                print(f"   ⚠️  {tflite_file.name} لا يعمل هنا، تم تخطي المقارنة: {error}")
+            else:
+                print(f"   ❌ {tflite_file.name} لا يعمل هنا: {error}")
+                failures.append(f"{tflite_file.name} not compared: {error} "
+                                "(--keras / --run-dir to compare via batch=1, or --allow-skip)")
+            check_reference(tflite_file, reference, labels)
+            continue
+
+        if model is not None and model.outputs[0].shape[-1] == result["num_classes"]:
+            if window not in expected:
+                expected[window] = keras_outputs(model, sequences, window)
+            result["keras"] = compare_outputs(expected[window], outputs, labels, max_ties)
+            print_comparison(f"Keras ↔ {title}", result["keras"])
+            if result["keras"]["max_abs_diff"] > max_diff:
+                failures.append(f"{tflite_file.name}: max |Δ| {result['keras']['max_abs_diff']:.5f} "
+                                f"> {max_diff} vs Keras")
+            if result["keras"]["top1_decisive"] and result["keras"]["top1_agreement"] < min_agreement:
+                failures.append(f"{tflite_file.name}: top-1 agreement "
+                                f"{result['keras']['top1_agreement']:.2%} < {min_agreement:.2%} vs Keras")
+
+        reference_file = check_reference(tflite_file, reference, labels)
+        if reference_file is None:
+            continue
+        reference_name = f"{reference_file.name} (الحالي)"
+        reference_classifier, error = load_classifier(reference_file, labels, threads)
+        if reference_classifier is None:
+            print(f"   ⚠️  {reference_name} لا يعمل هنا، تم تخطي المقارنة: {error}")
+            continue
+        result["reference"] = compare_outputs(tflite_outputs(reference_classifier, sequences),
+                                              outputs, labels, max_ties)
+        result["reference"]["path"] = str(reference_file)
+        print_comparison(f"{reference_name} ↔ {title}", result["reference"])
+        if (min_reference_agreement is not None and result["reference"]["top1_decisive"]
+                and result["reference"]["top1_agreement"] < min_reference_agreement):
+            failures.append(f"{tflite_file.name}: top-1 agreement "
+                            f"{result['reference']['top1_agreement']:.2%} < "
+                            f"{min_reference_agreement:.2%} vs {reference_file}")
+
+    report.update(passed=not failures, failures=failures, seconds=time.perf_counter() - started)
+    if failures:
+        print(f"\n❌ فشل التحقق ({report['seconds']:.1f}s) - لا تنسخ النموذج إلى assets:")
+        for failure in failures:
+            print(f"   - {failure}")
+    else:
+        print(f"\n✅ التحقق ناجح ({report['seconds']:.1f}s)")
+    return report
+
+
+def run(args):
+    model = None
+    if args.run_dir:
+        from .runs import BEST_MODEL_FILE
+
+        args.keras = str(Path(args.run_dir) / BEST_MODEL_FILE)
+    if args.keras:
+        import tensorflow as tf
+
+        print(f"📥 تحميل النموذج: {args.keras}")
+        model = tf.keras.models.load_model(args.keras)
+
+    if args.reference and len(args.tflite) > 1:
+        print("❌ --reference مع ملف .tflite واحد فقط")
+        return 2
+    report = verify_export(args.tflite, model, args.reference, None, args.samples, args.seed,
+                           args.threads, args.max_diff, args.min_agreement,
+                           args.min_reference_agreement, args.max_ties, args.allow_skip)
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"\n📄 Saved: {args.json}")
+    return 0 if report["passed"] else 1
@@ -0,0 +1,255 @@
+#!/usr/bin/env python3
+"""
+جدولة الاستدلال حسب الحركة (Motion Gate) + أداة تقييم
+
+عندما تكون اليد ثابتة تعطي الإطارات المتتالية نفس التنبؤ تقريباً، فلا داعي لتشغيل
+المصنّف في كل إطار. هذه نسخة مرجعية من MotionGate.kt:
+
+- motion score: متوسط المسافة بين كل landmark في إطارين متتاليين (بعد التطبيع)
+- score < still_threshold والحركة المتراكمة منذ آخر استدلال صغيرة → إعادة استخدام آخر تنبؤ
+- score < motion_threshold → استدلال كل coarse_stride إطار فقط
+- غير ذلك → استدلال في كل إطار
+- إجبار الاستدلال بعد max_staleness إطار مهما كانت الحركة
+
+أداة التقييم تعيد تشغيل تدفقات (replay_simulator) وتقارن مع الاستدلال في كل إطار:
+نسبة الاستدلالات الموفّرة، الدقة، والتأخير من بداية الإشارة.
+
+الاستخدام:
+    python motion_gate.py --model arabic_sign_dense.tflite
+    python motion_gate.py --model arabic_sign_dense.tflite --sweep
+"""
+
+import argparse
+import itertools
+import json
+
+import numpy as np
+
+from handspeak.landmarks import MIN_CONFIDENCE, NUM_LANDMARKS, load_labels
+from handspeak.sign_classifier import SignClassifier
+
+from replay_simulator import classifier_inputs, load_stream, synthetic_stream
+
+# نفس القيم الافتراضية في MotionGate.kt
+DEFAULT_STILL_THRESHOLD = 0.04
+DEFAULT_MOTION_THRESHOLD = 0.08
+DEFAULT_COARSE_STRIDE = 2
+DEFAULT_MAX_STALENESS = 15
+
+
+def motion_score(previous: np.ndarray, current: np.ndarray) -> float:
+    """متوسط المسافة الإقليدية بين النقاط المتقابلة في إطارين (63 قيمة لكل منهما)"""
+    diff = (np.asarray(current) - np.asarray(previous)).reshape(NUM_LANDMARKS, 3)
+    return float(np.sqrt((diff * diff).sum(axis=1)).mean())
+
+
+def motion_scores(features: np.ndarray) -> np.ndarray:
+    """motion score لكل إطار مقارنة بالسابق (Vectorized)، الإطار الأول = inf"""
+    frames = np.asarray(features, dtype=np.float32).reshape(len(features), NUM_LANDMARKS, 3)
+    scores = np.full(len(frames), np.inf, dtype=np.float32)
+    if len(frames) > 1:
+        diff = frames[1:] - frames[:-1]
+        scores[1:] = np.sqrt((diff * diff).sum(axis=2)).mean(axis=1)
+    return scores
+
+
+class MotionGate:
+    """نسخة Python مطابقة لـ MotionGate.kt"""
+
+    def __init__(self, still_threshold: float = DEFAULT_STILL_THRESHOLD,
+                 motion_threshold: float = DEFAULT_MOTION_THRESHOLD,
+                 coarse_stride: int = DEFAULT_COARSE_STRIDE,
+                 max_staleness: int = DEFAULT_MAX_STALENESS):
+        self.still_threshold = still_threshold
+        self.motion_threshold = motion_threshold
+        self.coarse_stride = coarse_stride
+        self.max_staleness = max_staleness
+        self.frames_observed = 0
+        self.inferences_run = 0
+        self.reset()
+
+    def reset(self):
+        """عند فقدان اليد أو تغيير الإشارة"""
+        self.previous_frame = None
+        self.accumulated_motion = 0.0
+        self.frames_since_inference = 0
+        self.last_result = None
+
+    def should_infer(self, frame, score: float = None) -> bool:
+        """
+        هل يجب تشغيل المصنّف لهذا الإطار؟
+        score اختياري (إذا كان محسوباً مسبقاً)
+        """
+        self.frames_observed += 1
+        if score is None:
+            score = (np.inf if self.previous_frame is None
+                     else motion_score(self.previous_frame, frame))
+        self.previous_frame = frame
+        self.frames_since_inference += 1
+        self.accumulated_motion += score
+
+        if self.last_result is None or self.frames_since_inference >= self.max_staleness:
+            return True
+        if score < self.still_threshold and self.accumulated_motion < self.motion_threshold:
+            return False
+        if score < self.motion_threshold:
+            return self.frames_since_inference >= self.coarse_stride
+        return True
+
+    def on_inference(self, result):
+        self.inferences_run += 1
+        self.last_result = result
+        self.frames_since_inference = 0
+        self.accumulated_motion = 0.0
+
+
+# ---- التقييم ----
+
+def frame_predictions(stream, classifier: SignClassifier):
+    """
+    تنبؤ المصنّف لكل إطار فيه يد (دفعة واحدة)
+    المخرجات: (predicted (F,), confidence (F,)) و -1 للإطارات بدون يد
+    """
+    predicted = np.full(len(stream), -1, dtype=np.int64)
+    confidence = np.zeros(len(stream), dtype=np.float32)
+    present, inputs = classifier_inputs(stream, classifier)
+    if len(present) == 0:
+        return predicted, confidence
+    probabilities = classifier.predict(inputs)
+    predicted[present] = probabilities.argmax(axis=1)
+    confidence[present] = probabilities.max(axis=1)
+    return predicted, confidence
+
+
+def apply_gate(stream, predicted, confidence, gate: MotionGate):
+    """
+    تشغيل البوابة على التدفق: الإطارات التي تُعاد فيها النتيجة تأخذ آخر تنبؤ
+    المخرجات: (gated_predicted, gated_confidence, inferred mask)
+    """
+    scores = motion_scores(stream.features)
+    gated_predicted = predicted.copy()
+    gated_confidence = confidence.copy()
+    inferred = np.zeros(len(stream), dtype=bool)
+    was_present = False
+    for i in range(len(stream)):
+        if not stream.present[i]:
+            gate.reset()
+            was_present = False
+            continue
+        score = scores[i] if was_present else np.inf
+        was_present = True
+        if gate.should_infer(stream.features[i], score=score):
+            gate.on_inference((predicted[i], confidence[i]))
+            inferred[i] = True
+        else:
+            gated_predicted[i], gated_confidence[i] = gate.last_result
+    return gated_predicted, gated_confidence, inferred
+
+
+def score_predictions(stream, predicted, confidence, min_confidence: float = MIN_CONFIDENCE):
+    """الدقة على الإطارات التي فيها إشارة + التأخير من بداية الإشارة"""
+    labelled = (stream.labels >= 0) & stream.present
+    accepted = labelled & (confidence >= min_confidence)
+    correct = accepted & (predicted == stream.labels)
+    latencies = []
+    for start, end, label in stream.segments():
+        hits = np.flatnonzero(correct[start:end])
+        if len(hits):
+            latencies.append(hits[0] / stream.fps * 1000.0)
+    return {
+        "accuracy": float(correct.sum() / accepted.sum()) if accepted.any() else None,
+        "frame_recall": float(correct.sum() / labelled.sum()) if labelled.any() else None,
+        "onset_latency_ms_mean": float(np.mean(latencies)) if latencies else None,
+        "signs_recognized": len(latencies) / max(len(stream.segments()), 1),
+    }
+
+
+def evaluate(stream, predicted, confidence, gate: MotionGate) -> dict:
+    gated_predicted, gated_confidence, inferred = apply_gate(stream, predicted, confidence, gate)
+    present = stream.present
+    baseline = score_predictions(stream, predicted, confidence)
+    gated = score_predictions(stream, gated_predicted, gated_confidence)
+    return {
+        "still_threshold": gate.still_threshold,
+        "motion_threshold": gate.motion_threshold,
+        "coarse_stride": gate.coarse_stride,
+        "max_staleness": gate.max_staleness,
+        "inferences_saved": float(1.0 - inferred.sum() / max(present.sum(), 1)),
+        "agreement_with_baseline": float((gated_predicted[present] == predicted[present]).mean())
+        if present.any() else None,
+        "baseline": baseline,
+        "gated": gated,
+    }
+
+
+def _fmt(value, spec):
+    """spec بدون عرض: العرض يُطبَّق على الناتج (:>N) حتى تبقى — بنفس عرض العمود"""
+    return "—" if value is None else format(value, spec)
+
+
+def print_report(results):
+    print(f"{'still':>6} {'motion':>6} {'stride':>6} {'stale':>5} {'saved':>7} {'agree':>7} "
+          f"{'acc':>7} {'Δacc':>7} {'onset':>8} {'Δonset':>8}")
+    print("-" * 80)
+    for r in results:
+        base, gated = r["baseline"], r["gated"]
+        d_acc = (None if gated["accuracy"] is None or base["accuracy"] is None
+                 else gated["accuracy"] - base["accuracy"])
+        d_onset = (None if gated["onset_latency_ms_mean"] is None
+                   or base["onset_latency_ms_mean"] is None
+                   else gated["onset_latency_ms_mean"] - base["onset_latency_ms_mean"])
+        print(f"{r['still_threshold']:>6.3f} {r['motion_threshold']:>6.3f} "
+              f"{r['coarse_stride']:>6} {r['max_staleness']:>5} {r['inferences_saved']:>7.1%} "
+              f"{_fmt(r['agreement_with_baseline'], '.1%'):>7} {_fmt(gated['accuracy'], '.1%'):>7} "
+              f"{_fmt(d_acc, '+.1%'):>7} {_fmt(gated['onset_latency_ms_mean'], '.0f'):>6}ms "
+              f"{_fmt(d_onset, '+.0f'):>6}ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='تقييم Motion Gate على تدفقات مسجّلة أو اصطناعية')
+    parser.add_argument('--model', type=str, required=True, help='ملف .tflite')
+    parser.add_argument('--stream', type=str, default=None,
+                        help='تسجيل .npz أو .csv (افتراضي: تدفق اصطناعي)')
+    parser.add_argument('--signs', type=int, default=60, help='عدد الإشارات في التدفق الاصطناعي')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--still-threshold', type=float, default=DEFAULT_STILL_THRESHOLD)
+    parser.add_argument('--motion-threshold', type=float, default=DEFAULT_MOTION_THRESHOLD)
+    parser.add_argument('--coarse-stride', type=int, default=DEFAULT_COARSE_STRIDE)
+    parser.add_argument('--max-staleness', type=int, default=DEFAULT_MAX_STALENESS)
+    parser.add_argument('--sweep', action='store_true', help='تجربة مجموعة من القيم')
+    parser.add_argument('--json', type=str, default=None, help='حفظ النتائج في ملف JSON')
+
+    args = parser.parse_args()
+
+    labels = load_labels()
+    classifier = SignClassifier(args.model, labels=labels)
+    if args.stream:
+        stream = load_stream(args.stream, labels)
+    else:
+        stream = synthetic_stream(classifier.num_classes, num_signs=args.signs, seed=args.seed)
+
+    print(f"🎬 Stream: {stream.name} | {len(stream)} frames | {len(stream.segments())} signs")
+    predicted, confidence = frame_predictions(stream, classifier)
+
+    if args.sweep:
+        grid = itertools.product([0.02, 0.04, 0.06], [0.08, 0.12], [2, 3, 5], [10, 15, 30])
+        configs = [(s, m, c, st) for s, m, c, st in grid if s < m]
+    else:
+        configs = [(args.still_threshold, args.motion_threshold,
+                    args.coarse_stride, args.max_staleness)]
+
+    results = [evaluate(stream, predicted, confidence, MotionGate(*config)) for config in configs]
+    baseline = results[0]["baseline"]
+    print(f"📊 Baseline (every frame): accuracy {_fmt(baseline['accuracy'], '.1%')} | "
+          f"onset {_fmt(baseline['onset_latency_ms_mean'], '.0f')}ms")
+    print()
+    print_report(results)
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump({"stream": stream.name, "results": results}, f, ensure_ascii=False, indent=2)
+        print(f"\n📄 Saved: {args.json}")
+
+
+if __name__ == "__main__":
+    main()
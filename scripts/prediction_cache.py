@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+ذاكرة تخزين مؤقت (LRU) لنتائج المصنّف + أداة اختيار الإعدادات
+
+المستخدم يكرر نفس الحروف كثيراً، والإطارات المتتالية لوضعية ثابتة تعطي مدخلات
+شبه متطابقة. هذه نسخة مرجعية من PredictionCache.kt:
+
+- تقريب المدخلات (إطار أو نافذة) إلى شبكة بخطوة quantization_step
+- المفتاح = القيم المقرّبة، والقيمة = نتيجة التصنيف
+- LRU بحجم أقصى capacity مع عدادات hits / misses / evictions
+
+أداة الاختيار تعيد تشغيل جلسات مسجّلة (أو اصطناعية) وتجرّب خطوات وأحجام مختلفة،
+ثم تختار أعلى hit rate بشرط ألا تتغير التنبؤات أكثر من --tolerance.
+
+الاستخدام:
+    python prediction_cache.py --model arabic_sign_dense.tflite
+    python prediction_cache.py --model arabic_sign_lstm.tflite --stream session.npz --tolerance 0.01
+"""
+
+import argparse
+import json
+from collections import OrderedDict
+
+import numpy as np
+
+from handspeak.landmarks import MIN_CONFIDENCE, load_labels
+from handspeak.sign_classifier import SignClassifier
+
+from replay_simulator import classifier_inputs, load_stream, synthetic_stream
+
+# نفس القيم الافتراضية في PredictionCache.kt
+DEFAULT_QUANTIZATION_STEP = 0.02
+DEFAULT_CAPACITY = 64
+
+
+def quantize(values, step: float) -> np.ndarray:
+    """تقريب إلى أقرب مضاعف لـ step (نفس Math.round في Kotlin)"""
+    return np.floor(np.asarray(values, dtype=np.float32) / step + 0.5).astype(np.int32)
+
+
+class PredictionCache:
+    """نسخة Python مطابقة لـ PredictionCache.kt"""
+
+    def __init__(self, quantization_step: float = DEFAULT_QUANTIZATION_STEP,
+                 capacity: int = DEFAULT_CAPACITY):
+        self.quantization_step = quantization_step
+        self.capacity = capacity
+        self._entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def key(self, inputs) -> bytes:
+        return quantize(inputs, self.quantization_step).tobytes()
+
+    def get(self, key: bytes):
+        result = self._entries.get(key)
+        if result is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return result
+
+    def put(self, key: bytes, result):
+        self._entries[key] = result
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.capacity:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def __len__(self):
+        return len(self._entries)
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def stats(self) -> dict:
+        return {"hits": self.hits, "misses": self.misses, "evictions": self.evictions,
+                "size": len(self), "hit_rate": self.hit_rate}
+
+
+def replay(inputs: np.ndarray, probabilities: np.ndarray, cache: PredictionCache,
+           min_confidence: float = MIN_CONFIDENCE) -> dict:
+    """
+    إعادة تشغيل الإطارات عبر الـ Cache
+
+    probabilities: مخرجات النموذج الحقيقية لكل إطار (لقياس أثر الـ Cache على التنبؤات)
+    التنبؤ "تغيّر" إذا اختلف الـ top-1 أو تغيّر قبوله (confidence >= min_confidence)
+    """
+    keys = quantize(inputs.reshape(len(inputs), -1), cache.quantization_step)
+    served = np.empty(len(inputs), dtype=np.int64)
+    for i in range(len(inputs)):
+        key = keys[i].tobytes()
+        cached = cache.get(key)
+        if cached is None:
+            cached = i
+            cache.put(key, i)
+        served[i] = cached
+
+    hits = served != np.arange(len(inputs))
+    fresh_top1 = probabilities.argmax(axis=1)
+    fresh_accepted = probabilities.max(axis=1) >= min_confidence
+    top1_changed = fresh_top1[served] != fresh_top1
+    changed = top1_changed | (fresh_accepted[served] != fresh_accepted)
+    max_prob_diff = np.abs(probabilities[served] - probabilities).max(axis=1)
+    return {
+        **cache.stats(),
+        "quantization_step": cache.quantization_step,
+        "capacity": cache.capacity,
+        "top1_changed": float(top1_changed.mean()),
+        "prediction_changed": float(changed.mean()),
+        "max_prob_diff": float(max_prob_diff.max()) if len(inputs) else 0.0,
+        "changed_hits": int(changed[hits].sum()),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='اختيار إعدادات PredictionCache من جلسات مسجّلة')
+    parser.add_argument('--model', type=str, required=True, help='ملف .tflite')
+    parser.add_argument('--stream', type=str, nargs='*', default=None,
+                        help='جلسات .npz أو .csv (افتراضي: تدفق اصطناعي)')
+    parser.add_argument('--steps', type=float, nargs='+',
+                        default=[0.01, 0.02, 0.05, 0.1, 0.2])
+    parser.add_argument('--capacities', type=int, nargs='+', default=[64, 256, 1024])
+    parser.add_argument('--tolerance', type=float, default=0.005,
+                        help='أقصى نسبة مسموحة لتغير التنبؤ (top-1 أو قبوله)')
+    parser.add_argument('--signs', type=int, default=60, help='عدد الإشارات في التدفق الاصطناعي')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--json', type=str, default=None, help='حفظ النتائج في ملف JSON')
+
+    args = parser.parse_args()
+
+    labels = load_labels()
+    classifier = SignClassifier(args.model, labels=labels)
+    if args.stream:
+        streams = [load_stream(path, labels) for path in args.stream]
+    else:
+        streams = [synthetic_stream(classifier.num_classes, num_signs=args.signs, seed=args.seed)]
+
+    # الجلسات متتالية كما لو كانت جلسة واحدة طويلة (الـ Cache يبقى بين الجلسات)
+    inputs = np.concatenate([classifier_inputs(stream, classifier)[1] for stream in streams])
+    probabilities = classifier.predict(inputs)
+    print(f"🎬 {len(streams)} session(s) | {len(inputs)} inferences")
+
+    results = []
+    for step in args.steps:
+        for capacity in args.capacities:
+            results.append(replay(inputs, probabilities, PredictionCache(step, capacity)))
+
+    print(f"{'step':>7} {'size':>6} {'hit rate':>9} {'evict':>7} {'top1 Δ':>8} "
+          f"{'pred Δ':>8} {'max |Δp|':>9}")
+    print("-" * 61)
+    for r in results:
+        print(f"{r['quantization_step']:>7.3f} {r['capacity']:>6} {r['hit_rate']:>9.1%} "
+              f"{r['evictions']:>7} {r['top1_changed']:>8.2%} {r['prediction_changed']:>8.2%} "
+              f"{r['max_prob_diff']:>9.3f}")
+
+    valid = [r for r in results if r["prediction_changed"] <= args.tolerance]
+    if valid:
+        # أعلى hit rate، ثم أصغر حجم
+        best = max(valid, key=lambda r: (r["hit_rate"], -r["capacity"]))
+        print(f"\n✅ Best: step={best['quantization_step']} capacity={best['capacity']} "
+              f"→ hit rate {best['hit_rate']:.1%}, predictions changed {best['prediction_changed']:.2%}")
+    else:
+        best = None
+        print(f"\n⚠️  No configuration within tolerance {args.tolerance:.2%}")
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump({"results": results, "best": best}, f, ensure_ascii=False, indent=2)
+        print(f"📄 Saved: {args.json}")
+
+
+if __name__ == "__main__":
+    main()
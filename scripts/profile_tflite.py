@@ -0,0 +1,466 @@
+#!/usr/bin/env python3
+"""
+تحليل أداء نموذج TFLite على مستوى العمليات (Ops) + تقرير الذاكرة
+
+يجيب عن: أين يذهب وقت الاستدلال؟ (عمليات Flex TensorList، طبقات LSTM، أم الطبقات Dense)
+وكم ذاكرة يحتاج الـ Interpreter؟
+
+- زمن كل عملية وكل نوع عملية: كل عملية تُشغَّل منفردة (نموذج من عملية واحدة) بنفس
+  مدخلاتها الحقيقية من تشغيل كامل للنموذج
+- تمييز العمليات التي تحتاج Flex delegate (Select TF Ops)
+- حجم الـ Tensor arena: تخطيط greedy-by-size مع إعادة استخدام الذاكرة حسب عمر كل Tensor
+  (مثل ArenaPlanner في TFLite) + أكبر الـ Tensors الوسيطة
+- مقارنة نموذجين (--compare): مثلاً قبل/بعد تحويل LSTM إلى builtin أو بعد quantization
+- المخرجات: JSON + ملف Chrome trace (افتحه في chrome://tracing أو ui.perfetto.dev)
+
+ملاحظة: الأزمنة هنا على الكمبيوتر. على الجهاز استخدم benchmark_model مع
+--enable_op_profiling=true. إذا لم يكن Flex delegate متوفراً يُعرض التحليل الثابت فقط.
+
+الاستخدام:
+    python profile_tflite.py --model arabic_sign_lstm.tflite
+    python profile_tflite.py --model old.tflite --compare new.tflite --json report.json --trace trace.json
+"""
+
+import argparse
+import json
+import statistics
+import time
+from pathlib import Path
+
+import numpy as np
+
+# محاذاة الـ Tensors في الـ arena (kDefaultTensorAlignment في TFLite)
+TENSOR_ALIGNMENT = 64
+
+# حجم العنصر بالبايت حسب TensorType في schema
+DTYPE_BYTES = {
+    0: 4, 1: 2, 2: 4, 3: 1, 4: 8, 5: 1, 6: 1, 7: 2, 8: 8, 9: 1, 10: 8,
+    11: 16, 12: 8, 13: 0, 14: 0, 15: 4, 16: 2, 17: 1, 18: 2, 19: 1, 20: 1,
+}
+
+
+def _tf():
+    import tensorflow as tf
+    return tf
+
+
+def _flatbuffer_utils():
+    from tensorflow.lite.tools import flatbuffer_utils
+    return flatbuffer_utils
+
+
+# ---- التحليل الثابت ----
+
+def _is_constant(model, tensor) -> bool:
+    buffer = model.buffers[tensor.buffer] if tensor.buffer < len(model.buffers) else None
+    return buffer is not None and ((buffer.data is not None and len(buffer.data) > 0)
+                                   or (buffer.offset or 0) > 1)
+
+
+def _tensor_bytes(tensor) -> int:
+    shape = [max(int(d), 1) for d in (tensor.shape if tensor.shape is not None else [])]
+    return int(np.prod(shape, dtype=np.int64)) * DTYPE_BYTES.get(tensor.type, 4)
+
+
+def _decode(name) -> str:
+    return name.decode('utf-8', 'replace') if isinstance(name, bytes) else str(name or "")
+
+
+def _layer_name(tensor_name: str) -> str:
+    """اسم الطبقة من اسم الـ Tensor: sequential_1/lstm_1/lstm_cell/MatMul;... → sequential_1/lstm_1"""
+    parts = tensor_name.split(';')[0].split('/')
+    return '/'.join(parts[:2]) if len(parts) > 1 else parts[0]
+
+
+def _aligned(size: int) -> int:
+    return (size + TENSOR_ALIGNMENT - 1) // TENSOR_ALIGNMENT * TENSOR_ALIGNMENT
+
+
+def plan_arena(model, subgraph):
+    """
+    تخطيط ذاكرة subgraph واحد (greedy by size مع مراعاة عمر كل Tensor)
+
+    عمر الـ Tensor: من العملية التي تنتجه حتى آخر عملية تستخدمه،
+    المدخلات موجودة من البداية والمخرجات حتى النهاية.
+    المخرجات: (planned_bytes, naive_bytes, persistent_bytes)
+    """
+    num_ops = len(subgraph.operators or [])
+    first, last = {}, {}
+    for t in subgraph.inputs if subgraph.inputs is not None else []:
+        first[t] = -1
+        last[t] = -1
+    for i, op in enumerate(subgraph.operators or []):
+        for t in (op.outputs if op.outputs is not None else []):
+            first.setdefault(t, i)
+            last[t] = max(last.get(t, i), i)
+        for t in (op.inputs if op.inputs is not None else []):
+            if t >= 0:
+                first.setdefault(t, i)
+                last[t] = max(last.get(t, i), i)
+    for t in subgraph.outputs if subgraph.outputs is not None else []:
+        last[t] = num_ops
+
+    persistent = 0
+    lifetimes = []
+    for t, start in first.items():
+        tensor = subgraph.tensors[t]
+        if _is_constant(model, tensor):
+            continue
+        size = _aligned(_tensor_bytes(tensor))
+        if tensor.isVariable:
+            persistent += size
+        elif size:
+            lifetimes.append((size, start, last[t]))
+
+    placed = []  # (offset, size, start, end)
+    planned = 0
+    for size, start, end in sorted(lifetimes, key=lambda x: -x[0]):
+        overlapping = sorted((o, s) for o, s, a, b in placed if a <= end and start <= b)
+        offset = 0
+        for o, s in overlapping:
+            if offset + size <= o:
+                break
+            offset = max(offset, o + s)
+        placed.append((offset, size, start, end))
+        planned = max(planned, offset + size)
+    naive = sum(size for size, _, _ in lifetimes)
+    return planned, naive, persistent
+
+
+def analyze(model_path, top: int = 10) -> dict:
+    """تحليل ثابت من ملف .tflite: العمليات، عمليات Flex، حجم الـ arena، أكبر الـ Tensors"""
+    fu = _flatbuffer_utils()
+    model = fu.read_model(str(model_path))
+
+    ops, tensors = [], []
+    arena = {"planned_bytes": 0, "naive_bytes": 0, "persistent_bytes": 0, "subgraphs": []}
+    for sg_index, subgraph in enumerate(model.subgraphs):
+        for i, op in enumerate(subgraph.operators or []):
+            code = model.operatorCodes[op.opcodeIndex]
+            custom = _decode(code.customCode)
+            outputs = op.outputs if op.outputs is not None else []
+            ops.append({
+                "subgraph": sg_index,
+                "index": i,
+                "type": custom or fu.opcode_to_name(model, op.opcodeIndex),
+                "flex": custom.startswith("Flex"),
+                "layer": _layer_name(_decode(subgraph.tensors[outputs[0]].name)) if len(outputs) else "",
+                "inputs": [int(t) for t in (op.inputs if op.inputs is not None else [])],
+                "outputs": [int(t) for t in (op.outputs if op.outputs is not None else [])],
+                "output_shapes": [[int(d) for d in subgraph.tensors[t].shape]
+                                  if subgraph.tensors[t].shape is not None else []
+                                  for t in (op.outputs if op.outputs is not None else [])],
+            })
+        graph_io = set(subgraph.inputs if subgraph.inputs is not None else []) | \
+            set(subgraph.outputs if subgraph.outputs is not None else [])
+        for t, tensor in enumerate(subgraph.tensors or []):
+            if _is_constant(model, tensor) or t in graph_io:
+                continue
+            tensors.append({
+                "subgraph": sg_index,
+                "name": _decode(tensor.name),
+                "shape": [int(d) for d in tensor.shape] if tensor.shape is not None else [],
+                "dtype": fu.type_to_name(tensor.type),
+                "bytes": _tensor_bytes(tensor),
+            })
+
+        planned, naive, persistent = plan_arena(model, subgraph)
+        arena["subgraphs"].append({"planned_bytes": planned, "naive_bytes": naive,
+                                   "persistent_bytes": persistent})
+        arena["planned_bytes"] += planned
+        arena["naive_bytes"] += naive
+        arena["persistent_bytes"] += persistent
+
+    weights = sum(len(b.data) for b in model.buffers if b.data is not None)
+    return {
+        "model": str(model_path),
+        "size_bytes": Path(model_path).stat().st_size,
+        "weights_bytes": int(weights),
+        "subgraphs": len(model.subgraphs),
+        "ops": ops,
+        "flex_ops": sum(op["flex"] for op in ops),
+        "arena": arena,
+        "largest_tensors": sorted(tensors, key=lambda t: -t["bytes"])[:top],
+    }
+
+
+# ---- قياس الزمن ----
+
+def _make_interpreter(model_content, num_threads, use_default_delegates, preserve=False):
+    tf = _tf()
+    resolver = (tf.lite.experimental.OpResolverType.AUTO if use_default_delegates
+                else tf.lite.experimental.OpResolverType.BUILTIN_WITHOUT_DEFAULT_DELEGATES)
+    interpreter = tf.lite.Interpreter(model_content=model_content, num_threads=num_threads,
+                                      experimental_op_resolver_type=resolver,
+                                      experimental_preserve_all_tensors=preserve)
+    interpreter.allocate_tensors()
+    return interpreter
+
+
+def _median_us(interpreter, runs: int, warmup: int = 3) -> float:
+    for _ in range(warmup):
+        interpreter.invoke()
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter_ns()
+        interpreter.invoke()
+        samples.append(time.perf_counter_ns() - start)
+    return statistics.median(samples) / 1000.0
+
+
+def _random_inputs(interpreter, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    values = {}
+    for detail in interpreter.get_input_details():
+        shape = [max(int(d), 1) for d in detail['shape']]
+        if np.issubdtype(detail['dtype'], np.floating):
+            values[detail['index']] = rng.random(shape).astype(detail['dtype'])
+        else:
+            values[detail['index']] = np.zeros(shape, dtype=detail['dtype'])
+    return values
+
+
+def time_ops(model_path, report: dict, runs: int = 50, num_threads: int = 1,
+             use_default_delegates: bool = True):
+    """
+    قياس زمن النموذج كاملاً وزمن كل عملية في الـ subgraph الرئيسي
+
+    كل عملية تُحوَّل إلى نموذج من عملية واحدة (نفس الأوزان) وتُشغَّل بقيم مدخلاتها
+    الحقيقية من تشغيل كامل. عمليات التحكم (WHILE/IF) تشمل زمن الـ subgraphs التابعة لها.
+    """
+    fu = _flatbuffer_utils()
+    content = Path(model_path).read_bytes()
+    full = _make_interpreter(content, num_threads, use_default_delegates, preserve=True)
+    for index, value in _random_inputs(full).items():
+        full.set_tensor(index, value)
+    report["full_invoke_us"] = _median_us(full, runs)
+    # بعد آخر invoke كل القيم الوسيطة محفوظة (preserve_all_tensors)
+    values = {t['index']: full.get_tensor(t['index']) for t in full.get_tensor_details()
+              if t['shape'] is not None}
+
+    model = fu.read_model_from_bytearray(bytearray(content))
+    main_graph = model.subgraphs[0]
+    operators = main_graph.operators
+    graph_inputs, graph_outputs = main_graph.inputs, main_graph.outputs
+    signatures = model.signatureDefs
+    model.signatureDefs = []
+    try:
+        # تكلفة invoke ثابتة (نموذج بدون عمليات) تُطرح من زمن كل عملية منفردة
+        main_graph.operators = []
+        main_graph.inputs = main_graph.outputs = np.array(graph_inputs[:1], dtype=np.int32)
+        empty = _make_interpreter(bytes(fu.convert_object_to_bytearray(model)),
+                                  num_threads, use_default_delegates)
+        report["invoke_overhead_us"] = _median_us(empty, runs)
+
+        for op_report in report["ops"]:
+            if op_report["subgraph"] != 0:
+                continue
+            op = operators[op_report["index"]]
+            inputs = []
+            for t in op.inputs if op.inputs is not None else []:
+                tensor = main_graph.tensors[t] if t >= 0 else None
+                if (tensor is not None and t not in inputs and not tensor.isVariable
+                        and not _is_constant(model, tensor)):
+                    inputs.append(int(t))
+            main_graph.operators = [op]
+            main_graph.inputs = np.array(inputs, dtype=np.int32)
+            main_graph.outputs = np.array(op.outputs, dtype=np.int32)
+            try:
+                single = _make_interpreter(bytes(fu.convert_object_to_bytearray(model)),
+                                           num_threads, use_default_delegates)
+                for detail, t in zip(single.get_input_details(), inputs):
+                    value = values[t]
+                    if list(detail['shape']) != list(value.shape):
+                        single.resize_tensor_input(detail['index'], list(value.shape))
+                        single.allocate_tensors()
+                    single.set_tensor(detail['index'], value)
+                op_report["time_us"] = max(
+                    _median_us(single, runs) - report["invoke_overhead_us"], 0.0)
+            except Exception as e:
+                op_report["time_us"] = None
+                op_report["error"] = str(e).splitlines()[0]
+    finally:
+        main_graph.operators = operators
+        main_graph.inputs, main_graph.outputs = graph_inputs, graph_outputs
+        model.signatureDefs = signatures
+
+    timed = [op["time_us"] for op in report["ops"] if op.get("time_us") is not None]
+    report["sum_op_us"] = float(sum(timed))
+
+
+def summarize_ops(report: dict, key: str) -> dict:
+    """تجميع حسب key ("type" أو "layer"): العدد، الزمن الكلي، النسبة"""
+    total = report.get("sum_op_us") or 0.0
+    types = {}
+    for op in report["ops"]:
+        entry = types.setdefault(op[key], {"count": 0, "time_us": 0.0, "flex": False})
+        entry["flex"] = entry["flex"] or op["flex"]
+        entry["count"] += 1
+        entry["time_us"] += op.get("time_us") or 0.0
+    for entry in types.values():
+        entry["percent"] = entry["time_us"] / total * 100.0 if total else None
+    return dict(sorted(types.items(), key=lambda kv: (-kv[1]["time_us"], -kv[1]["count"])))
+
+
+def profile(model_path, runs: int = 50, num_threads: int = 1,
+            use_default_delegates: bool = True, top: int = 10) -> dict:
+    report = analyze(model_path, top=top)
+    report["num_threads"] = num_threads
+    report["timing_error"] = None
+    try:
+        time_ops(model_path, report, runs=runs, num_threads=num_threads,
+                 use_default_delegates=use_default_delegates)
+    except Exception as e:
+        # غالباً: النموذج يحتاج Flex delegate وهو غير مرتبط بهذا الـ Interpreter
+        report["timing_error"] = str(e).splitlines()[0]
+    report["op_types"] = summarize_ops(report, "type")
+    report["layers"] = summarize_ops(report, "layer")
+    return report
+
+
+# ---- المخرجات ----
+
+def chrome_trace(reports) -> dict:
+    """أحداث Chrome trace: كل نموذج في process منفصل، والعمليات متتالية حسب زمنها"""
+    events = []
+    for pid, report in enumerate(reports, start=1):
+        events.append({"name": "process_name", "ph": "M", "pid": pid, "tid": 0,
+                       "args": {"name": Path(report["model"]).name}})
+        ts = 0.0
+        for op in report["ops"]:
+            if op.get("time_us") is None:
+                continue
+            events.append({
+                "name": op["type"],
+                "cat": "flex" if op["flex"] else "builtin",
+                "ph": "X",
+                "ts": ts,
+                "dur": op["time_us"],
+                "pid": pid,
+                "tid": op["subgraph"],
+                "args": {"index": op["index"], "layer": op["layer"],
+                         "output_shapes": op["output_shapes"]},
+            })
+            ts += op["time_us"]
+    return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+
+def diff_reports(a: dict, b: dict) -> dict:
+    def delta(key, x, y):
+        return None if x.get(key) is None or y.get(key) is None else y[key] - x[key]
+
+    types = {}
+    for name in list(a["op_types"]) + [n for n in b["op_types"] if n not in a["op_types"]]:
+        ta, tb = a["op_types"].get(name, {}), b["op_types"].get(name, {})
+        types[name] = {"count": [ta.get("count", 0), tb.get("count", 0)],
+                       "time_us": [ta.get("time_us", 0.0), tb.get("time_us", 0.0)]}
+    return {
+        "size_bytes": delta("size_bytes", a, b),
+        "full_invoke_us": delta("full_invoke_us", a, b),
+        "flex_ops": delta("flex_ops", a, b),
+        "ops": len(b["ops"]) - len(a["ops"]),
+        "arena_planned_bytes": b["arena"]["planned_bytes"] - a["arena"]["planned_bytes"],
+        "op_types": types,
+    }
+
+
+def _kb(n) -> str:
+    return f"{n / 1024:.1f} KB"
+
+
+def _us(value) -> str:
+    return "—" if value is None else f"{value:.1f}µs"
+
+
+def print_report(report: dict, top: int = 10):
+    print(f"\n📦 {report['model']}")
+    print(f"   Size: {_kb(report['size_bytes'])} | Subgraphs: {report['subgraphs']} | "
+          f"Ops: {len(report['ops'])} | Flex ops: {report['flex_ops']}")
+    arena = report["arena"]
+    print(f"   Arena: {_kb(arena['planned_bytes'])} planned "
+          f"({_kb(arena['naive_bytes'])} without reuse) + {_kb(arena['persistent_bytes'])} persistent")
+    if report["timing_error"]:
+        print(f"   ⚠️  Timing unavailable: {report['timing_error']}")
+    else:
+        print(f"   Invoke: {_us(report['full_invoke_us'])} | Sum of ops: {_us(report['sum_op_us'])} "
+              f"(per-op overhead {_us(report['invoke_overhead_us'])} removed, "
+              f"{report['num_threads']} thread(s))")
+
+    for title, groups in (("op type", report["op_types"]), ("layer", report["layers"])):
+        print(f"\n   {title:<36} {'count':>5} {'time':>11} {'share':>7}")
+        print("   " + "-" * 62)
+        for name, entry in groups.items():
+            share = "—" if entry["percent"] is None else f"{entry['percent']:.1f}%"
+            time_us = None if report["timing_error"] else entry["time_us"]
+            flag = " [Flex]" if entry["flex"] else ""
+            print(f"   {(name[:29] + flag):<36} {entry['count']:>5} {_us(time_us):>11} {share:>7}")
+
+    timed = [op for op in report["ops"] if op.get("time_us") is not None]
+    if timed:
+        print(f"\n   Slowest ops:")
+        for op in sorted(timed, key=lambda o: -o["time_us"])[:top]:
+            flag = " [Flex]" if op["flex"] else ""
+            print(f"   #{op['index']:<4} {(op['type'] + flag):<28} {_us(op['time_us']):>11} "
+                  f"{op['layer'][:30]:<30} → {op['output_shapes']}")
+
+    print(f"\n   Largest intermediate tensors:")
+    for tensor in report["largest_tensors"][:top]:
+        print(f"   {_kb(tensor['bytes']):>10} {tensor['dtype']:<8} {str(tensor['shape']):<16} "
+              f"{tensor['name'][:60]}")
+
+
+def print_diff(a: dict, b: dict, diff: dict):
+    print(f"\n🔀 {Path(a['model']).name} → {Path(b['model']).name}")
+    print(f"   Size: {_kb(a['size_bytes'])} → {_kb(b['size_bytes'])} | "
+          f"Ops: {len(a['ops'])} → {len(b['ops'])} | Flex ops: {a['flex_ops']} → {b['flex_ops']}")
+    print(f"   Arena: {_kb(a['arena']['planned_bytes'])} → {_kb(b['arena']['planned_bytes'])} | "
+          f"Invoke: {_us(a.get('full_invoke_us'))} → {_us(b.get('full_invoke_us'))}")
+    print(f"\n   {'op type':<28} {'count':>11} {'time':>25}")
+    print("   " + "-" * 66)
+    for name, entry in diff["op_types"].items():
+        ca, cb = entry["count"]
+        ta, tb = entry["time_us"]
+        print(f"   {name:<28} {ca:>5} → {cb:<3} {_us(ta):>11} → {_us(tb):<11}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='تحليل أداء نموذج TFLite على مستوى العمليات')
+    parser.add_argument('--model', type=str, required=True, help='ملف .tflite')
+    parser.add_argument('--compare', type=str, default=None, help='نموذج ثانٍ للمقارنة')
+    parser.add_argument('--runs', type=int, default=50, help='عدد مرات التشغيل لكل قياس')
+    parser.add_argument('--threads', type=int, default=1)
+    parser.add_argument('--no-default-delegates', action='store_true',
+                        help='بدون XNNPACK (kernels الـ builtin فقط)')
+    parser.add_argument('--top', type=int, default=10, help='عدد العمليات/الـ Tensors في التقرير')
+    parser.add_argument('--json', type=str, default=None, help='حفظ التقرير في ملف JSON')
+    parser.add_argument('--trace', type=str, default=None, help='حفظ Chrome trace')
+
+    args = parser.parse_args()
+
+    paths = [args.model] + ([args.compare] if args.compare else [])
+    reports = []
+    for path in paths:
+        print(f"⏱️  Profiling {path} ...")
+        reports.append(profile(path, runs=args.runs, num_threads=args.threads,
+                               use_default_delegates=not args.no_default_delegates, top=args.top))
+
+    for report in reports:
+        print_report(report, top=args.top)
+
+    output = {"models": reports}
+    if len(reports) == 2:
+        output["diff"] = diff_reports(*reports)
+        print_diff(*reports, output["diff"])
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(output, f, ensure_ascii=False, indent=2)
+        print(f"\n📄 Saved: {args.json}")
+    if args.trace:
+        with open(args.trace, 'w', encoding='utf-8') as f:
+            json.dump(chrome_trace(reports), f)
+        print(f"📄 Trace: {args.trace}")
+
+
+if __name__ == "__main__":
+    main()
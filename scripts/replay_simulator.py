@@ -0,0 +1,388 @@
+#!/usr/bin/env python3
+"""
+محاكاة إعادة تشغيل تدفق الإطارات لمقارنة استراتيجيات Buffer في SignToTextViewModel
+
+المنطق الحالي في التطبيق (processHandLandmarks):
+- جمع 10 إطارات، تصنيف مرة واحدة، ثم frameBuffer.clear()
+- أي إطار يصل أثناء isProcessing يتم تجاهله (processFrame)
+
+هذه الأداة تعيد تنفيذ هذا المنطق بدقة، ومعه بدائل:
+- clear: منطق التطبيق الحالي (تصنيف كل 10 إطارات ثم مسح)
+- sliding:k: نافذة منزلقة بطول 10، تصنيف كل k إطار
+- ring: Ring buffer بدون مسح، تصنيف كل إطار (مع تكرار آخر إطار قبل الامتلاء)
+
+وسياسات الانشغال (busy policy):
+- drop: تجاهل الإطار بالكامل أثناء isProcessing (التطبيق الحالي)
+- queue: معالجة كل الإطارات بالترتيب (قد يتراكم التأخير)
+- skip: كشف اليد لكل إطار، وتخطي التصنيف فقط إذا كان المصنّف مشغولاً
+
+يتم تشغيل نموذج .tflite الحقيقي، والتقرير يشمل: عدد الاستدلالات في الثانية،
+التأخير من بداية الإشارة حتى أول تنبؤ صحيح، والدقة.
+
+الاستخدام:
+    # تدفق اصطناعي (SyntheticHandGenerator، قابل للتكرار عبر --seed)
+    python replay_simulator.py --model arabic_sign_lstm.tflite
+
+    # تسجيل حقيقي (.npz فيه landmarks و labels، أو CSV بصيغة بيانات التدريب)
+    python replay_simulator.py --model arabic_sign_lstm.tflite --stream session.npz
+"""
+
+import argparse
+import json
+import time
+from collections import deque
+from pathlib import Path
+
+import numpy as np
+
+from handspeak.landmarks import MIN_CONFIDENCE, NUM_LANDMARKS, SEQUENCE_LENGTH, load_labels, \
+    load_training_csv, normalize_landmarks
+from handspeak.sign_classifier import SignClassifier
+from handspeak.synthetic_data import SyntheticHandGenerator
+
+DEFAULT_FPS = 30.0
+DEFAULT_DETECT_MS = 15.0  # زمن MediaPipe التقريبي لكل إطار
+BUSY_POLICIES = ("drop", "queue", "skip")
+DEFAULT_STRATEGIES = ("clear", "sliding:5", "sliding:2", "ring")
+
+
+class FrameStream:
+    """
+    تدفق إطارات مسجّل أو اصطناعي
+
+    landmarks: (F, 21, 3) نقاط خام، labels: (F,) رقم التصنيف أو -1 (لا إشارة)
+    present: (F,) هل تم اكتشاف يد في الإطار
+    """
+
+    def __init__(self, landmarks, labels, fps: float = DEFAULT_FPS, present=None, name: str = ""):
+        self.landmarks = np.asarray(landmarks, dtype=np.float32)
+        self.labels = np.asarray(labels, dtype=np.int64)
+        self.present = (np.ones(len(self.labels), dtype=bool) if present is None
+                        else np.asarray(present, dtype=bool))
+        self.fps = fps
+        self.name = name
+        self.features = normalize_landmarks(self.landmarks)
+
+    def __len__(self):
+        return len(self.labels)
+
+    @property
+    def duration(self) -> float:
+        return len(self) / self.fps
+
+    def segments(self):
+        """الإشارات في التدفق: قائمة (start, end, label)"""
+        segments = []
+        start = 0
+        for i in range(1, len(self) + 1):
+            if i == len(self) or self.labels[i] != self.labels[start]:
+                if self.labels[start] >= 0:
+                    segments.append((start, i, int(self.labels[start])))
+                start = i
+        return segments
+
+
+def synthetic_stream(num_classes: int, num_signs: int = 60, segment_frames: int = 30,
+                     gap_frames: int = 8, fps: float = DEFAULT_FPS, seed: int = 42):
+    """
+    تدفق اصطناعي: إشارات متتالية (segment_frames إطار لكل إشارة) تفصلها فترات بدون يد
+
+    سرعة الحركة مطابقة لتسلسلات التدريب بطول SEQUENCE_LENGTH.
+    """
+    generator = SyntheticHandGenerator(num_classes, segment_frames, seed=seed)
+    rng = np.random.default_rng([seed, 3])
+    labels = rng.integers(0, num_classes, num_signs)
+    time_span = (segment_frames - 1) / (SEQUENCE_LENGTH - 1)
+    signs, _ = generator.generate(num_signs, seed=1, labels=labels, time_span=time_span)
+
+    block = segment_frames + gap_frames
+    landmarks = np.zeros((num_signs, block, NUM_LANDMARKS, 3), dtype=np.float32)
+    frame_labels = np.full((num_signs, block), -1, dtype=np.int64)
+    present = np.zeros((num_signs, block), dtype=bool)
+    landmarks[:, gap_frames:] = signs
+    frame_labels[:, gap_frames:] = labels[:, None]
+    present[:, gap_frames:] = True
+    return FrameStream(landmarks.reshape(-1, NUM_LANDMARKS, 3), frame_labels.reshape(-1),
+                       fps=fps, present=present.reshape(-1), name=f"synthetic(seed={seed})")
+
+
+def load_stream(path: Path, labels: list, fps: float = DEFAULT_FPS) -> FrameStream:
+    """
+    قراءة تسجيل: .npz (landmarks, labels, [present], [fps]) أو CSV بصيغة بيانات التدريب
+    (كل صف إطار بالترتيب، والتصنيف نص من labels.json)
+    """
+    path = Path(path)
+    if path.suffix == ".npz":
+        data = np.load(path)
+        present = data["present"] if "present" in data else None
+        fps = float(data["fps"]) if "fps" in data else fps
+        return FrameStream(data["landmarks"], data["labels"], fps=fps, present=present,
+                           name=path.name)
+    landmarks, text_labels = load_training_csv(path)
+    index = {label: i for i, label in enumerate(labels)}
+    frame_labels = [index.get(label, -1) for label in text_labels]
+    return FrameStream(landmarks, frame_labels, fps=fps, name=path.name)
+
+
+def classifier_inputs(stream: FrameStream, classifier: SignClassifier):
+    """
+    مدخلات المصنّف لكل إطار فيه يد (لتقييم التدفق دفعة واحدة)
+
+    Dense: الإطار نفسه، LSTM: آخر sequence_length إطار فيها يد (Ring buffer)،
+    وقبل الامتلاء تُكمَّل النافذة بتكرار آخر إطار مثل classifySequence.
+    المخرجات: (present indices (P,), inputs (P, 63) أو (P, T, 63))
+    """
+    present = np.flatnonzero(stream.present)
+    features = stream.features[present]
+    if not classifier.is_sequence_model:
+        return present, features
+    t = classifier.sequence_length
+    position = np.arange(len(present))
+    first = np.maximum(position - t + 1, 0)
+    index = np.minimum(first[:, None] + np.arange(t)[None, :], position[:, None])
+    return present, features[index]
+
+
+# ---- استراتيجيات الـ Buffer ----
+
+class ClearStrategy:
+    """منطق التطبيق: جمع sequence_length إطار، تصنيف، ثم مسح"""
+
+    def __init__(self, sequence_length: int = SEQUENCE_LENGTH):
+        self.name = "clear"
+        self.sequence_length = sequence_length
+        self.buffer = []
+
+    def push(self, frame):
+        self.buffer.append(frame)
+
+    def ready(self) -> bool:
+        return len(self.buffer) >= self.sequence_length
+
+    def take(self):
+        window = self.buffer
+        self.buffer = []
+        return window
+
+
+class SlidingStrategy:
+    """نافذة منزلقة بطول sequence_length، تصنيف كل stride إطار بعد الامتلاء"""
+
+    def __init__(self, stride: int, sequence_length: int = SEQUENCE_LENGTH):
+        self.name = f"sliding:{stride}"
+        self.stride = stride
+        self.sequence_length = sequence_length
+        self.buffer = deque(maxlen=sequence_length)
+        self.since_last = 0
+
+    def push(self, frame):
+        self.buffer.append(frame)
+        self.since_last += 1
+
+    def ready(self) -> bool:
+        return len(self.buffer) == self.sequence_length and self.since_last >= self.stride
+
+    def take(self):
+        self.since_last = 0
+        return list(self.buffer)
+
+
+class RingStrategy:
+    """Ring buffer بدون مسح: تصنيف كل إطار (النافذة القصيرة تُكمَّل بتكرار آخر إطار)"""
+
+    def __init__(self, sequence_length: int = SEQUENCE_LENGTH):
+        self.name = "ring"
+        self.buffer = deque(maxlen=sequence_length)
+
+    def push(self, frame):
+        self.buffer.append(frame)
+
+    def ready(self) -> bool:
+        return len(self.buffer) > 0
+
+    def take(self):
+        return list(self.buffer)
+
+
+def make_strategy(spec: str, sequence_length: int = SEQUENCE_LENGTH):
+    """clear | ring | sliding:k"""
+    name, _, arg = spec.partition(":")
+    if name == "clear":
+        return ClearStrategy(sequence_length)
+    if name == "ring":
+        return RingStrategy(sequence_length)
+    if name == "sliding":
+        return SlidingStrategy(int(arg or 1), sequence_length)
+    raise ValueError(f"Unknown strategy: {spec}")
+
+
+# ---- المحاكاة ----
+
+def _percentile(values, q):
+    return float(np.percentile(values, q)) if values else None
+
+
+def simulate(stream: FrameStream, classifier: SignClassifier, strategy_spec: str,
+             busy_policy: str = "drop", detect_ms: float = DEFAULT_DETECT_MS,
+             inference_ms: float = None, min_confidence: float = MIN_CONFIDENCE) -> dict:
+    """
+    محاكاة حدث-بحدث لتدفق واحد مع استراتيجية وسياسة انشغال
+
+    الزمن افتراضي (ثوانٍ من بداية التدفق). زمن الاستدلال هو الزمن الفعلي المقاس
+    للنموذج على هذا الجهاز، إلا إذا تم تحديد inference_ms.
+    """
+    if busy_policy not in BUSY_POLICIES:
+        raise ValueError(f"Unknown busy policy: {busy_policy}")
+    strategy = make_strategy(strategy_spec, classifier.sequence_length
+                             if classifier.is_sequence_model else SEQUENCE_LENGTH)
+    detect = detect_ms / 1000.0
+
+    pipeline_free = 0.0    # drop / queue: isProcessing يغطي الكشف والتصنيف
+    detector_free = 0.0    # skip: الكشف والتصنيف منفصلان
+    classifier_free = 0.0
+    dropped = skipped = 0
+    costs = []
+    predictions = []  # (emit_time, frame_index, predicted, confidence)
+
+    for i in range(len(stream)):
+        arrival = i / stream.fps
+        if busy_policy == "drop":
+            if arrival < pipeline_free:
+                dropped += 1
+                continue
+            now = arrival + detect
+        elif busy_policy == "queue":
+            now = max(arrival, pipeline_free) + detect
+        else:
+            now = max(arrival, detector_free) + detect
+            detector_free = now
+
+        if not stream.present[i]:
+            # لا توجد يد: التطبيق لا يمسح الـ Buffer
+            pipeline_free = now
+            continue
+
+        strategy.push(stream.features[i])
+        if strategy.ready():
+            if busy_policy == "skip" and now < classifier_free:
+                skipped += 1
+            else:
+                window = strategy.take()
+                start = time.perf_counter()
+                predicted, confidence = classifier.classify_sequence(window)
+                cost = time.perf_counter() - start
+                if inference_ms is not None:
+                    cost = inference_ms / 1000.0
+                costs.append(cost)
+                now += cost
+                if busy_policy == "skip":
+                    classifier_free = now
+                predictions.append((now, i, predicted, confidence))
+        pipeline_free = now
+
+    # الدقة: التنبؤات المقبولة (≥ min_confidence) على إطارات فيها إشارة
+    labelled = [(p, c, stream.labels[i]) for _, i, p, c in predictions if stream.labels[i] >= 0]
+    accepted = [(p, label) for p, c, label in labelled if c >= min_confidence]
+    correct = sum(1 for p, label in accepted if p == label)
+
+    # التأخير: من بداية الإشارة حتى أول تنبؤ مقبول وصحيح لها
+    latencies, response = [], []
+    segments = stream.segments()
+    index_emissions = sorted(predictions, key=lambda item: item[1])
+    for start, end, label in segments:
+        onset = start / stream.fps
+        for emit_time, i, predicted, confidence in index_emissions:
+            if start <= i < end and predicted == label and confidence >= min_confidence:
+                latencies.append((emit_time - onset) * 1000.0)
+                break
+    for emit_time, i, _, _ in predictions:
+        response.append((emit_time - i / stream.fps) * 1000.0)
+
+    return {
+        "strategy": strategy.name,
+        "busy_policy": busy_policy,
+        "frames": len(stream),
+        "dropped_frames": dropped,
+        "skipped_inferences": skipped,
+        "inferences": len(predictions),
+        "inferences_per_sec": len(predictions) / stream.duration,
+        "mean_inference_ms": float(np.mean(costs) * 1000.0) if costs else None,
+        "accuracy": correct / len(accepted) if accepted else None,
+        "accepted_rate": len(accepted) / len(labelled) if labelled else None,
+        "signs": len(segments),
+        "signs_recognized": len(latencies) / len(segments) if segments else None,
+        "onset_latency_ms_mean": float(np.mean(latencies)) if latencies else None,
+        "onset_latency_ms_p50": _percentile(latencies, 50),
+        "onset_latency_ms_p90": _percentile(latencies, 90),
+        "response_ms_p50": _percentile(response, 50),
+    }
+
+
+def _fmt(value, spec):
+    """spec بدون عرض: العرض يُطبَّق على الناتج (:>N) حتى تبقى — بنفس عرض العمود"""
+    return "—" if value is None else format(value, spec)
+
+
+def print_report(results: list):
+    print(f"{'strategy':<12} {'busy':<6} {'inf/s':>7} {'drop':>5} {'acc':>7} "
+          f"{'recog':>7} {'onset p50':>10} {'onset p90':>10}")
+    print("-" * 72)
+    for r in results:
+        print(f"{r['strategy']:<12} {r['busy_policy']:<6} {r['inferences_per_sec']:>7.1f} "
+              f"{r['dropped_frames']:>5} {_fmt(r['accuracy'], '.1%'):>7} "
+              f"{_fmt(r['signs_recognized'], '.1%'):>7} "
+              f"{_fmt(r['onset_latency_ms_p50'], '.0f'):>8}ms "
+              f"{_fmt(r['onset_latency_ms_p90'], '.0f'):>8}ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='محاكاة استراتيجيات Buffer لـ SignToTextViewModel')
+    parser.add_argument('--model', type=str, required=True, help='ملف .tflite')
+    parser.add_argument('--stream', type=str, default=None,
+                        help='تسجيل .npz أو .csv (افتراضي: تدفق اصطناعي)')
+    parser.add_argument('--strategies', type=str, nargs='+', default=list(DEFAULT_STRATEGIES),
+                        help='clear | ring | sliding:k')
+    parser.add_argument('--busy-policies', type=str, nargs='+', default=list(BUSY_POLICIES),
+                        choices=BUSY_POLICIES)
+    parser.add_argument('--fps', type=float, default=DEFAULT_FPS)
+    parser.add_argument('--detect-ms', type=float, default=DEFAULT_DETECT_MS,
+                        help='زمن كشف اليد لكل إطار')
+    parser.add_argument('--inference-ms', type=float, default=None,
+                        help='زمن استدلال ثابت (لمحاكاة جهاز أبطأ) بدل الزمن المقاس')
+    parser.add_argument('--signs', type=int, default=60, help='عدد الإشارات في التدفق الاصطناعي')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--threads', type=int, default=4)
+    parser.add_argument('--json', type=str, default=None, help='حفظ النتائج في ملف JSON')
+
+    args = parser.parse_args()
+
+    labels = load_labels()
+    classifier = SignClassifier(args.model, labels=labels, num_threads=args.threads)
+    if args.stream:
+        stream = load_stream(Path(args.stream), labels, fps=args.fps)
+    else:
+        stream = synthetic_stream(classifier.num_classes, num_signs=args.signs,
+                                  fps=args.fps, seed=args.seed)
+
+    print(f"🎬 Stream: {stream.name} | {len(stream)} frames @ {stream.fps:.0f} fps "
+          f"| {len(stream.segments())} signs")
+    print(f"🧠 Model: {Path(args.model).name} "
+          f"({'LSTM' if classifier.is_sequence_model else 'Dense'}, {classifier.num_classes} classes)")
+    print()
+
+    results = []
+    for spec in args.strategies:
+        for policy in args.busy_policies:
+            results.append(simulate(stream, classifier, spec, busy_policy=policy,
+                                    detect_ms=args.detect_ms, inference_ms=args.inference_ms))
+    print_report(results)
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump({"stream": stream.name, "model": str(args.model), "results": results},
+                      f, ensure_ascii=False, indent=2)
+        print(f"\n📄 Saved: {args.json}")
+
+
+if __name__ == "__main__":
+    main()
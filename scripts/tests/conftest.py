@@ -0,0 +1,8 @@
+"""اختبارات أدوات scripts/: python -m pytest scripts/tests"""
+
+import sys
+from pathlib import Path
+
+SCRIPTS_DIR = Path(__file__).resolve().parent.parent
+if str(SCRIPTS_DIR) not in sys.path:
+    sys.path.insert(0, str(SCRIPTS_DIR))
@@ -0,0 +1,42 @@
+"""train-parallel: تقرير التوسع مع تشغيل بلا إنتاجية، والاستئناف يطابق تدريباً بدون انقطاع"""
+
+import json
+
+import pytest
+
+from handspeak.distributed import scaling_report
+
+
+def row(workers: int, samples_per_sec, final_loss=3.0) -> dict:
+    return {"workers": workers, "threads_per_worker": 1, "pinned": False, "train_seconds": 1.0,
+            "samples_per_sec": samples_per_sec, "final_loss": final_loss}
+
+
+def test_scaling_report_marks_rows_without_throughput(capsys):
+    results = scaling_report([row(1, None, None), row(2, 1000.0), row(4, 1800.0)])
+    assert results[0]["speedup"] is None and results[0]["efficiency"] is None
+    assert results[1]["speedup"] == pytest.approx(1.0)
+    assert results[2]["efficiency"] == pytest.approx(0.9)
+    lines = capsys.readouterr().out.splitlines()
+    assert "—" in lines[3]
+    assert len({len(line) for line in lines[3:]}) == 1  # نفس عرض الأعمدة
+
+
+def test_resume_matches_uninterrupted_run(tmp_path):
+    pytest.importorskip("tensorflow")
+    from handspeak.cli import main
+
+    def train(run_dir, epochs: int):
+        report = tmp_path / f"{run_dir}.json"
+        assert main(["train-parallel", "--workers", "2", "--threads-per-worker", "1",
+                     "--arch", "dense", "--samples", "1000", "--epochs", str(epochs),
+                     "--run-dir", str(tmp_path / run_dir), "--json", str(report)]) == 0
+        return json.loads(report.read_text(encoding="utf-8"))
+
+    uninterrupted = train("full", 3)
+    train("resumed", 2)
+    resumed = train("resumed", 3)
+    assert resumed["resumed_from_epoch"] == 2
+    assert resumed["worker_results"][0]["losses"][-1] == pytest.approx(
+        uninterrupted["worker_results"][0]["losses"][-1], rel=1e-6)
+    assert resumed["val_accuracy"] == uninterrupted["val_accuracy"]
@@ -0,0 +1,22 @@
+"""
+بوابة التحقق بعد التحويل مع LSTM الافتراضي: الملف يحتاج Select TF Ops (Flex) ولا يعمل
+مع TensorFlow العادي، فالمقارنة تتم عبر نسخة batch=1 بدون Flex ويجب أن ينجح الأمر.
+"""
+
+import pytest
+
+pytest.importorskip("tensorflow")
+
+from handspeak.cli import main  # noqa: E402
+
+
+def test_default_lstm_train_passes_verification(tmp_path):
+    output = tmp_path / "arabic_sign_lstm.tflite"
+    assert main(["train", "--samples", "300", "--epochs", "1", "--output", str(output)]) == 0
+    assert output.exists()
+
+
+def test_lstm_export_passes_verification(tmp_path):
+    output = tmp_path / "arabic_sign_lstm.tflite"
+    assert main(["export", "--arch", "lstm", "--output", str(output)]) == 0
+    assert output.exists()
@@ -0,0 +1,73 @@
+"""
+extract_landmarks مع FakeBackend: الـ Cache حسب SHA-256 لمحتوى الملف، والـ namespace
+حسب بصمة ملف النموذج (نموذج مُعاد تدريبه بنفس الاسم لا يعيد نقاطاً قديمة)
+"""
+
+import json
+import shutil
+
+import pytest
+
+np = pytest.importorskip("numpy")
+Image = pytest.importorskip("PIL.Image")
+
+from handspeak.extract_landmarks import cache_namespace, extract_dataset, load_cache  # noqa: E402
+
+
+@pytest.fixture
+def dataset(tmp_path):
+    rng = np.random.default_rng(0)
+    root = tmp_path / "dataset"
+    for folder in ("alef", "baa"):
+        (root / folder).mkdir(parents=True)
+        for index in range(3):
+            pixels = rng.integers(0, 256, (16, 16, 3), dtype=np.uint8)
+            Image.fromarray(pixels).save(root / folder / f"{index}.png")
+    return root
+
+
+def extract(dataset, tmp_path, **kwargs):
+    return extract_dataset(dataset, tmp_path / "out" / "landmarks.csv", folder_map={},
+                           **{"backend_name": "fake", "workers": 1, **kwargs})
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_second_run_is_served_from_cache(dataset, tmp_path, workers):
+    first = extract(dataset, tmp_path, workers=workers)
+    assert first["processed"] == 6 and first["cached"] == 0
+    first_csv = (tmp_path / "out" / "landmarks.csv").read_text(encoding="utf-8")
+
+    second = extract(dataset, tmp_path, workers=workers)
+    assert second["processed"] == 0 and second["cached"] == 6
+    assert second["detected"] == first["detected"]
+    assert (tmp_path / "out" / "landmarks.csv").read_text(encoding="utf-8") == first_csv
+
+
+def test_cache_is_keyed_on_content_not_path(dataset, tmp_path):
+    extract(dataset, tmp_path)
+    shutil.move(dataset / "alef" / "0.png", dataset / "alef" / "renamed.png")
+    shutil.copy(dataset / "baa" / "0.png", dataset / "baa" / "copy.png")
+
+    stats = extract(dataset, tmp_path)
+    assert stats["processed"] == 0 and stats["cached"] == 7
+
+
+def test_changing_model_file_invalidates_cache(tmp_path):
+    model = tmp_path / "hand_landmarker.task"
+    model.write_bytes(b"model v1")
+    old_namespace = cache_namespace("mediapipe", {"model_path": str(model)})
+    cache_file = tmp_path / "landmarks_cache.jsonl"
+    entry = {"backend": old_namespace, "sha256": "abc", "frames": []}
+    cache_file.write_text(json.dumps(entry) + "\n", encoding="utf-8")
+    assert "abc" in load_cache(cache_file, old_namespace)
+
+    model.write_bytes(b"model v2")  # نفس الاسم، محتوى جديد
+    new_namespace = cache_namespace("mediapipe", {"model_path": str(model)})
+    assert new_namespace != old_namespace
+    assert load_cache(cache_file, new_namespace) == {}
+
+
+def test_missing_model_fails_before_starting_workers(dataset, tmp_path):
+    with pytest.raises(FileNotFoundError, match="hand_landmarker.task"):
+        extract(dataset, tmp_path, backend_name="mediapipe", workers=2,
+                backend_options={"model_path": str(tmp_path / "hand_landmarker.task")})
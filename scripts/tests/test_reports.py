@@ -0,0 +1,43 @@
+"""جداول التقارير: القيم المفقودة (—) بنفس عرض الأعمدة الرقمية"""
+
+from replay_simulator import print_report
+
+
+def test_replay_report_keeps_columns_aligned(capsys):
+    row = {"strategy": "clear", "busy_policy": "drop", "inferences_per_sec": 3.0,
+           "dropped_frames": 2, "accuracy": 0.5, "signs_recognized": 0.25,
+           "onset_latency_ms_p50": 120.0, "onset_latency_ms_p90": 300.0}
+    missing = dict(row, accuracy=None, signs_recognized=None,
+                   onset_latency_ms_p50=None, onset_latency_ms_p90=None)
+    print_report([row, missing])
+    lines = capsys.readouterr().out.splitlines()
+    assert "—" in lines[3]
+    assert len(lines[2]) == len(lines[3])
+
+
+def test_motion_gate_report_keeps_columns_aligned(capsys):
+    from motion_gate import print_report as print_gate_report
+
+    scores = {"accuracy": 0.5, "onset_latency_ms_mean": 200.0}
+    row = {"still_threshold": 0.01, "motion_threshold": 0.05, "coarse_stride": 3,
+           "max_staleness": 10, "inferences_saved": 0.4, "agreement_with_baseline": 0.9,
+           "baseline": scores, "gated": scores}
+    empty = {"accuracy": None, "onset_latency_ms_mean": None}
+    print_gate_report([row, dict(row, agreement_with_baseline=None, gated=empty)])
+    lines = capsys.readouterr().out.splitlines()
+    assert "—" in lines[3]
+    assert len(lines[2]) == len(lines[3])
+
+
+def test_tune_cascade_report_keeps_columns_aligned(capsys):
+    from handspeak.tune_cascade import print_report as print_cascade_report
+
+    scores = {"frame_recall": 0.8, "accuracy": 0.9, "onset_latency_ms_mean": 150.0}
+    row = {"dense_threshold": 0.9, "motion_threshold": 0.06, "lstm_rate": 0.3,
+           "cost_ms_per_frame": 0.5, "cost_saved": 0.4, "agreement_with_lstm": 0.95,
+           "cascade": scores, "lstm_only": scores}
+    empty = {"frame_recall": None, "accuracy": None, "onset_latency_ms_mean": None}
+    print_cascade_report([row, dict(row, cost_saved=None, agreement_with_lstm=None, cascade=empty)])
+    lines = capsys.readouterr().out.splitlines()
+    assert "—" in lines[3]
+    assert len(lines[2]) == len(lines[3])
@@ -0,0 +1,32 @@
+"""
+زمن بدء التشغيل: --help لكل أمر في COMMANDS لا يستورد مكتبات ثقيلة ويبقى ضمن
+ميزانية الاستيراد (نفس فحص handspeak check-startup، مع python -X importtime)
+"""
+
+import pytest
+
+from handspeak.cli import COMMANDS
+from handspeak.startup import DEFAULT_BUDGET_MS, import_baseline, probe
+
+
+@pytest.fixture(scope="module")
+def baseline():
+    return import_baseline()[0]
+
+
+def assert_light(result):
+    assert result["returncode"] == 0
+    assert not result["heavy"], f"heavy imports: {', '.join(result['heavy'])}"
+    assert result["import_ms"] <= DEFAULT_BUDGET_MS, \
+        f"imports took {result['import_ms']:.1f}ms > {DEFAULT_BUDGET_MS:.0f}ms"
+
+
+@pytest.mark.parametrize("args", [["--help"]] + [[command, "--help"] for command in COMMANDS],
+                         ids=lambda args: " ".join(args))
+def test_help_is_light(args, baseline):
+    assert_light(probe(args, baseline))
+
+
+def test_sync_on_empty_dir_is_light(tmp_path, baseline):
+    assert_light(probe(["sync", "--source", str(tmp_path), "--target", str(tmp_path / "signs")],
+                       baseline))
@@ -0,0 +1,22 @@
+"""train --run-dir: ملخص أفضل val_loss بدون أي epoch مكتمل، والاستئناف بعد آخر epoch"""
+
+import pytest
+
+pytest.importorskip("tensorflow")
+
+from handspeak.cli import main  # noqa: E402
+
+
+def train(tmp_path, epochs: int) -> int:
+    return main(["train", "--arch", "dense", "--samples", "200", "--epochs", str(epochs),
+                 "--run-dir", str(tmp_path / "run"), "--output", str(tmp_path / "dense.tflite")])
+
+
+def test_run_dir_without_finished_epoch(tmp_path, capsys):
+    assert train(tmp_path, 0) == 0
+    assert "أفضل val_loss: —" in capsys.readouterr().out
+
+
+def test_resume_after_final_epoch(tmp_path):
+    assert train(tmp_path, 1) == 0
+    assert train(tmp_path, 1) == 0
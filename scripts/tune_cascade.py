@@ -0,0 +1,16 @@
+#!/usr/bin/env python3
+"""
+اختيار حدود الـ Cascade (Dense أولاً، LSTM عند الحاجة) على تدفق تحقق
+
+تم نقل هذا السكريبت إلى الأداة الموحدة:
+    python -m handspeak tune-cascade --dense arabic_sign_dense.tflite --lstm arabic_sign_lstm.tflite
+
+هذا الملف للتوافق مع الأوامر القديمة فقط.
+"""
+
+import sys
+
+from handspeak.cli import main
+
+if __name__ == "__main__":
+    sys.exit(main(["tune-cascade", *sys.argv[1:]]))